@@ -185,8 +185,10 @@ class AccountPublisher:
                     positions, err = self.driver.get_position(keep_origin=False)
                     
                     if not err and positions:
-                        # 发布所有持仓
+                        # 发布所有持仓（逐个持仓 + 汇总信息合并为一次批量发布）
                         if isinstance(positions, list):
+                            now = time.time()
+                            batch = []
                             for pos in positions:
                                 symbol = pos.get('symbol')
                                 if symbol:
@@ -194,20 +196,21 @@ class AccountPublisher:
                                     data = {
                                         'account_id': self.account_id,
                                         'position': pos,
-                                        'timestamp': time.time(),
-                                        'ts_ms': int(time.time() * 1000)
+                                        'timestamp': now,
+                                        'ts_ms': int(now * 1000)
                                     }
-                                    self.event_bus.publish(topic, data)
-                                    self._stats['position_published'] += 1
+                                    batch.append((topic, data))
                             
                             # 也发布汇总信息
-                            self.event_bus.publish('account.position.all', {
+                            batch.append(('account.position.all', {
                                 'account_id': self.account_id,
                                 'positions': positions,
                                 'count': len(positions),
-                                'timestamp': time.time(),
-                                'ts_ms': int(time.time() * 1000)
-                            })
+                                'timestamp': now,
+                                'ts_ms': int(now * 1000)
+                            }))
+                            self.event_bus.publish_many(batch)
+                            self._stats['position_published'] += len(batch) - 1
                             
                             # 如果没有指定交易对列表，从持仓中获取用于订单监控
                             if self.symbols is None:
@@ -257,29 +260,33 @@ class AccountPublisher:
                         orders, err = self.driver.get_open_orders(symbol=symbol, keep_origin=False)
                         
                         if not err and orders:
+                            # 逐个订单 + 订单列表合并为一次批量发布
+                            now = time.time()
+                            batch = []
                             if isinstance(orders, list):
+                                topic = f"account.order.{symbol}"
                                 for order in orders:
                                     order_id = order.get('orderId')
                                     if order_id:
-                                        topic = f"account.order.{symbol}"
                                         data = {
                                             'account_id': self.account_id,
                                             'order': order,
-                                            'timestamp': time.time(),
-                                            'ts_ms': int(time.time() * 1000)
+                                            'timestamp': now,
+                                            'ts_ms': int(now * 1000)
                                         }
-                                        self.event_bus.publish(topic, data)
-                                        self._stats['order_published'] += 1
+                                        batch.append((topic, data))
+                                self._stats['order_published'] += len(batch)
                             
                             # 发布订单列表
-                            self.event_bus.publish(f"account.order.{symbol}.list", {
+                            batch.append((f"account.order.{symbol}.list", {
                                 'account_id': self.account_id,
                                 'symbol': symbol,
                                 'orders': orders if isinstance(orders, list) else [orders],
                                 'count': len(orders) if isinstance(orders, list) else 1,
-                                'timestamp': time.time(),
-                                'ts_ms': int(time.time() * 1000)
-                            })
+                                'timestamp': now,
+                                'ts_ms': int(now * 1000)
+                            }))
+                            self.event_bus.publish_many(batch)
                             
                             self._last_update[f'order_{symbol}'] = time.time()
                     
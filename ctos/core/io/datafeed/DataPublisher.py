@@ -142,6 +142,8 @@ class DataPublisher:
         """价格数据发布循环"""
         while self._running:
             try:
+                # 收集本轮所有交易对的价格快照，最后一次性批量发布
+                ticks = []
                 for symbol in self.symbols:
                     if not self._running:
                         break
@@ -156,9 +158,7 @@ class DataPublisher:
                             'ts_ms': int(time.time() * 1000)
                         }
                         
-                        topic = f"market.price.{symbol}"
-                        self.event_bus.publish(topic, data)
-                        self._stats['price_published'] += 1
+                        ticks.append((f"market.price.{symbol}", data))
                         self._last_update[f'price_{symbol}'] = time.time()
                         
                     except Exception as e:
@@ -167,6 +167,10 @@ class DataPublisher:
                     # 短暂延迟，避免请求过快
                     time.sleep(0.1)
                 
+                if ticks:
+                    self.event_bus.publish_many(ticks)
+                    self._stats['price_published'] += len(ticks)
+                
                 time.sleep(self.intervals['price'])
                 
             except Exception as e:
@@ -714,9 +714,26 @@ if __name__ == '__main__':
     
     from ctos.core.io.datafeed.DataPublisher import DataPublisher
     from ctos.core.kernel.event_bus import get_event_bus
+    from concurrent.futures import TimeoutError as FutureTimeoutError
     
     bus = get_event_bus()
     
+    # 处理器输出经队列交给后台线程写 stdout，避免阻塞事件分发
+    import sys
+    import queue
+    import logging
+    from logging.handlers import QueueHandler, QueueListener
+    
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    log_listener = QueueListener(log_queue, stream_handler)
+    factor_log = logging.getLogger('ctos.datafeed.indicator_example')
+    factor_log.setLevel(logging.INFO)
+    factor_log.addHandler(QueueHandler(log_queue))
+    factor_log.propagate = False
+    log_listener.start()
+    
     # 创建指标计算器（事件总线模式）
     indicator_calc = IndicatorCalculator(enable_event_bus=True)
     
@@ -756,39 +773,24 @@ if __name__ == '__main__':
         # 方式2: 异步请求（通过事件总线）
         print("=== 方式2: 异步请求（通过事件总线） ===\n")
         
-        request_id = str(uuid.uuid4())
-        response_topic = f'factor.response.{request_id}'
-        
-        # 订阅响应
-        response_received = threading.Event()
-        response_data = {}
-        
-        def response_handler(topic, message, event):
-            if message.get('request_id') == request_id:
-                response_data.update(message)
-                response_received.set()
-                print(f"✓ 收到响应: {message.get('success')}")
-                if message.get('success'):
-                    factors = message.get('data', {})
-                    print(f"  价格: ${factors.get('price', 0):.2f}, RSI: {factors.get('rsi_14', 0):.2f}")
-        
-        bus.subscribe(response_topic, response_handler)
-        
-        # 发送请求
-        bus.publish('factor.request', {
+        # 发送请求：响应由总线按 request_id 分发到返回的 Future，无需为每个请求单独订阅
+        future = bus.request('factor.request', {
             'symbol': 'BTC-USDT-SWAP',
             'timeframe': '1m',
-            'request_id': request_id,
-            'response_topic': response_topic,
             'min_data_points': 30,
             'timeout': 30.0
-        })
+        }, timeout=35.0)
         
         # 等待响应
-        if response_received.wait(timeout=35.0):
-            if not response_data.get('success'):
+        try:
+            response_data = future.result(timeout=35.0)
+            print(f"✓ 收到响应: {response_data.get('success')}")
+            if response_data.get('success'):
+                factors = response_data.get('data', {})
+                print(f"  价格: ${factors.get('price', 0):.2f}, RSI: {factors.get('rsi_14', 0):.2f}")
+            else:
                 print(f"✗ 请求失败: {response_data.get('error')}")
-        else:
+        except FutureTimeoutError:
             print("✗ 等待响应超时")
         
         print("\n" + "="*50 + "\n")
@@ -797,11 +799,9 @@ if __name__ == '__main__':
         print("=== 方式3: 持续订阅模式 ===\n")
         
         def factor_handler(topic, message, event):
-            symbol = message.get('symbol')
-            tf = message.get('timeframe')
-            price = message.get('price')
-            rsi = message.get('rsi_14')
-            print(f"[自动发布] {symbol} {tf}: 价格=${price:.2f}, RSI={rsi:.2f}")
+            factor_log.info("[自动发布] %s %s: 价格=$%.2f, RSI=%.2f",
+                            message.get('symbol'), message.get('timeframe'),
+                            message.get('price'), message.get('rsi_14'))
         
         bus.subscribe('factor.indicators.*', factor_handler, wildcard=True)
         
@@ -818,4 +818,5 @@ if __name__ == '__main__':
         print("\n正在停止...")
     finally:
         publisher.stop()
-        bus.stop()
\ No newline at end of file
+        bus.stop()
+        log_listener.stop()
\ No newline at end of file
@@ -8,6 +8,9 @@ DataPublisher 使用示例
 import time
 import sys
 import os
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
 
 # 添加项目路径
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..')))
@@ -17,6 +20,27 @@ from ctos.core.io.datafeed.DataPublisher import DataPublisher
 from ctos.core.io.datafeed.AccountPublisher import AccountPublisher
 
 
+def _make_queue_logger(name='ctos.datafeed.example'):
+    """
+    创建经由队列输出的 logger：处理器只做 put_nowait，
+    stdout 写入由 QueueListener 后台线程完成，不阻塞 EventBus 分发线程
+    """
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = QueueListener(log_queue, stream_handler)
+    
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+    listener.start()
+    return logger, listener
+
+
+log, _log_listener = _make_queue_logger()
+
+
 def example_basic_usage():
     """基础使用示例 - 市场数据和账户数据分离"""
     print("=== 示例 1: 基础使用（市场数据 + 账户数据） ===\n")
@@ -29,7 +53,7 @@ def example_basic_usage():
         symbol = message.get('symbol')
         price = message.get('price')
         ts = event.get('timestamp', 0)
-        print(f"[{time.strftime('%H:%M:%S', time.localtime(ts))}] 价格: {symbol} = ${price:.2f}")
+        log.info("[%s] 价格: %s = $%.2f", time.strftime('%H:%M:%S', time.localtime(ts)), symbol, price)
     
     def position_handler(topic, message, event):
         pos = message.get('position', {})
@@ -37,7 +61,7 @@ def example_basic_usage():
         side = pos.get('side', 'N/A')
         qty = pos.get('quantity', 0)
         if qty > 0:
-            print(f"[持仓] {symbol}: {side} {qty:.4f}")
+            log.info("[持仓] %s: %s %.4f", symbol, side, qty)
     
     # 3. 订阅事件
     bus.subscribe('market.price.ETH-USDT-SWAP', price_handler)
@@ -93,34 +117,44 @@ def example_factor_calculator():
     print("\n=== 示例 2: 因子计算器 ===\n")
     
     from collections import defaultdict
+    import numpy as np
     
     bus = get_event_bus()
     
     class MomentumCalculator:
+        BUF_SIZE = 256  # 每个交易对的环形缓冲区长度
+        WINDOW = 20     # 动量/均线窗口
+        
         def __init__(self):
-            self.price_history = defaultdict(list)
+            # 每个交易对预分配一段连续的 float64 环形缓冲区，指标直接用 NumPy 在切片上计算
+            self.buf = defaultdict(lambda: np.zeros(self.BUF_SIZE, dtype=np.float64))
+            self.head = defaultdict(int)
             bus.subscribe('market.price.*', self.on_price, wildcard=True)
         
+        def window(self, symbol, n):
+            """按时间顺序返回最近 n 个价格"""
+            head = self.head[symbol]
+            return np.take(self.buf[symbol], np.arange(head - n, head) % self.BUF_SIZE)
+        
         def on_price(self, topic, message, event):
             symbol = message.get('symbol')
             price = message.get('price')
             
             # 记录价格历史
-            self.price_history[symbol].append(price)
-            
-            # 保持最近50个价格点
-            if len(self.price_history[symbol]) > 50:
-                self.price_history[symbol].pop(0)
+            head = self.head[symbol]
+            self.buf[symbol][head % self.BUF_SIZE] = price
+            self.head[symbol] = head + 1
             
             # 计算动量因子（需要至少20个数据点）
-            if len(self.price_history[symbol]) >= 20:
-                prices = self.price_history[symbol][-20:]
-                momentum = (prices[-1] - prices[0]) / prices[0] if prices[0] > 0 else 0
+            if head + 1 >= self.WINDOW:
+                prices = self.window(symbol, self.WINDOW)
+                momentum = prices[-1] / prices[0] - 1 if prices[0] > 0 else 0.0
                 
                 # 发布因子
                 bus.publish(f'factor.momentum.{symbol}', {
                     'symbol': symbol,
-                    'momentum': momentum,
+                    'momentum': float(momentum),
+                    'ma20': float(prices.mean()),
                     'signal': 'buy' if momentum > 0.02 else ('sell' if momentum < -0.02 else 'hold'),
                     'current_price': price
                 })
@@ -129,7 +163,7 @@ def example_factor_calculator():
         symbol = message['symbol']
         momentum = message['momentum']
         signal = message['signal']
-        print(f"[因子] {symbol}: 动量={momentum:.4f} -> 信号={signal}")
+        log.info("[因子] %s: 动量=%.4f -> 信号=%s", symbol, momentum, signal)
     
     # 创建因子计算器
     calc = MomentumCalculator()
@@ -175,7 +209,7 @@ def example_reactive_trading():
             
             # 只打印，不实际交易（示例）
             if signal in ['buy', 'sell']:
-                print(f"[交易信号] {symbol}: {signal.upper()} (动量={momentum:.4f})")
+                log.info("[交易信号] %s: %s (动量=%.4f)", symbol, signal.upper(), momentum)
                 # 实际交易代码（注释掉，避免真实交易）
                 # if signal == 'buy' and momentum > 0.05:
                 #     order_id, err = self.driver.buy(symbol, size=0.1, order_type='market')
@@ -187,7 +221,7 @@ def example_reactive_trading():
                 #         })
         
         def on_trade_order(self, topic, message, event):
-            print(f"[交易订单] {topic}: {message}")
+            log.info("[交易订单] %s: %s", topic, message)
     
     def momentum_handler(topic, message, event):
         # 简化的动量计算（实际应该从因子计算器获取）
@@ -250,4 +284,6 @@ if __name__ == "__main__":
         print(f"\n错误: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        _log_listener.stop()
 
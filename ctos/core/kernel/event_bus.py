@@ -4,15 +4,95 @@
 可扩展的事件总线系统，支持发布/订阅模式。
 用于实时市场数据、账户数据、因子分发、交易响应等场景。
 """
+import os
+import sys
 import threading
 import time
 import inspect
-from collections import defaultdict
-from typing import Callable, Dict, List, Any, Optional
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Any, Optional, Tuple
 import queue
 import json
 
 
+# 主题驻留缓存的上限，超过后整体清空，避免一次性主题（如带 request_id 的响应主题）无限增长
+_TOPIC_CACHE_LIMIT = 4096
+_WILDCARD = sys.intern('*')
+# 请求/响应默认的响应主题前缀，与 IndicatorCalculator 的 factor.response.{request_id} 约定一致
+_DEFAULT_RESPONSE_PREFIX = 'factor.response'
+# 清理超时请求的最小间隔（秒）
+_PENDING_SWEEP_INTERVAL = 1.0
+
+
+class Event(dict):
+    """
+    事件对象（dict 子类），键: topic / message / ts_ns。
+    
+    只记录一次纳秒时间戳，timestamp（秒）与 ts_ms（毫秒）在读取时才换算；
+    event['timestamp']、event.get('timestamp') 和 event.timestamp 均可使用，
+    但换算字段不会出现在 keys()/items() 中，需要完整字典时请调用 persist()。
+    """
+    __slots__ = ()
+    
+    def __missing__(self, key):
+        if key == 'timestamp':
+            return self['ts_ns'] / 1e9
+        if key == 'ts_ms':
+            return self['ts_ns'] // 1_000_000
+        raise KeyError(key)
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    @property
+    def timestamp(self) -> float:
+        return self['ts_ns'] / 1e9
+    
+    @property
+    def ts_ms(self) -> int:
+        return self['ts_ns'] // 1_000_000
+    
+    def persist(self) -> Dict:
+        """复制为普通字典（包含 timestamp / ts_ms），可在处理器返回后继续持有"""
+        data = dict(self)
+        data['timestamp'] = self.timestamp
+        data['ts_ms'] = self.ts_ms
+        return data
+
+
+# 编译后的通配符模式: (分段数, ((下标, 非通配分段), ...))
+CompiledPattern = Tuple[int, Tuple[Tuple[int, str], ...]]
+
+
+def split_topic(topic: str) -> Tuple[str, ...]:
+    """把主题切分为驻留后的分段元组"""
+    return tuple([sys.intern(p) for p in topic.split('.')])
+
+
+def compile_pattern(pattern_parts: Tuple[str, ...]) -> CompiledPattern:
+    """预先挑出模式中的非通配分段，匹配时只需比较这些位置"""
+    return len(pattern_parts), tuple((i, p) for i, p in enumerate(pattern_parts) if p is not _WILDCARD)
+
+
+def match_wildcard(pattern: CompiledPattern, topic_parts: Tuple[str, ...]) -> bool:
+    """
+    通配符匹配，如 'market.*' / 'market.price.*'。
+    两侧分段均已驻留，相等的字符串必为同一对象，因此只做身份比较。
+    """
+    size, literals = pattern
+    if len(topic_parts) != size:
+        return False
+    for i, p in literals:
+        if topic_parts[i] is not p:
+            return False
+    return True
+
+
 class EventBus:
     """
     事件总线 - 支持同步和异步事件分发
@@ -29,33 +109,70 @@ class EventBus:
     - trade.order.{action}           - 交易操作响应
     - system.error                   - 系统错误
     - system.status                  - 系统状态
+    
+    异步模式下处理器在线程池中执行，同一主题的事件按发布顺序串行处理，
+    不同主题之间互不阻塞；订阅时指定 sync_dispatch=True 的轻量处理器
+    直接在工作线程内执行。发布时没有任何订阅者的主题直接丢弃（计入
+    dropped_cold），之后才订阅的处理器不会收到此前的事件。
+    
+    注意: 传给处理器的 Event 会在分发完成后回收复用，处理器不应在回调
+    之外持有它；如需保留，请使用 event.persist() 复制一份。
     """
     
-    def __init__(self, async_mode=True, max_queue_size=1000):
+    def __init__(self, async_mode=True, max_queue_size=1000, batch_size=64, event_pool_size=1024,
+                 dispatch_workers=None):
         """
         初始化事件总线
         
         :param async_mode: 是否启用异步模式（使用后台线程处理）
         :param max_queue_size: 异步队列最大大小
+        :param batch_size: 工作线程每次最多批量取出的事件数
+        :param event_pool_size: 可复用 event 字典的空闲池大小
+        :param dispatch_workers: 处理器线程池大小，默认 min(32, CPU数 * 4)
         """
-        self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
-        self._wildcard_subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        # 订阅表的值为不可变的 (handler, wants_event, sync_dispatch) 元组序列，
+        # 订阅变更时整体替换（写时复制），分发时无需加锁或拷贝即可遍历；
+        # wants_event 在订阅时根据处理器签名计算一次
+        self._subscribers: Dict[str, Tuple[Tuple[Callable, bool, bool], ...]] = {}
+        self._wildcard_subscribers: Dict[str, Tuple[Tuple[Callable, bool, bool], ...]] = {}
+        # 主题字符串驻留及其 split('.') 结果缓存，通配符比较可先走对象身份判断
+        self._topic_intern: Dict[str, str] = {}
+        self._topic_parts: Dict[str, Tuple[str, ...]] = {}
+        # 通配符路由表 ((compiled_pattern, entries), ...)，订阅变更时重建；
+        # 没有通配符订阅时 _resolve_handlers 切换为只查精确匹配的版本
+        self._wildcard_routes: Tuple[Tuple[CompiledPattern, Tuple[Tuple[Callable, bool, bool], ...]], ...] = ()
+        self._resolve_handlers = self._resolve_exact_only
         self._lock = threading.RLock()
         self._async_mode = async_mode
         self._queue = queue.Queue(maxsize=max_queue_size) if async_mode else None
+        self._batch_size = max(1, int(batch_size))
+        self._event_pool = deque(maxlen=event_pool_size)
         self._worker_thread = None
         self._running = False
-        self._stats = {
-            'published': 0,
-            'delivered': 0,
-            'dropped': 0,
-            'errors': 0
-        }
+        self._dispatch_workers = dispatch_workers or min(32, (os.cpu_count() or 4) * 4)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 每个主题待执行的分发任务，存在即表示该主题已有任务在线程池中排空
+        self._topic_serial: Dict[str, deque] = {}
+        self._serial_lock = threading.Lock()
+        # 请求/响应: request_id -> (future, deadline)；超时请求由工作线程定期清理
+        self._pending: Dict[str, Tuple[Future, Optional[float]]] = {}
+        self._pending_lock = threading.Lock()
+        # 已注册的响应主题前缀（含结尾的 '.'），按前缀直接路由到 _on_response，
+        # 不占用通配符订阅，精确匹配的快速路径不受影响；注册时整体替换
+        self._response_prefixes: Tuple[str, ...] = ()
+        self._response_entry = (self._on_response, False, True)
+        self._last_pending_sweep = 0.0
+        # 统计计数器：普通 int，在独立的 _stats_lock 下累加，多线程下不会丢失计数，
+        # 也不与订阅/路由共用 self._lock；批量路径先在本地累计，每批只加锁一次
+        self._stats_lock = threading.Lock()
+        self.clear_stats()
     
     def start(self):
         """启动异步处理线程"""
         if self._async_mode and not self._running:
             self._running = True
+            self._executor = ThreadPoolExecutor(max_workers=self._dispatch_workers,
+                                                thread_name_prefix='EventBusDispatch')
             self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
             self._worker_thread.start()
             print("✓ EventBus 异步工作线程已启动")
@@ -68,23 +185,44 @@ class EventBus:
                 self._queue.put(None)  # 发送停止信号
             if self._worker_thread:
                 self._worker_thread.join(timeout=2)
+            if self._executor:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            with self._serial_lock:
+                self._topic_serial = {}
             print("✓ EventBus 已停止")
     
-    def subscribe(self, topic: str, handler: Callable, wildcard: bool = False):
+    def subscribe(self, topic: str, handler: Callable, wildcard: bool = False, sync_dispatch: bool = False):
         """
         订阅主题
         
         :param topic: 主题名称，支持通配符如 'market.*' 或 'market.price.*'
         :param handler: 回调函数 handler(topic, message)
         :param wildcard: 是否启用通配符匹配（实验性功能）
+        :param sync_dispatch: 是否在工作线程内直接执行（适合耗时极短的处理器）
         """
+        topic = self._intern_topic(topic)
+        entry = (handler, self._wants_event(handler), sync_dispatch)
         with self._lock:
             if wildcard or '*' in topic:
-                self._wildcard_subscribers[topic].append(handler)
+                self._wildcard_subscribers[topic] = self._wildcard_subscribers.get(topic, ()) + (entry,)
             else:
-                self._subscribers[topic].append(handler)
+                self._subscribers[topic] = self._subscribers.get(topic, ()) + (entry,)
+            self._rebuild_routes()
         print(f"✓ 已订阅主题: {topic}")
     
+    @staticmethod
+    def _wants_event(handler: Callable) -> bool:
+        """
+        判断处理器是否需要 event 参数：
+        - handler(topic, message)         -> False
+        - handler(topic, message, event)  -> True（其他签名也按此方式调用）
+        """
+        try:
+            return len(inspect.signature(handler).parameters) != 2
+        except (TypeError, ValueError):
+            return True
+    
     def unsubscribe(self, topic: str, handler: Callable = None):
         """
         取消订阅
@@ -99,16 +237,14 @@ class EventBus:
                 if topic in self._wildcard_subscribers:
                     del self._wildcard_subscribers[topic]
             else:
-                if topic in self._subscribers:
-                    try:
-                        self._subscribers[topic].remove(handler)
-                    except ValueError:
-                        pass
-                if topic in self._wildcard_subscribers:
-                    try:
-                        self._wildcard_subscribers[topic].remove(handler)
-                    except ValueError:
-                        pass
+                for table in (self._subscribers, self._wildcard_subscribers):
+                    if topic in table:
+                        remaining = tuple(e for e in table[topic] if e[0] != handler)
+                        if remaining:
+                            table[topic] = remaining
+                        else:
+                            del table[topic]
+            self._rebuild_routes()
     
     def publish(self, topic: str, message: Any, sync: bool = False):
         """
@@ -118,107 +254,373 @@ class EventBus:
         :param message: 消息内容（可以是字典、字符串等）
         :param sync: 是否同步发布（立即处理，不使用队列）
         """
-        self._stats['published'] += 1
+        topic = self._intern_topic(topic)
         
-        # 添加元数据
-        event = {
-            'topic': topic,
-            'message': message,
-            'timestamp': time.time(),
-            'ts_ms': int(time.time() * 1000)
-        }
+        # 冷主题（无人订阅）直接返回，不构造 event 也不入队
+        if not self._has_handlers(topic):
+            with self._stats_lock:
+                self._stats['published'] += 1
+                self._stats['dropped_cold'] += 1
+            return
+        with self._stats_lock:
+            self._stats['published'] += 1
         
         if sync or not self._async_mode:
-            self._deliver(topic, event)
+            self._deliver(topic, message)
         else:
+            # 添加元数据
+            event = self._acquire_event(topic, message, time.time_ns())
             try:
                 self._queue.put_nowait(event)
             except queue.Full:
-                self._stats['dropped'] += 1
+                self._count('dropped')
+                self._release_event(event)
                 print(f"⚠ 事件队列已满，丢弃事件: {topic}")
     
+    def publish_many(self, events: Iterable[Tuple[str, Any]], sync: bool = False):
+        """
+        批量发布事件，适合一次产出多个交易对数据的发布器
+        
+        整批共用一个时间戳；异步模式下整批作为一个队列元素入队，
+        只占用一个队列位置，队列满时整批丢弃。
+        
+        :param events: (topic, message) 序列
+        :param sync: 是否同步发布（立即处理，不使用队列）
+        """
+        if sync or not self._async_mode:
+            for topic, message in events:
+                self.publish(topic, message, sync=True)
+            return
+        
+        ts_ns = time.time_ns()
+        batch = []
+        cold = 0
+        for topic, message in events:
+            topic = self._intern_topic(topic)
+            if not self._has_handlers(topic):
+                cold += 1
+                continue
+            batch.append(self._acquire_event(topic, message, ts_ns))
+        with self._stats_lock:
+            self._stats['published'] += len(batch) + cold
+            self._stats['dropped_cold'] += cold
+        if not batch:
+            return
+        
+        try:
+            self._queue.put_nowait(batch)
+        except queue.Full:
+            self._count('dropped', n=len(batch))
+            for event in batch:
+                self._release_event(event)
+            print(f"⚠ 事件队列已满，丢弃 {len(batch)} 个批量事件")
+    
+    def request(self, topic: str, message: Dict, timeout: Optional[float] = None,
+                response_prefix: str = _DEFAULT_RESPONSE_PREFIX) -> Future:
+        """
+        发送请求并返回 Future，响应到达 {response_prefix}.{request_id} 时完成
+        
+        总线按响应前缀直接路由响应主题，按 request_id 查表完成对应的 Future，
+        不再为每个请求单独订阅/取消订阅。用法: bus.request(...).result(timeout)
+        
+        :param topic: 请求主题，如 'factor.request'
+        :param message: 请求内容（字典），未提供 request_id 时自动生成
+        :param timeout: 超时时间（秒），超时后 Future 以 TimeoutError 结束并移出等待表
+                        （工作线程每 _PENDING_SWEEP_INTERVAL 秒清理一次；工作线程未运行时由定时器清理）
+        :param response_prefix: 响应主题前缀
+        :return: concurrent.futures.Future，结果为响应消息
+        """
+        request_id = message.get('request_id') or str(uuid.uuid4())
+        message = dict(message, request_id=request_id,
+                       response_topic=f'{response_prefix}.{request_id}')
+        
+        self._ensure_response_route(response_prefix)
+        future = Future()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._pending_lock:
+            self._pending[request_id] = (future, deadline)
+        # 请求方取消或结果已设置时，从等待表中移除
+        future.add_done_callback(lambda _f: self._discard_pending(request_id, _f))
+        if timeout is not None and not self._running:
+            # 没有工作线程定期清理（同步模式或尚未 start），由一次性定时器负责超时
+            timer = threading.Timer(timeout, self._expire_pending, (request_id, future))
+            timer.daemon = True
+            timer.start()
+        
+        self.publish(topic, message)
+        return future
+    
+    def _ensure_response_route(self, response_prefix: str):
+        """注册响应前缀：以该前缀开头的主题直接交给 _on_response 处理"""
+        prefix = f'{response_prefix}.'
+        if prefix in self._response_prefixes:
+            return
+        with self._lock:
+            if prefix not in self._response_prefixes:
+                self._response_prefixes = self._response_prefixes + (prefix,)
+    
+    def _response_handlers(self, topic: str) -> Tuple[Tuple[Callable, bool, bool], ...]:
+        """主题属于已注册的响应前缀时返回响应分发处理器"""
+        prefixes = self._response_prefixes
+        if prefixes and topic.startswith(prefixes):
+            return (self._response_entry,)
+        return ()
+    
+    def _on_response(self, topic: str, message: Any):
+        """响应分发：按 request_id 查表完成对应的 Future"""
+        request_id = message.get('request_id') if isinstance(message, dict) else None
+        if request_id is None:
+            request_id = topic.rsplit('.', 1)[-1]
+        with self._pending_lock:
+            pending = self._pending.pop(request_id, None)
+        if pending is not None and not pending[0].done():
+            pending[0].set_result(message)
+    
+    def _discard_pending(self, request_id: str, future: Future):
+        """Future 结束后移出等待表（仅当表中仍是同一个 Future）"""
+        with self._pending_lock:
+            pending = self._pending.get(request_id)
+            if pending is not None and pending[0] is future:
+                del self._pending[request_id]
+    
+    def _expire_pending(self, request_id: str, future: Future):
+        """定时器回调：请求仍未完成时以 TimeoutError 结束"""
+        self._discard_pending(request_id, future)
+        if not future.done():
+            future.set_exception(FutureTimeoutError(f'请求超时: {request_id}'))
+    
+    def _sweep_pending(self):
+        """清理已超时的请求，最多每 _PENDING_SWEEP_INTERVAL 秒扫描一次（由工作线程调用）"""
+        if not self._pending:
+            return
+        now = time.monotonic()
+        if now - self._last_pending_sweep < _PENDING_SWEEP_INTERVAL:
+            return
+        self._last_pending_sweep = now
+        with self._pending_lock:
+            expired = [(rid, f) for rid, (f, deadline) in self._pending.items()
+                       if deadline is not None and deadline <= now]
+            for rid, _ in expired:
+                del self._pending[rid]
+        for rid, future in expired:
+            if not future.done():
+                future.set_exception(FutureTimeoutError(f'请求超时: {rid}'))
+    
+    def _intern_topic(self, topic: str) -> str:
+        """返回驻留后的主题字符串，并缓存其分段元组"""
+        interned = self._topic_intern.get(topic)
+        if interned is not None:
+            return interned
+        if len(self._topic_intern) >= _TOPIC_CACHE_LIMIT:
+            self._topic_intern.clear()
+            self._topic_parts.clear()
+        interned = sys.intern(topic)
+        self._topic_parts[interned] = split_topic(interned)
+        self._topic_intern[interned] = interned
+        return interned
+    
+    def _split_topic(self, topic: str) -> Tuple[str, ...]:
+        """获取主题的分段元组（优先使用缓存）"""
+        parts = self._topic_parts.get(topic)
+        if parts is None:
+            # 缓存可能刚被清空，这里直接切分而不依赖再次查表
+            self._intern_topic(topic)
+            parts = split_topic(topic)
+        return parts
+    
+    def _acquire_event(self, topic: str, message: Any, ts_ns: int) -> Event:
+        """从空闲池取出一个 Event 并填充，池为空时新建"""
+        try:
+            event = self._event_pool.popleft()
+        except IndexError:
+            return Event(topic=topic, message=message, ts_ns=ts_ns)
+        event['topic'] = topic
+        event['message'] = message
+        event['ts_ns'] = ts_ns
+        return event
+    
+    def _release_event(self, event: Dict):
+        """分发完成后清除引用并归还 event 字典"""
+        event['message'] = None
+        if len(self._event_pool) < self._event_pool.maxlen:
+            self._event_pool.append(event)
+    
+    @staticmethod
+    def persist_event(event: Event) -> Dict:
+        """复制 event，供需要在处理器返回后继续持有事件的场景使用"""
+        return event.persist()
+    
     def _worker_loop(self):
-        """异步工作线程循环"""
+        """异步工作线程循环：每次取出一批事件统一分发，摊薄单事件的固定开销"""
         while self._running:
+            self._sweep_pending()
             try:
-                event = self._queue.get(timeout=1)
-                if event is None:  # 停止信号
-                    break
-                self._deliver(event['topic'], event)
+                item = self._queue.get(timeout=_PENDING_SWEEP_INTERVAL)
             except queue.Empty:
                 continue
+            if item is None:  # 停止信号
+                break
+            
+            # 非阻塞地继续取出队列中已积压的事件，凑成一批；
+            # 队列元素可能是单个 Event，也可能是 publish_many 入队的 Event 列表
+            batch = item if isinstance(item, list) else [item]
+            stop = False
+            for _ in range(self._batch_size - 1):
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                if isinstance(item, list):
+                    batch.extend(item)
+                else:
+                    batch.append(item)
+            
+            try:
+                self._deliver_batch(batch)
             except Exception as e:
-                self._stats['errors'] += 1
+                self._count('errors')
                 print(f"✗ EventBus 处理错误: {e}")
+            if stop:
+                break
     
-    def _deliver(self, topic: str, event: Dict):
-        """分发事件到所有订阅者"""
-        handlers = []
+    def _deliver_batch(self, events: List[Dict]):
+        """批量分发事件：按主题预先解析处理器，同一批内每个主题只解析一次"""
+        handlers_by_topic = {}
+        for event in events:
+            topic = event['topic']
+            if topic not in handlers_by_topic:
+                entries = self._resolve_handlers(topic)
+                handlers_by_topic[topic] = (
+                    [(h, wants_event) for h, wants_event, inline in entries if inline],
+                    [(h, wants_event) for h, wants_event, inline in entries if not inline],
+                )
         
-        with self._lock:
-            # 精确匹配
-            handlers.extend(self._subscribers.get(topic, []))
-            
-            # 通配符匹配
-            topic_parts = topic.split('.')
-            for pattern, pattern_handlers in self._wildcard_subscribers.items():
-                if self._match_wildcard(pattern, topic):
-                    handlers.extend(pattern_handlers)
-        
-        # 执行处理器
-        for handler in handlers:
+        # 按发布顺序执行：轻量处理器直接执行，其余提交到线程池并按主题保序
+        for event in events:
+            topic = event['topic']
+            inline, pooled = handlers_by_topic[topic]
+            if inline:
+                self._invoke_handlers(topic, event['message'], event, inline)
+            if pooled:
+                self._submit_ordered(topic, event, pooled)
+            else:
+                self._release_event(event)
+    
+    def _submit_ordered(self, topic: str, event: Event, handlers: List[Tuple[Callable, bool]]):
+        """把主题的分发任务排入线程池，同一主题的任务按提交顺序执行"""
+        job = (event, handlers)
+        with self._serial_lock:
+            pending = self._topic_serial.get(topic)
+            if pending is not None:
+                pending.append(job)
+                return
+            self._topic_serial[topic] = deque([job])
+        self._executor.submit(self._drain_topic, topic)
+    
+    def _drain_topic(self, topic: str):
+        """线程池任务：依次执行某主题积压的分发任务，直到队列为空"""
+        while True:
+            with self._serial_lock:
+                pending = self._topic_serial.get(topic)
+                if not pending:
+                    self._topic_serial.pop(topic, None)
+                    return
+                event, handlers = pending.popleft()
+            self._invoke_handlers(topic, event['message'], event, handlers)
+            self._release_event(event)
+    
+    def _deliver(self, topic: str, message: Any):
+        """同步分发事件到所有订阅者；没有处理器需要 event 参数时不构造 Event"""
+        handlers = [(h, wants_event) for h, wants_event, _ in self._resolve_handlers(topic)]
+        if not any(wants_event for _, wants_event in handlers):
+            self._invoke_handlers(topic, message, None, handlers)
+            return
+        event = self._acquire_event(topic, message, time.time_ns())
+        self._invoke_handlers(topic, message, event, handlers)
+        self._release_event(event)
+    
+    def _rebuild_routes(self):
+        """订阅变更后重建通配符路由表，并切换解析函数（调用方需持有 self._lock）"""
+        self._wildcard_routes = tuple(
+            (compile_pattern(split_topic(pattern)), tuple(entries))
+            for pattern, entries in self._wildcard_subscribers.items()
+        )
+        if self._wildcard_routes:
+            self._resolve_handlers = self._resolve_with_wildcards
+        else:
+            self._resolve_handlers = self._resolve_exact_only
+    
+    # 以下解析函数只读取不可变的元组快照，无需持有 self._lock
+    
+    def _has_handlers(self, topic: str) -> bool:
+        """主题当前是否有订阅者（精确匹配查字典，通配符命中第一条即返回）"""
+        if topic in self._subscribers or self._response_handlers(topic):
+            return True
+        routes = self._wildcard_routes
+        if not routes:
+            return False
+        topic_parts = self._split_topic(topic)
+        for pattern, _ in routes:
+            if match_wildcard(pattern, topic_parts):
+                return True
+        return False
+    
+    def _resolve_exact_only(self, topic: str) -> Tuple[Tuple[Callable, bool, bool], ...]:
+        """解析主题对应的 (handler, wants_event, sync_dispatch) 序列，仅精确匹配（无通配符订阅时使用）"""
+        return self._subscribers.get(topic, ()) + self._response_handlers(topic)
+    
+    def _resolve_with_wildcards(self, topic: str) -> Tuple[Tuple[Callable, bool, bool], ...]:
+        """解析主题对应的 (handler, wants_event, sync_dispatch) 序列，包含通配符匹配"""
+        # 精确匹配
+        handlers = self._subscribers.get(topic, ()) + self._response_handlers(topic)
+        
+        # 通配符匹配
+        topic_parts = self._split_topic(topic)
+        for pattern, entries in self._wildcard_routes:
+            if match_wildcard(pattern, topic_parts):
+                handlers += entries
+        return handlers
+    
+    def _invoke_handlers(self, topic: str, message: Any, event: Optional[Event],
+                         handlers: List[Tuple[Callable, bool]]):
+        """执行处理器，按订阅时缓存的签名决定是否传入 event"""
+        errors = 0
+        for handler, wants_event in handlers:
             try:
-                # 支持不同的处理器签名：
-                # - handler(topic, message)
-                # - handler(topic, message, event)
-                sig = inspect.signature(handler)
-                param_count = len(sig.parameters)
-                
-                if param_count >= 3:
-                    # 支持接收 event 参数的处理器
-                    handler(topic, event['message'], event)
-                elif param_count == 2:
-                    # 只接收 topic 和 message 的处理器
-                    handler(topic, event['message'])
+                if wants_event:
+                    handler(topic, message, event)
                 else:
-                    # 兼容其他可能的签名
-                    handler(topic, event['message'], event)
-                
-                self._stats['delivered'] += 1
+                    handler(topic, message)
             except Exception as e:
-                self._stats['errors'] += 1
+                errors += 1
                 print(f"✗ 处理器执行错误 [{topic}]: {e}")
+        with self._stats_lock:
+            self._stats['delivered'] += len(handlers) - errors
+            self._stats['errors'] += errors
     
-    def _match_wildcard(self, pattern: str, topic: str) -> bool:
-        """通配符匹配（简单实现）"""
-        if pattern == topic:
-            return True
-        
-        # 支持 'market.*' 和 'market.price.*' 等
-        pattern_parts = pattern.split('.')
-        topic_parts = topic.split('.')
-        
-        if len(pattern_parts) != len(topic_parts):
-            return False
-        
-        for p, t in zip(pattern_parts, topic_parts):
-            if p == '*' or p == t:
-                continue
-            return False
-        return True
+    def _count(self, key: str, n: int = 1):
+        """在统计锁内累加一个计数（用于丢弃、错误等非热点路径）"""
+        with self._stats_lock:
+            self._stats[key] += n
     
     def get_stats(self) -> Dict:
         """获取统计信息"""
-        return self._stats.copy()
+        with self._stats_lock:
+            return self._stats.copy()
     
     def clear_stats(self):
         """清空统计信息"""
-        self._stats = {
-            'published': 0,
-            'delivered': 0,
-            'dropped': 0,
-            'errors': 0
-        }
+        with self._stats_lock:
+            self._stats = {
+                'published': 0,
+                'delivered': 0,
+                'dropped': 0,
+                'dropped_cold': 0,
+                'errors': 0
+            }
 
 
 # 全局单例（可选）
@@ -234,6 +636,11 @@ def get_event_bus(async_mode: bool = True) -> EventBus:
     return _global_event_bus
 
 
+def current_event_bus() -> Optional[EventBus]:
+    """返回已创建的全局事件总线，尚未创建时返回 None（不会因此创建并启动总线）"""
+    return _global_event_bus
+
+
 def reset_event_bus():
     """重置全局事件总线（主要用于测试）"""
     global _global_event_bus
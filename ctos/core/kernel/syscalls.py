@@ -4,6 +4,9 @@
 # No Protocol/dataclasses; plain base class with NotImplementedError.
 
 class TradingSyscalls(object):
+    # 不引入实例 __dict__，声明了 __slots__ 的驱动子类才真正省掉 __dict__
+    __slots__ = ()
+
     # ---- Ref-data / meta ----
     def symbols(self):
         """Return an iterable of unified symbols, e.g. ['BTC-USDT', 'ETH-USDT']"""
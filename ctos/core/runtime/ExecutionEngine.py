@@ -2,9 +2,15 @@ import sys
 import os
 import re
 import decimal
+import math
 import time 
+import asyncio
+import functools
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import multiprocessing
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
 
 # 动态添加bpx包路径到sys.path
 def _add_bpx_path():
@@ -31,6 +37,130 @@ from ctos.core.runtime.SystemMonitor import SystemMonitor
 from ctos.core.runtime.AccountManager import AccountManager, ExchangeType, get_account_manager
 import threading
 
+# 后台保活请求的间隔（秒），需小于交易所/负载均衡的空闲断开时间
+KEEPALIVE_INTERVAL = 20
+# 交易对限额信息（面值、精度、最小下单量）的缓存有效期（秒），这些数据最多每天变化一次
+LIMITS_CACHE_TTL = 86400
+# 订单追踪中最新价格的缓存有效期（秒），同一时刻多个追踪组查询同一交易对时共用报价
+PRICE_CACHE_TTL = 0.5
+# set_coin_position_to_target 攒批提交：支持批量下单的驱动每批最多的订单数（OKX 批量接口上限 20），
+# 不支持批量的驱动逐单提交
+ORDER_SUBMIT_CHUNK = 20
+# 同一轮对齐中已提交超过该数量的订单后，每批提交前等待 1 秒，避免触发交易所限频
+ORDER_THROTTLE_AFTER = 50
+# 限价单从计算价格到实际提交的最长等待时间（秒），超过则按最新价格重新定价
+ORDER_PRICE_MAX_AGE = 2.0
+# 不使用软下单（限价挂单追踪）的币种，始终按市价下单；预编译正则，币种名或完整交易对均可匹配
+_NO_SOFT_RE = re.compile(r'(?:xaut|trx)', re.IGNORECASE)
+
+
+# 下单数量按最小单位四舍五入为 0 时的最大放大倍数：原 round_like 循环最后一次重试把金额放大到 1.25**4，
+# 放大后四舍五入不为 0（即 raw * 倍数 > 最小单位 / 2）就下一个最小单位
+_MAX_ROUND_UP_RATIO = decimal.Decimal('2.44140625')
+
+
+# 驱动共享的连接池与保活线程的创建/释放锁
+_DRIVER_HTTP_LOCK = threading.Lock()
+
+
+def _make_http_session():
+    """创建带连接池的 requests.Session，连接保持 keep-alive 供所有请求复用"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'Connection': 'keep-alive'})
+    return session
+
+
+def _keepalive_ping(driver, stop):
+    """后台线程：定时发送轻量请求，保持连接与 TLS 会话常热，stop 置位后退出"""
+    while not stop.wait(KEEPALIVE_INTERVAL):
+        try:
+            driver.ping()
+        except Exception:
+            pass
+
+
+def _acquire_driver_http(driver):
+    """
+    取得驱动共享的连接池：每个驱动只创建一个 Session 与一个保活线程，引用计数加一。
+    保活线程只引用驱动，不会让引擎对象常驻内存
+    """
+    with _DRIVER_HTTP_LOCK:
+        shared = getattr(driver, '_engine_http', None)
+        if shared is None:
+            session = _make_http_session()
+            driver.set_http_session(session)
+            stop = threading.Event()
+            threading.Thread(target=_keepalive_ping, args=(driver, stop), name='EngineKeepalive', daemon=True).start()
+            shared = driver._engine_http = {'session': session, 'stop': stop, 'refs': 0}
+        shared['refs'] += 1
+        return shared['session']
+
+
+def _release_driver_http(driver):
+    """引用计数减一，最后一个引擎释放时停止保活线程并关闭连接池"""
+    with _DRIVER_HTTP_LOCK:
+        shared = getattr(driver, '_engine_http', None)
+        if shared is None:
+            return
+        shared['refs'] -= 1
+        if shared['refs'] > 0:
+            return
+        del driver._engine_http
+    shared['stop'].set()
+    shared['session'].close()
+
+
+def _float_or_nan(value):
+    """转为 float，无法转换时返回 NaN（由调用方按币种单独报错，不影响其他币种）"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _signed_position_usd(row):
+    """有向持仓市值（多为正、空为负），无持仓按 0 计；字段缺失或无效时返回 NaN"""
+    if not row:
+        return 0.0
+    try:
+        usd = float(row['quantityUSD'])
+        return usd if row['side'] == 'long' else -usd
+    except (KeyError, TypeError, ValueError):
+        return math.nan
+
+
+def _effective_soft(coin, soft):
+    """币种实际是否使用软下单：soft 为真且币种不匹配 _NO_SOFT_RE"""
+    return soft and _NO_SOFT_RE.search(coin) is None
+
+
+def _decimal_quantum(ref):
+    """按 ref 的有效小数位得到 Decimal 量化单位（与 round_like 的位数规则一致，如 0.01 -> 0.01，10 -> 1E+1）"""
+    return decimal.Decimal(1).scaleb(decimal.Decimal(str(ref)).normalize().as_tuple().exponent)
+
+
+def _quantize(x, q, rounding=decimal.ROUND_HALF_EVEN):
+    """把 x 量化到单位 q，返回 Decimal（float 先经 str 转换以保持十进制精确）"""
+    if not isinstance(x, decimal.Decimal):
+        x = decimal.Decimal(str(x))
+    return x.quantize(q, rounding=rounding)
+
+
+def _order_size(usdt_amount, base_order_money, size_q):
+    """
+    按金额计算下单数量（Decimal，已量化到 size_q）。
+    先按最小单位四舍五入；结果为 0 时，若放大到原循环上限后能舍入到一个最小单位，
+    直接下一个最小单位（与原先 round_like 逐次放大 1.25 倍重试的结果一致），否则为 0
+    """
+    raw_amount = decimal.Decimal(str(usdt_amount)) / decimal.Decimal(str(base_order_money))
+    order_amount = _quantize(raw_amount, size_q)
+    if order_amount == 0 and raw_amount * _MAX_ROUND_UP_RATIO > size_q / 2:
+        order_amount = size_q
+    return order_amount
+
 def pick_exchange(cex, account, strategy='NONAME', strategy_detail='COMMON'):
     ex = cex if cex else ''
     if ex not in ('okx', 'bp'):
@@ -59,7 +189,8 @@ def pick_exchange(cex, account, strategy='NONAME', strategy_detail='COMMON'):
     return ex, engine
 
 class ExecutionEngine:
-    def __init__(self, account=0, strategy='Classical', strategy_detail="COMMON",  exchange_type='okx', account_manager=None):
+    def __init__(self, account=0, strategy='Classical', strategy_detail="COMMON",  exchange_type='okx', account_manager=None,
+                 preload_coins=None, event_bus=None):
         """
         Initialize the execution engine with API credentials and setup logging.
         
@@ -70,6 +201,8 @@ class ExecutionEngine:
             symbol: 交易对
             exchange_type: 交易所类型 ('okx', 'backpack')
             account_manager: AccountManager实例，如果为None则使用全局实例
+            preload_coins: 初始化时并行预取限额信息的币种列表，首次下单直接命中缓存
+            event_bus: 订单推送所在的事件总线，默认使用已创建的全局事件总线（没有则按超时轮询）
         """
         self.account = account
         self.exchange_type = exchange_type.lower()
@@ -92,36 +225,114 @@ class ExecutionEngine:
             raise RuntimeError(f"Failed to get {self.exchange_type} driver for account {account}")
         self.cex_driver.order_id_to_symbol = {}
 
+        # 共享 HTTP 连接池并在后台定时保活，避免每笔订单重新做 TCP/TLS 握手；
+        # 连接池与保活线程按驱动共享（同一账户的多个引擎共用一份），最后一个引擎 close() 时释放
+        self._http = None
+        if hasattr(self.cex_driver, 'set_http_session'):
+            self._http = _acquire_driver_http(self.cex_driver)
+
         # 初始化监控和日志
         self.monitor = SystemMonitor(self, strategy)
         self.logger = self.monitor.logger
         
         
-        # 初始化余额（如果支持）
+        # 初始化其他属性
+        self.watch_threads = []  # 存储所有监控任务（共享事件循环中的追踪协程）
+        self.soft_orders_to_focus = []
+        # 交易对限额缓存 {symbol: (limits, fetched_at)}
+        self._limits_cache = {}
+        # 最新价格缓存 {symbol: (fetched_at, price)}
+        self._price_cache = {}
+        # 所有订单追踪协程共用一个后台事件循环，首次 focus_on_orders 时启动
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        # 订单追踪中并行 REST 调用（查状态、查价格、改单）共用的线程池
+        self._io_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix='EngineIO')
+        # 订单推送到达时唤醒追踪协程（asyncio.Event，随事件循环创建），取代固定时长的 sleep；
+        # 追踪事件循环启动时订阅 _event_bus（或全局事件总线）上的订单推送，_order_bus 为已订阅的总线
+        self._order_update = None
+        self._event_bus = event_bus
+        self._order_bus = None
+        
+        # 初始化余额（如果支持），同时在 I/O 线程池中并行预取 preload_coins 的限额信息
+        balance_future = self._io_pool.submit(self.cex_driver.fetch_balance)
+        if preload_coins:
+            list(self._io_pool.map(self._prefetch_limits, preload_coins))
         try:
-            self.init_balance = float(self.cex_driver.fetch_balance())
+            self.init_balance = float(balance_future.result())
         except Exception as e:
             self.logger.warning(f"Failed to fetch initial balance: {e}")
             self.init_balance = 0.0
         
-        # 初始化其他属性
-        self.watch_threads = []  # 存储所有监控线程
-        self.soft_orders_to_focus = []
-        
         self.logger.info(f"ExecutionEngine initialized for {self.exchange_type} account {account}")
 
 
+    def close(self):
+        """停止订单追踪事件循环与 I/O 线程池，并释放驱动共享的连接池（最后一个使用者关闭时停止保活线程）"""
+        if self._http is not None:
+            _release_driver_http(self.cex_driver)
+            self._http = None
+        if self._order_bus is not None:
+            self._order_bus.unsubscribe('account.order.*', self.notify_order_update)
+            self._order_bus = None
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._io_pool.shutdown(wait=False)
+
+    def _limits(self, symbol):
+        """获取交易对限额信息，命中缓存且未过期时不发请求，返回 (limits, err)"""
+        hit = self._limits_cache.get(symbol)
+        if hit and time.time() - hit[1] < LIMITS_CACHE_TTL:
+            return hit[0], None
+        limits, err = self.cex_driver.exchange_limits(symbol=symbol)
+        if not err and limits:
+            # 按交易对预先绑定好量化单位的取整函数，下单时不再解析精度
+            limits = dict(limits)
+            limits['size_quantum'] = _decimal_quantum(limits['min_order_size'])
+            limits['price_round'] = functools.partial(_quantize, q=_decimal_quantum(limits['price_precision']))
+            self._limits_cache[symbol] = (limits, time.time())
+        return limits, err
+
+    def _prefetch_limits(self, coin):
+        """预取单个币种的限额信息写入缓存（失败只记录警告）"""
+        try:
+            symbol_full = self.cex_driver._norm_symbol(coin)[0]
+            _, err = self._limits(symbol_full)
+            if err:
+                self.logger.warning(f"Failed to prefetch limits for {coin}: {err}")
+        except Exception as e:
+            self.logger.warning(f"Failed to prefetch limits for {coin}: {e}")
+
+    def _get_price(self, symbol):
+        """获取最新价格，PRICE_CACHE_TTL 内的重复查询（包括其他追踪组）直接复用缓存"""
+        now = time.monotonic()
+        hit = self._price_cache.get(symbol)
+        if hit and now - hit[0] < PRICE_CACHE_TTL:
+            return hit[1]
+        price = self.cex_driver.get_price_now(symbol)
+        self._price_cache[symbol] = (now, price)
+        return price
+
+    def _invalidate_limits_on_error(self, symbol, err):
+        """下单返回交易对不存在类错误时清除缓存，下次重新拉取限额"""
+        if err and 'instrument' in str(err).lower():
+            self._limits_cache.pop(symbol, None)
+
+    def _norm_symbol_or_none(self, coin):
+        """规范化交易对，失败时返回 None，由下单循环内的异常处理逐个币种报告，不影响其他币种"""
+        try:
+            return self.cex_driver._norm_symbol(coin)[0]
+        except Exception:
+            return None
+
     def set_coin_position_to_target(self, usdt_amounts=[10], coins=['eth'], soft=False, async_mode=False, max_workers= multiprocessing.cpu_count(), stack_mode=False):
         start_time = time.time()
         position_infos, err = self.cex_driver.get_position(keep_origin=False)
         if err:
             self.logger.warning(f"Failed to get position: {err}")
             return None, err
-        all_pos_info = {}
-        for x in position_infos:
-            if float(x['quantity']) != 0:
-                all_pos_info[x['symbol']] = x
-        # print('all_pos_info.keys: ', all_pos_info.keys())
+        # 只保留非零持仓
+        all_pos_info = {x['symbol']: x for x in position_infos if float(x['quantity'])}
         
         # 如果启用异步模式，使用并发处理
         if async_mode:
@@ -154,18 +365,23 @@ class ExecutionEngine:
             return self.soft_orders_to_focus
         
         # 原有同步逻辑
-        times = 0
-        for coin, usdt_amount in zip(coins, usdt_amounts):
-            times += 1
+        # 先一次性取出各币种持仓，向量化算出全部差额，循环内只负责下单
+        pairs = list(zip(coins, usdt_amounts))
+        pos_rows = [None if stack_mode else all_pos_info.get(self._norm_symbol_or_none(coin))
+                    for coin, _ in pairs]
+        open_positions, diffs = self._position_diffs(pos_rows, [usdt_amount for _, usdt_amount in pairs])
+        # 循环内只计算下单参数，攒够一批即提交（驱动支持时合并为批量下单请求），限频在提交侧进行
+        pending_orders = []
+        submitted = 0
+        chunk_size = self._submit_chunk_size()
+        for i, (coin, usdt_amount) in enumerate(pairs):
+            if len(pending_orders) >= chunk_size:
+                submitted = self._submit_pending_orders(pending_orders, submitted)
+                pending_orders = []
             try:
-                if times > 50:
-                    time.sleep(1)
                 symbol_full, _, _ = self.cex_driver._norm_symbol(coin)
                 # exchange = init_CexClient(coin)
-                if stack_mode:
-                    data = None
-                else:
-                    data = all_pos_info.get(symbol_full, None)
+                data = pos_rows[i]
                 if not data:
                     if not stack_mode:
                         print('！！！！！！！！！！还没开仓呢哥！')
@@ -173,51 +389,45 @@ class ExecutionEngine:
                                                     {"symbol": symbol_full, "error": "无法获取持仓信息"})
                     try:
                         # if 1>0:
-                        _, err = self.place_incremental_orders(abs(usdt_amount), coin, 'sell' if usdt_amount < 0 else 'buy', async_mode=async_mode,
-                                                        soft=soft if coin.lower().find(
-                                                            'xaut') == -1 or coin.lower().find(
-                                                            'trx') == -1 else False)
+                        spec, err = self._prepare_incremental_order(abs(usdt_amount), coin, 'sell' if usdt_amount < 0 else 'buy', async_mode=async_mode,
+                                                        soft=_effective_soft(coin, soft))
                         if err:
                             self.logger.warning(f"Failed to place incremental orders: {err}")
+                            self._submit_pending_orders(pending_orders, submitted)
                             return None, err
+                        pending_orders.append((spec, None))
                     except Exception as ex:
                         print('！！！！！！！！！！！！！艹了！怎么出这种问题', ex)
                         self.monitor.handle_error(str(ex),
                                                   context=f" OpenPosition Fallback in set_coin_position_to_target for {coin}")
                     continue
                 if data:
-                    side = data['side']
-                    open_position = float(data['quantityUSD']) if  side == 'long' else -float(data['quantityUSD'])
-                    diff = open_position - usdt_amount
+                    open_position = float(open_positions[i])
+                    diff = float(diffs[i])
+                    if math.isnan(diff):
+                        raise ValueError(f"持仓或目标金额无效: position={data}, target={usdt_amount}")
                     # if abs(diff) < 1:
                     #     continue
                     print(f"【{coin.upper()} 】需要补齐差额: {round(diff, 2)} = 现有:{round(open_position, 2)} - Target:{round(usdt_amount)}")
                     # 记录操作开始
                     
-                    oid, err = self.place_incremental_orders(abs(diff), coin, 'sell' if diff > 0 else 'buy', soft=soft if coin.lower().find('xaut') == -1 or coin.lower().find('trx') == -1 else False)
-                    if oid:
-                        self.monitor.record_operation("SetCoinPosition AlignTo", self.strategy_detail, {
+                    spec, err = self._prepare_incremental_order(abs(diff), coin, 'sell' if diff > 0 else 'buy', soft=_effective_soft(coin, soft))
+                    align_record = {
                         "symbol": symbol_full,
                         "target_amount": usdt_amount,
                         "open_position": open_position,
                         "diff": diff,
-                        'order_id': oid,
-                        'status': 'success'
-                    })
+                    }
+                    if err:
+                        self.monitor.record_operation("SetCoinPosition AlignTo", self.strategy_detail,
+                                                      dict(align_record, error=err, status='failed'))
                     else:
-                        self.monitor.record_operation("SetCoinPosition AlignTo", self.strategy_detail, {
-                        "symbol": symbol_full,
-                        "target_amount": usdt_amount,
-                        "open_position": open_position,
-                        "diff": diff,
-                        'error': err,
-                        'status': 'failed'
-                    })
+                        pending_orders.append((spec, align_record))
             except Exception as e:
                 print('！！！！！！！！！！！倒霉催的', e)
                 self.monitor.handle_error(str(e), context=f"set_coin_position_to_target for {coin}")
                 try:
-                    oid, err = self.place_incremental_orders(abs(usdt_amount), coin, 'sell' if usdt_amount < 0 else 'buy', soft=soft if coin.lower().find('xaut') == -1 else False)
+                    oid, err = self.place_incremental_orders(abs(usdt_amount), coin, 'sell' if usdt_amount < 0 else 'buy', soft=_effective_soft(coin, soft))
                     if oid:
                         self.monitor.record_operation("Handle Error", self.strategy_detail, {"symbol": symbol_full,
                         "target_amount": coin,
@@ -237,12 +447,84 @@ class ExecutionEngine:
                     print('！！！！！！！！！！！！！艹了！', e)
                     self.monitor.handle_error(str(ex), context=f"ErrorHandle Fallback in set_coin_position_to_target for {coin} after handle error to {'sell' if usdt_amount < 0 else 'buy'} {usdt_amount}")
                 continue
+        self._submit_pending_orders(pending_orders, submitted)
         print(f'本次初始化耗时: {round(time.time() - start_time)}')
         return self.soft_orders_to_focus
 
-    def _order_tracking_logic(self, coins, soft_orders_to_focus):
+    def _submit_chunk_size(self):
+        """每批提交的订单数：支持批量下单时为 ORDER_SUBMIT_CHUNK，否则逐单提交"""
+        return ORDER_SUBMIT_CHUNK if hasattr(self.cex_driver, 'batch_place_orders') else 1
+
+    def _submit_pending_orders(self, pending_orders, submitted=0):
+        """
+        分批提交 set_coin_position_to_target 累积的订单，并补记对齐结果。
+        本轮已提交超过 ORDER_THROTTLE_AFTER 个订单后，每批提交前等待 1 秒；
+        等待过久的限价单在提交前按最新价格重新定价。返回累计已提交的订单数
+        """
+        chunk_size = self._submit_chunk_size()
+        for start in range(0, len(pending_orders), chunk_size):
+            if submitted >= ORDER_THROTTLE_AFTER:
+                time.sleep(1)
+            chunk = pending_orders[start:start + chunk_size]
+            specs = [spec for spec, _ in chunk]
+            for spec in specs:
+                self._refresh_stale_price(spec)
+            self._finish_pending_orders(chunk, self._place_order_specs(specs))
+            submitted += len(chunk)
+        return submitted
+
+    def _refresh_stale_price(self, spec):
+        """限价单计算价格后超过 ORDER_PRICE_MAX_AGE 秒仍未提交时，按最新价格重新定价（调用方指定的价格不变）"""
+        if spec['price'] is None or not spec['reprice']:
+            return
+        now = time.monotonic()
+        if now - spec['prepared_at'] <= ORDER_PRICE_MAX_AGE:
+            return
+        limits, err = self._limits(spec['symbol'])
+        price = None if err else self._get_price(spec['symbol'])
+        if price is None:
+            return
+        spec['price'] = float(limits['price_round'](price))
+        spec['ref_price'] = price
+        spec['prepared_at'] = now
+
+    def _finish_pending_orders(self, pending_orders, results):
+        """记录一批订单的下单结果，并补记对齐结果"""
+        for (spec, align_record), (order_id, err_msg) in zip(pending_orders, results):
+            try:
+                oid, err = self._finish_incremental_order(spec, order_id, err_msg)
+                if align_record is None:
+                    continue
+                if oid:
+                    self.monitor.record_operation("SetCoinPosition AlignTo", self.strategy_detail,
+                                                  dict(align_record, order_id=oid, status='success'))
+                else:
+                    self.monitor.record_operation("SetCoinPosition AlignTo", self.strategy_detail,
+                                                  dict(align_record, error=err, status='failed'))
+            except Exception as e:
+                self.monitor.handle_error(str(e), context=f"submit pending order for {spec['coin']}")
+
+    @staticmethod
+    def _position_diffs(pos_rows, usdt_amounts):
+        """
+        向量化计算持仓差额: diff = 有向持仓市值(多为正、空为负) - 目标金额
+        
+        :param pos_rows: 与 usdt_amounts 对齐的持仓信息列表，无持仓为 None（按 0 计）
+        :return: (open_positions, diffs) 两个 float64 数组；持仓或目标金额无效的币种为 NaN，
+                 由下单循环按币种单独处理
+        """
+        n = len(pos_rows)
+        open_positions = np.fromiter((_signed_position_usd(r) for r in pos_rows), dtype=np.float64, count=n)
+        targets = np.fromiter((_float_or_nan(x) for x in usdt_amounts), dtype=np.float64, count=n)
+        diffs = open_positions - targets
+        return open_positions, diffs
+
+    async def _order_tracking_logic(self, coins, soft_orders_to_focus):
+        """订单追踪协程：阻塞的 REST 调用交给线程执行，等待期间不占用线程"""
         start_time = time.time()
-        done_coin = []
+        done_coin = set()
+        # 与 soft_orders_to_focus 同步维护的集合，成员判断为 O(1)
+        focus_set = set(soft_orders_to_focus)
         # time.sleep(10)
         coin_process_times = {}
         exchange = self.cex_driver
@@ -255,52 +537,65 @@ class ExecutionEngine:
                     if coin in done_coin:
                         # if coin in done_coin or coin == 'btc':
                         continue
-                    if coin_process_times.get(coin):
-                        coin_process_times[coin] += 1
-                    else:
-                        coin_process_times[coin] = 1
+                    coin_process_times[coin] = coin_process_times.get(coin, 0) + 1
                     symbol = exchange._norm_symbol(coin)[0]
-                    exist_orders_for_coin, err = exchange.get_open_orders(symbol=symbol, onlyOrderId=True)
-                    # print(f'exist_orders_for_coin: {exist_orders_for_coin}, err: {err}')
-                    if err or not exist_orders_for_coin:
-                        done_coin.append(coin)
+                    exist_orders_for_coin, err = await self._io(exchange.get_open_orders, symbol=symbol, onlyOrderId=True)
+                    # 只处理仍在挂单中的追踪订单：一次集合求交，O(K+S)；
+                    # 查询失败、没有挂单或挂单中没有追踪订单时，该币种完成
+                    orders_to_check = [] if err or not exist_orders_for_coin else list(focus_set.intersection(exist_orders_for_coin))
+                    if not orders_to_check:
+                        done_coin.add(coin)
                         continue
-                    if len(exist_orders_for_coin) == 0 or len([x for x in exist_orders_for_coin if x in soft_orders_to_focus]) == 0:
-                        done_coin.append(coin)
-                        continue
-                    for order in exist_orders_for_coin:
-                        if order in soft_orders_to_focus:
-                            # print(f'order: {order} is still opening')
-                            data, err = exchange.get_order_status(order_id=order, symbol=exchange._norm_symbol(coin)[0], keep_origin=False)
-                            if err or not data:
-                                print(f'data: {data}, err: {err}')
+                    # 该币种所有追踪订单的状态查询与一次价格查询并行发出
+                    now_price, *statuses = await asyncio.gather(
+                        self._io(self._get_price, symbol),
+                        *[self._io(exchange.get_order_status, order_id=order, symbol=symbol, keep_origin=False)
+                          for order in orders_to_check])
+                    amend_specs = []
+                    for order, (data, err) in zip(orders_to_check, statuses):
+                        # print(f'order: {order} is still opening')
+                        if err or not data:
+                            self.logger.debug('order status unavailable %s: data=%s err=%s', order, data, err)
+                            continue
+                        if now_price <= float(data['price']):
+                            tmp_price = align_decimal_places(now_price, now_price * (1 + 0.0001 * (200 - watch_times_for_all_coins) / 200))
+                            if tmp_price == float(data['price']):
                                 continue
-                            now_price = exchange.get_price_now(symbol)
-                            if now_price <= float(data['price']):
-                                tmp_price = align_decimal_places(now_price, now_price * (1 + 0.0001 * (200 - watch_times_for_all_coins) / 200))
-                                if tmp_price == float(data['price']):
-                                    continue
-                                new_price = tmp_price if tmp_price < float(data['price']) else float(data['price'])
-                            else:
-                                tmp_price = align_decimal_places(now_price, now_price * (1 - 0.0001 * (200 - watch_times_for_all_coins) / 200))
-                                if tmp_price == float(data['price']):
-                                    continue
-                                new_price = tmp_price if tmp_price > float(data['price']) else float(data['price'])
+                            new_price = tmp_price if tmp_price < float(data['price']) else float(data['price'])
+                        else:
+                            tmp_price = align_decimal_places(now_price, now_price * (1 - 0.0001 * (200 - watch_times_for_all_coins) / 200))
+                            if tmp_price == float(data['price']):
+                                continue
+                            new_price = tmp_price if tmp_price > float(data['price']) else float(data['price'])
+                        need_to_watch = True
+                        amend_specs.append((order, new_price, float(data['quantity'])))
+                    if amend_specs:
+                        # 改单请求同样并行发出
+                        amend_results = await asyncio.gather(
+                            *[self._io(exchange.amend_order, order_id=order, symbol=symbol, price=new_price, quantity=quantity)
+                              for order, new_price, quantity in amend_specs])
+                        still_open = False
+                        for (order, new_price, quantity), (new_order, err) in zip(amend_specs, amend_results):
                             # 解决 TypeError: 'str' object cannot be interpreted as an integer
                             # pop() 需要传入索引时是整数，但这里 order 是订单号（字符串），应使用 remove
-                            need_to_watch = True
-                            new_order, err = exchange.amend_order(order_id=order,  symbol=self.cex_driver._norm_symbol(coin)[0], price=new_price, quantity=float(data['quantity']))
                             if new_order is None and err is None:
                                 soft_orders_to_focus.remove(order)
-                                print(f"\n  {order} is deal: {self.cex_driver._norm_symbol(coin)[0]}")
-                                done_coin.append(coin)
-                                time.sleep(2.88)
+                                focus_set.discard(order)
+                                print(f"\n  {order} is deal: {symbol}")
+                                done_coin.add(coin)
                             else:
+                                still_open = True
                                 if err is None and exchange.cex.lower() == 'backpack':
                                     soft_orders_to_focus[soft_orders_to_focus.index(order)] = new_order
-                                print(f"\n\namend_order  {order} to {new_order}: {self.cex_driver._norm_symbol(coin)[0]} {new_price}, {float(data['quantity'])}")
-                                time.sleep(6.66)
+                                    focus_set.discard(order)
+                                    focus_set.add(new_order)
+                                if self.logger.isEnabledFor(logging.DEBUG):
+                                    self.logger.debug('amend_order %s -> %s: %s %s, %s', order, new_order, symbol, new_price, quantity)
+                        await self._wait_order_update(6.66 if still_open else 2.88)
                     print(f'\r共有{len(coins)}个币种，完成了{len(done_coin)}个, 正追踪【{coin}】中，它目前还有{len(exist_orders_for_coin)}个订单', end=' ')
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug('tracking %s: done %d/%d coins, %d open orders',
+                                          coin, len(done_coin), len(coins), len(exist_orders_for_coin))
                 except Exception as e:
                     try:
                         print('❌ 订单追踪失败000：', coin, exist_orders_for_coin, len(soft_orders_to_focus), e, data)
@@ -309,22 +604,83 @@ class ExecutionEngine:
             # 这里之前多打了个tab 差点没把我弄死，每次都只监控一个订单就退出了，绝
             if not need_to_watch or time.time() - start_time > 10800:
                 print(f'✅ {"到点了" if need_to_watch else "所有订单都搞定了"}，收工！')
-                self.soft_orders_to_focus = [x for x in self.soft_orders_to_focus if x not in soft_orders_to_focus]
+                self.soft_orders_to_focus = [x for x in self.soft_orders_to_focus if x not in focus_set]
                 if len(self.watch_threads) >= 1:
                     self.watch_threads = self.watch_threads[:-1]
                 return
             watch_times_for_all_coins += 1
 
+    def notify_order_update(self, *args):
+        """订单推送回调（可在任意线程调用）：唤醒所有正在等待的订单追踪任务"""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._pulse_order_update)
+
+    def _pulse_order_update(self):
+        """在事件循环内唤醒当前所有等待者，随后复位以便下次等待"""
+        self._order_update.set()
+        self._order_update.clear()
+
+    def subscribe_order_updates(self, event_bus=None):
+        """
+        订阅事件总线上的订单推送（account.order.*），订单成交/变化时追踪逻辑立即处理，
+        没有推送时按原有间隔超时后再检查
+        """
+        from ctos.core.kernel.event_bus import get_event_bus
+        bus = event_bus or get_event_bus()
+        if bus is self._order_bus:
+            return
+        bus.subscribe('account.order.*', self.notify_order_update, wildcard=True, sync_dispatch=True)
+        self._order_bus = bus
+
+    def _attach_order_updates(self):
+        """追踪事件循环启动时接入订单推送：有可用的事件总线就订阅，否则追踪按超时轮询"""
+        from ctos.core.kernel.event_bus import current_event_bus
+        bus = self._event_bus or current_event_bus()
+        if bus is not None:
+            try:
+                self.subscribe_order_updates(bus)
+            except Exception as e:
+                self.logger.warning(f"Failed to subscribe order updates: {e}")
+
+    async def _wait_order_update(self, timeout):
+        """等待订单推送或超时，返回是否由推送唤醒"""
+        try:
+            await asyncio.wait_for(self._order_update.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _io(self, fn, *args, **kwargs):
+        """在 I/O 线程池中执行阻塞的驱动调用，返回可 await 的 future"""
+        return asyncio.get_running_loop().run_in_executor(self._io_pool, functools.partial(fn, *args, **kwargs))
+
+    def _ensure_loop(self):
+        """启动（仅一次）运行所有订单追踪协程的后台事件循环"""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(loop)
+                    # asyncio.Event 需在所属事件循环的线程内创建
+                    self._order_update = asyncio.Event()
+                    ready.set()
+                    loop.run_forever()
+
+                threading.Thread(target=run, name='OrderTracking', daemon=True).start()
+                ready.wait()
+                self._loop = loop
+                self._attach_order_updates()
+            return self._loop
+
     def focus_on_orders(self, coins, soft_orders_to_focus):
-        """为每一组监控任务启动一个后台线程"""
-        t = threading.Thread(
-            target=self._order_tracking_logic,
-            args=(coins, soft_orders_to_focus),
-            daemon=True
-        )
-        t.start()
-        self.watch_threads.append(t)
-        print(f"🎯 新监控线程已启动，共 {len(self.watch_threads)} 个任务运行中")
+        """为每一组监控任务在共享事件循环中启动一个追踪协程"""
+        future = asyncio.run_coroutine_threadsafe(
+            self._order_tracking_logic(coins, soft_orders_to_focus), self._ensure_loop())
+        self.watch_threads.append(future)
+        print(f"🎯 新监控任务已启动，共 {len(self.watch_threads)} 个任务运行中")
 
     def revoke_all_orders(self):
         open_orders, err = self.cex_driver.get_open_orders(onlyOrderId=True)
@@ -341,18 +697,25 @@ class ExecutionEngine:
         根据usdt_amount下分步订单，并通过 SystemMonitor 记录审核信息
         操作中调用内部封装的买卖接口（本版本建议使用 HTTP 接口下单的方式）。
         """
+        spec, err = self._prepare_incremental_order(usdt_amount, coin, direction, soft=soft, price=price, async_mode=async_mode)
+        if err:
+            return None, err
+        order_id, err_msg = self._place_order_specs([spec])[0]
+        return self._finish_incremental_order(spec, order_id, err_msg)
+
+    def _prepare_incremental_order(self, usdt_amount, coin, direction, soft=False, price=None, async_mode=False):
+        """计算下单参数（数量、类型、限价），返回 (spec, err)，不实际下单"""
         symbol_full, _, _ = self.cex_driver._norm_symbol(coin)
+        # 未指定价格时限价取自当前行情，提交前等待过久可重新定价
+        reprice = price is None
         if price:
             soft=True
         exchange = self.cex_driver
-        soft_orders_to_focus = []
-        exchange_limits_info, err = self.cex_driver.exchange_limits(symbol=symbol_full)
+        exchange_limits_info, err = self._limits(symbol_full)
         if err:
             print('CEX DRIVER.exchange_limits error ', err)
             return None, err
-        size_precision = exchange_limits_info['size_precision']
-        price_precision = exchange_limits_info['price_precision']
-        min_order_size = exchange_limits_info['min_order_size']
+        price_round = exchange_limits_info['price_round']
         contract_value = exchange_limits_info['contract_value']
 
         # 获取当前市场价格
@@ -363,12 +726,7 @@ class ExecutionEngine:
             return None, "获取当前价格失败"
         base_order_money = price * contract_value
         
-        # print(base_order_money, order_amount)
-        order_amount = round_like(min_order_size , usdt_amount / base_order_money)
-        add_amount_times = 1
-        while order_amount == 0 and add_amount_times < 4:
-            add_amount_times += 1
-            order_amount = round_like(min_order_size , usdt_amount * pow(1.25, add_amount_times) / base_order_money)
+        order_amount = float(_order_size(usdt_amount, base_order_money, exchange_limits_info['size_quantum']))
         if order_amount == 0:
             self.monitor.record_operation("PlaceIncrementalOrders", self.strategy_detail,
                                           {"symbol": symbol_full, "error": "订单金额过小，无法下单", "async_mode":async_mode})
@@ -377,63 +735,80 @@ class ExecutionEngine:
             else:
                 print('订单金额过小，无法下单')
             return None, "订单金额过小，无法下单"
-        order_id = None
-        if direction.lower() == 'buy':
-            if not soft:
-                order_id, err_msg = self.cex_driver.place_order(symbol_full, 'buy', 'MARKET', order_amount)
-                if order_id:
-                    self.cex_driver.order_id_to_symbol[order_id] = coin
-                    soft_orders_to_focus.append(order_id)
-            else:
-                if price:
-                    limit_price = round_like(price_precision, price)
-                else:
-                    limit_price = round_like(price_precision, price * 0.9995)
-                print(f"limit_price: {limit_price}, order_amount:{order_amount}")
-                order_id, err_msg = self.cex_driver.place_order(symbol_full, 'buy', 'limit', order_amount, limit_price)
-                if order_id:
-                    self.cex_driver.order_id_to_symbol[order_id] = coin
-                    soft_orders_to_focus.append(order_id)
-            if order_id:
-                print(f"\r{BeijingTime()} {self.cex_driver.cex.upper()}-{self.account} **BUY** order for {order_amount if order_id else 0} units of 【{coin.upper()}】 at price {price}", end=' ' if async_mode else '')
-                self.monitor.record_operation("PlaceIncrementalOrders", self.strategy_detail, {
-                    "symbol": symbol_full, "action": "buy", "price": price, "sizes": order_amount, 'order_id': order_id})
+
+        side = direction.lower()
+        limit_price = None
+        if soft and side in ('buy', 'sell'):
+            if price:
+                limit_price = float(price_round(price))
             else:
-                print(f"❌ 订单创建失败: {err_msg}")
-                self.monitor.record_operation("Failed PlaceIncrementalOrders", self.strategy_detail, {
-                    "symbol": symbol_full, "action": "buy", "price": price, "sizes": order_amount, "error": err_msg, "async_mode":async_mode})
+                limit_price = float(price_round(price * (0.9995 if side == 'buy' else 1.0005)))
+            self.logger.debug('limit_price: %s, order_amount: %s', limit_price, order_amount)
+        return {
+            'coin': coin,
+            'symbol': symbol_full,
+            'side': side,
+            'order_type': 'limit' if soft else 'MARKET',
+            'size': order_amount,
+            'price': limit_price,
+            'soft': soft,
+            'usdt_amount': usdt_amount,
+            'ref_price': price,
+            'base_order_money': base_order_money,
+            'async_mode': async_mode,
+            'reprice': reprice,
+            'prepared_at': time.monotonic(),
+        }, None
 
-        elif direction.lower() == 'sell':
-            if not soft:
-                order_id, err_msg = self.cex_driver.place_order(symbol_full, 'sell', 'MARKET', order_amount)
-                if order_id:
-                    soft_orders_to_focus.append(order_id)
+    def _place_order_specs(self, specs):
+        """
+        提交一组下单参数，返回与 specs 一一对应的 [(order_id, err), ...]。
+        多个订单且驱动支持 batch_place_orders 时合并为批量请求，否则逐个下单。
+        """
+        results = [(None, None)] * len(specs)
+        valid = [i for i, spec in enumerate(specs) if spec['side'] in ('buy', 'sell')]
+        if len(valid) > 1 and hasattr(self.cex_driver, 'batch_place_orders'):
+            batch_results = self.cex_driver.batch_place_orders([specs[i] for i in valid])
+            for i, result in zip(valid, batch_results):
+                results[i] = result
+            return results
+        for i in valid:
+            spec = specs[i]
+            if spec['price'] is None:
+                results[i] = self.cex_driver.place_order(spec['symbol'], spec['side'], spec['order_type'], spec['size'])
             else:
-                if price:
-                    limit_price =  round_like(price_precision, price)
-                else:
-                    limit_price = round_like(price_precision, price * 1.0005)
-                print(f"limit_price: {limit_price}, order_amount:{order_amount}")
-                order_id, err_msg = self.cex_driver.place_order(symbol_full, 'sell', 'limit', order_amount, limit_price)
-                if order_id:
-                    self.cex_driver.order_id_to_symbol[order_id] = coin
-                    soft_orders_to_focus.append(order_id)
-                else:
-                    self.cex_driver.order_id_to_symbol[order_id] = coin
+                results[i] = self.cex_driver.place_order(spec['symbol'], spec['side'], spec['order_type'], spec['size'], spec['price'])
+        return results
+
+    def _finish_incremental_order(self, spec, order_id, err_msg):
+        """下单完成后的记录：订单映射、日志、监控，以及软下单订单的追踪列表"""
+        soft_orders_to_focus = []
+        coin, symbol_full, side = spec['coin'], spec['symbol'], spec['side']
+        price, order_amount, usdt_amount = spec['ref_price'], spec['size'], spec['usdt_amount']
+        async_mode = spec['async_mode']
+        if side in ('buy', 'sell'):
             if order_id:
-                print(f"\r {BeijingTime()} {self.cex_driver.cex.upper()}-{self.account} **SELL**  order for {order_amount if order_id else 0} units of 【{coin.upper()}】 at price {price} for $ {usdt_amount}", end=' ' if async_mode else '')
-                self.monitor.record_operation("PlaceIncrementalOrders", self.strategy_detail, {
-                    "symbol": symbol_full, "action": "sell", "price": price, "sizes": order_amount, 'order_id': order_id, "async_mode":async_mode})
+                self.cex_driver.order_id_to_symbol[order_id] = coin
+                soft_orders_to_focus.append(order_id)
+                if side == 'buy':
+                    print(f"\r{BeijingTime()} {self.cex_driver.cex.upper()}-{self.account} **BUY** order for {order_amount} units of 【{coin.upper()}】 at price {price}", end=' ' if async_mode else '')
+                    self.monitor.record_operation("PlaceIncrementalOrders", self.strategy_detail, {
+                        "symbol": symbol_full, "action": "buy", "price": price, "sizes": order_amount, 'order_id': order_id})
+                else:
+                    print(f"\r {BeijingTime()} {self.cex_driver.cex.upper()}-{self.account} **SELL**  order for {order_amount} units of 【{coin.upper()}】 at price {price} for $ {usdt_amount}", end=' ' if async_mode else '')
+                    self.monitor.record_operation("PlaceIncrementalOrders", self.strategy_detail, {
+                        "symbol": symbol_full, "action": "sell", "price": price, "sizes": order_amount, 'order_id': order_id, "async_mode":async_mode})
             else:
                 print(f"❌ 订单创建失败: {err_msg}")
+                self._invalidate_limits_on_error(symbol_full, err_msg)
                 self.monitor.record_operation("Failed PlaceIncrementalOrders", self.strategy_detail, {
-                    "symbol": symbol_full, "action": "sell", "price": price, "sizes": order_amount, "error": err_msg, "async_mode":async_mode})
+                    "symbol": symbol_full, "action": side, "price": price, "sizes": order_amount, "error": err_msg, "async_mode":async_mode})
 
-        remaining_usdt = usdt_amount - (base_order_money * order_amount)
+        remaining_usdt = usdt_amount - (spec['base_order_money'] * order_amount)
         # 任何剩余的资金如果无法形成更多订单，结束流程
         if remaining_usdt > 0:
-            print(f"\rRemaining USDT {round(remaining_usdt, 4)} ", end='')
-        if soft:
+            self.logger.debug('Remaining USDT %.4f', remaining_usdt)
+        if spec['soft']:
             self.soft_orders_to_focus += soft_orders_to_focus
         return soft_orders_to_focus, None
 
@@ -453,7 +828,7 @@ class ExecutionEngine:
                     print(f'🆕 {coin.upper()} 还没开仓呢哥！')
                 try:
                     _, err = self.place_incremental_orders(abs(usdt_amount), coin, 'sell' if usdt_amount < 0 else 'buy',
-                                                    soft=soft if coin.lower().find('xaut') == -1 or coin.lower().find('trx') == -1 else False)
+                                                    soft=_effective_soft(coin, soft))
                     if err:
                         return {'coin': coin, 'success': False, 'error': err}
                 except Exception as ex:
@@ -468,7 +843,7 @@ class ExecutionEngine:
                     return {'coin': coin, 'success': True, 'message': '差额太小，跳过'}
                 print(f"\r📊 【{coin.upper()}】需要补齐差额: {round(diff, 2)} = 现有:{round(open_position, 2)} - Target:{round(usdt_amount)}", end=' ')
                 oid, err = self.place_incremental_orders(abs(diff), coin, 'sell' if diff > 0 else 'buy', 
-                                                        soft=soft if coin.lower().find('xaut') == -1 or coin.lower().find('trx') == -1 else False)
+                                                        soft=_effective_soft(coin, soft))
                 if oid:
                     return {'coin': coin, 'success': True, 'order_id': oid}
                 else:
@@ -1,26 +1,28 @@
 import logging, json, time, sys, threading, atexit, queue, os
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 # 确保项目根目录在sys.path中
 import os
 import sys
 from datetime import datetime, timedelta
+from pathlib import Path
 
 def add_project_paths(project_name="ctos"):
     """
     自动查找项目根目录，并将其及常见子包路径添加到 sys.path。
+    结果缓存在环境变量 {PROJECT_NAME}_PROJECT_ROOT（默认 CTOS_PROJECT_ROOT）中。
     :param project_name: 项目根目录标识（默认 'ctos'）
     """
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = None
-    # 向上回溯，找到项目根目录
-    path = current_dir
-    while path != os.path.dirname(path):  # 一直回溯到根目录
-        if os.path.basename(path) == project_name or os.path.exists(os.path.join(path, ".git")):
-            project_root = path
-            break
-        path = os.path.dirname(path)
+    # 进程内（及子进程）只回溯一次，结果记在环境变量中，其他模块导入时直接复用
+    env_key = f"{project_name.upper()}_PROJECT_ROOT"
+    project_root = os.environ.get(env_key)
     if not project_root:
-        raise RuntimeError(f"未找到项目根目录（包含 {project_name} 或 .git）")
+        # 向上回溯，找到项目根目录
+        here = Path(os.path.abspath(__file__))
+        project_root = next((str(p) for p in here.parents
+                             if p.name == project_name or (p / ".git").exists()), None)
+        if not project_root:
+            raise RuntimeError(f"未找到项目根目录（包含 {project_name} 或 .git）")
+        os.environ[env_key] = project_root
     # 添加根目录
     if project_root not in sys.path:
         sys.path.insert(0, project_root)
@@ -78,8 +80,13 @@ class SystemMonitor:
         # 使用自定义Formatter，时间为北京时间
         rh.setFormatter(BeijingTimeFormatter(
             '%(asctime)s - %(levelname)s - %(message)s'))
-        if not any(isinstance(h, RotatingFileHandler) for h in self.logger.handlers):
-            self.logger.addHandler(rh)
+        # 文件写入交给 QueueListener 后台线程，交易线程记录日志时只做入队
+        self._log_listener = None
+        if not any(isinstance(h, (RotatingFileHandler, QueueHandler)) for h in self.logger.handlers):
+            log_queue = queue.Queue(-1)
+            self._log_listener = QueueListener(log_queue, rh, respect_handler_level=True)
+            self._log_listener.start()
+            self.logger.addHandler(QueueHandler(log_queue))
 
         # ---------- 操作日志：队列 + 后台 flush ----------
         op_file_path = os.path.join(log_dir, f"{base_name}_operation_log.log")
@@ -123,6 +130,8 @@ class SystemMonitor:
         self._stop.set()
         self.worker.join()
         self.op_file.close()
+        if self._log_listener is not None:
+            self._log_listener.stop()
 
     # ---------- 对外 API ----------
     def record_operation(self, operation, source_strategy, details):
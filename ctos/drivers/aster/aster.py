@@ -3,21 +3,185 @@ Aster exchange client implementation.
 """
 
 import os
+import math
+import functools
 import asyncio
 import json
 import time
 import hmac
 import hashlib
+import ssl
+import warnings
 from decimal import Decimal
 from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import urlencode
 import aiohttp
 import websockets
-import sys
+from yarl import URL
+
+# 优先使用 orjson 解析 REST 响应与 WebSocket 消息（C 实现，快数倍），未安装时回退到标准库；
+# orjson.JSONDecodeError 继承自 json.JSONDecodeError，异常处理无需改动
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 from .base import BaseExchangeClient, OrderResult, OrderInfo, query_retry
 from helpers.logger import TradingLogger
 
+_DEC_ZERO = Decimal(0)
+
+
+def use_uvloop() -> bool:
+    """
+    切换到 uvloop 事件循环（显式启用）
+
+    输入参数: 无
+
+    输出: bool - 是否已切换到 uvloop
+    作用: 模块全部为 asyncio I/O（aiohttp REST + websockets），由机器人入口在创建事件循环前调用；
+          导入模块本身不修改全局事件循环策略，未安装 uvloop 时保持标准循环
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+@functools.lru_cache(maxsize=4096)
+def _dec(s: str) -> Decimal:
+    """
+    将接口返回的数值字符串转为 Decimal（带缓存）
+
+    输入参数:
+        s: 数值字符串，如 '0'、'0.010'
+
+    输出: Decimal - 对应的 Decimal（不可变，可安全复用）
+    作用: 订单数量、价格等字段大量重复，缓存后同一字符串只解析一次
+    """
+    return Decimal(s or '0')
+
+
+def _parse_order_dict(order: Dict[str, Any], open_order: bool = False) -> OrderInfo:
+    """
+    将接口返回的单个订单字典解析为 OrderInfo
+
+    输入参数:
+        order: /fapi/v1/order 或 /fapi/v1/openOrders 返回的订单字典，必须包含 orderId
+        open_order: 为 True 时 size 取剩余数量（挂单视角），否则取下单数量
+
+    输出: OrderInfo - 订单信息对象
+    作用: 订单查询与挂单列表共用的解析逻辑；市价单的 price 为 0，改用成交均价 avgPrice
+    """
+    orig = _dec(order.get('origQty') or '0')
+    executed = _dec(order.get('executedQty') or '0')
+    remaining = orig - executed
+    if order.get('type') == 'MARKET':
+        price = _dec(order.get('avgPrice') or '0')
+    else:
+        price = _dec(order.get('price') or '0')
+    return OrderInfo(
+        order_id=str(order['orderId']),
+        side=order.get('side', '').lower(),
+        size=remaining if open_order else orig,
+        price=price,
+        status=order.get('status', ''),
+        filled_size=executed,
+        remaining_size=remaining
+    )
+
+
+def _parse_orders(raw: List[Dict[str, Any]]) -> List[OrderInfo]:
+    """
+    解析 openOrders 接口返回的挂单列表
+
+    输入参数:
+        raw: 接口返回的订单字典列表
+
+    输出: List[OrderInfo] - 挂单信息列表
+    作用: 纯函数，不依赖客户端状态，可直接在线程池中执行；解析函数绑定为局部变量，
+          大批量挂单时省去每次迭代的全局查找
+    """
+    parse = _parse_order_dict
+    return [parse(order, True) for order in raw]
+
+
+# 签名摘要算法按名称传给 hmac，使其直接使用 OpenSSL 的 HMAC 实现
+_HMAC_DIGEST = 'sha256'
+
+
+def _check_sha256_backend() -> None:
+    """
+    检查 SHA-256 是否由 OpenSSL 提供
+
+    输入参数: 无
+
+    输出: 无
+    作用: 每个 REST 请求都要签名；hashlib 回退到内置标量实现或 OpenSSL 过旧时给出警告，
+          此时无法使用 SHA-NI 等硬件加速
+    """
+    if getattr(hashlib.sha256, '__module__', '') != '_hashlib':
+        warnings.warn("hashlib.sha256 is not backed by OpenSSL, Aster request signing will be slow",
+                      RuntimeWarning)
+    elif ssl.OPENSSL_VERSION_INFO < (1, 1, 0):
+        warnings.warn(f"{ssl.OPENSSL_VERSION} may lack hardware-accelerated SHA-256", RuntimeWarning)
+
+
+_check_sha256_backend()
+
+# WebSocket 推送的盘口在该时长（秒）内视为新鲜，超时回退到 REST 查询
+BBO_CACHE_MAX_AGE = 0.25
+# REST 查询到的盘口在该时长（秒）内复用，合并同一次下单尝试中的重复查询
+BBO_REST_CACHE_TTL = 0.075
+# WebSocket 推送的订单状态最多保留的条数
+ORDER_STATUS_CACHE_SIZE = 1024
+# 撤单合并窗口（秒）与单次批量撤单的订单数上限
+CANCEL_COALESCE_WINDOW = 0.005
+BATCH_CANCEL_MAX = 10
+# 挂单数超过该值时在线程池中解析
+PARSE_ORDERS_OFFLOAD_THRESHOLD = 200
+# 持仓数量缓存时长（秒）
+POSITION_CACHE_TTL = 0.5
+# 终态订单信息缓存时长（秒）
+ORDER_INFO_CACHE_TTL = 0.3
+TERMINAL_ORDER_STATUSES = frozenset(('FILLED', 'CANCELED', 'REJECTED', 'EXPIRED'))
+# 无推送时订单状态轮询的退避参数：首个间隔、增长倍数、间隔上限（秒）
+POLL_BACKOFF_START = 0.025
+POLL_BACKOFF_FACTOR = 1.3
+POLL_BACKOFF_MAX = 0.5
+# 市价单在这些状态下继续等待成交
+MARKET_ORDER_PENDING = ('NEW', 'PARTIALLY_FILLED', '')
+# exchangeInfo 缓存有效期（秒）；base_url -> (monotonic_ts, {baseAsset: symbol_info})
+EXCHANGE_INFO_TTL = 15 * 60
+_EXCHANGE_INFO_CACHE = {}
+# 在协程内首次使用时创建：Python 3.8/3.9 的 asyncio.Lock 会在构造时绑定当前事件循环
+_EXCHANGE_INFO_LOCK = None
+# 订单推送回调队列长度，满时丢弃最旧的推送
+ORDER_CALLBACK_QUEUE_SIZE = 1024
+# WebSocket 心跳：库自动按该间隔发送 ping，超时未收到 pong 即关闭连接
+WS_PING_INTERVAL = 20
+WS_PING_TIMEOUT = 20
+# listenKey 续期间隔（秒），服务端 60 分钟无续期即过期
+LISTEN_KEY_KEEPALIVE_INTERVAL = 30 * 60
+
+
+def _new_http_session() -> aiohttp.ClientSession:
+    """
+    创建带连接池的长连接 HTTP 会话
+
+    输入参数: 无
+
+    输出: aiohttp.ClientSession - 复用 TCP/TLS 连接的会话
+    作用: 所有 REST 请求共用同一个会话，避免每次请求重新握手
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=64, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75),
+        timeout=aiohttp.ClientTimeout(total=10)
+    )
+
 
 class AsterWebSocketManager:
     """Aster交易所WebSocket管理器，用于处理订单更新消息"""
@@ -37,16 +201,36 @@ class AsterWebSocketManager:
         """
         self.api_key = api_key
         self.secret_key = secret_key
+        self._secret_bytes = secret_key.encode('utf-8')
+        self._hmac_template = hmac.new(self._secret_bytes, b'', _HMAC_DIGEST)
+        self._headers = {
+            'X-MBX-APIKEY': api_key,
+            'Content-Type': 'application/x-www-form-urlencoded'
+        }
         self.order_update_callback = order_update_callback
         self.websocket = None
         self.running = False
         self.base_url = "https://fapi.asterdex.com"
         self.ws_url = "wss://fstream.asterdex.com"
+        self._listen_key_url = f"{self.base_url}/fapi/v1/listenKey"
         self.listen_key = None
         self.logger = None
         self._keepalive_task = None
-        self._last_ping_time = None
+        self._listen_task = None
+        # 订单推送经队列交给单独的消费任务回调，读循环不等待下游处理
+        self._cb_queue = asyncio.Queue(maxsize=ORDER_CALLBACK_QUEUE_SIZE)
+        self._cb_task = None
+        self._next_keepalive_at = None
+        self._last_ping_time = None  # 最近一次 pong 的 monotonic 时间戳
         self.config = config
+        # 平仓方向在配置中固定，预先转为小写，避免每条订单推送重复计算
+        self._close_side = config.close_order_side.lower()
+        # 由 AsterClient 注入的共享 HTTP 会话；单独使用时在首次请求时创建
+        self.session = None
+        # symbol -> (best_bid, best_ask, monotonic_ts)，由 bookTicker 推送更新
+        self.bbo_cache = {}
+        # symbol -> 持仓数量（单向持仓模式），由 ACCOUNT_UPDATE 推送更新
+        self.positions = {}
 
     def _generate_signature(self, params: Dict[str, Any]) -> str:
         """
@@ -62,13 +246,34 @@ class AsterWebSocketManager:
         query_string = urlencode(params)
 
         # Generate HMAC SHA256 signature
-        signature = hmac.new(
-            self.secret_key.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        return self._sign(query_string)
+
+    def _sign(self, query_string: str) -> str:
+        """
+        对已编码的查询串计算 HMAC SHA256 签名
 
-        return signature
+        输入参数:
+            query_string: 已 urlencode 的参数串
+
+        输出: str - 十六进制签名
+        作用: 从预先完成密钥处理的 HMAC 模板复制状态后签名，避免每次重新做 ipad/opad
+        """
+        h = self._hmac_template.copy()
+        h.update(query_string.encode('utf-8'))
+        return h.hexdigest()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        获取共享的 HTTP 会话
+
+        输入参数: 无
+
+        输出: aiohttp.ClientSession - HTTP 会话
+        作用: 优先复用注入的会话，未注入或已关闭时懒创建
+        """
+        if self.session is None or self.session.closed:
+            self.session = _new_http_session()
+        return self.session
 
     async def _get_listen_key(self) -> str:
         """
@@ -85,22 +290,17 @@ class AsterWebSocketManager:
         signature = self._generate_signature(params)
         params['signature'] = signature
 
-        headers = {
-            'X-MBX-APIKEY': self.api_key,
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                'https://fapi.asterdex.com/fapi/v1/listenKey',
-                headers=headers,
-                data=params
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result.get('listenKey')
-                else:
-                    raise Exception(f"Failed to get listen key: {response.status}")
+        session = self._get_session()
+        async with session.post(
+            self._listen_key_url,
+            headers=self._headers,
+            data=params
+        ) as response:
+            if response.status == 200:
+                result = _json_loads(await response.read())
+                return result.get('listenKey')
+            else:
+                raise Exception(f"Failed to get listen key: {response.status}")
 
     async def _keepalive_listen_key(self) -> bool:
         """
@@ -121,25 +321,20 @@ class AsterWebSocketManager:
             signature = self._generate_signature(params)
             params['signature'] = signature
 
-            headers = {
-                'X-MBX-APIKEY': self.api_key,
-                'Content-Type': 'application/x-www-form-urlencoded'
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.put(
-                    f"{self.base_url}/fapi/v1/listenKey",
-                    headers=headers,
-                    data=params
-                ) as response:
-                    if response.status == 200:
-                        if self.logger:
-                            self.logger.log("Listen key keepalive successful", "DEBUG")
-                        return True
-                    else:
-                        if self.logger:
-                            self.logger.log(f"Failed to keepalive listen key: {response.status}", "WARNING")
-                        return False
+            session = self._get_session()
+            async with session.put(
+                self._listen_key_url,
+                headers=self._headers,
+                data=params
+            ) as response:
+                if response.status == 200:
+                    if self.logger:
+                        self.logger.log("Listen key keepalive successful", "DEBUG")
+                    return True
+                else:
+                    if self.logger:
+                        self.logger.log(f"Failed to keepalive listen key: {response.status}", "WARNING")
+                    return False
         except Exception as e:
             if self.logger:
                 self.logger.log(f"Error keeping alive listen key: {e}", "ERROR")
@@ -152,22 +347,20 @@ class AsterWebSocketManager:
         输入参数: 无
         
         输出: bool - 连接是否健康
-        作用: 基于ping时间检查WebSocket连接是否正常工作，超过10分钟未收到ping则认为连接异常
+        作用: 主动发送 ping 并等待 pong，连接已关闭或超时未响应则认为连接异常
         """
-        if not self._last_ping_time:
-            return True  # No pings received yet, assume healthy
+        if self.websocket is None:
+            return False
 
-        # Check if we haven't received a ping in the last 10 minutes
-        # (server sends pings every 5 minutes, so 10 minutes indicates a problem)
-        time_since_last_ping = time.time() - self._last_ping_time
-        if time_since_last_ping > 10 * 60:  # 10 minutes
+        try:
+            pong_waiter = await self.websocket.ping()
+            await asyncio.wait_for(pong_waiter, timeout=WS_PING_TIMEOUT)
+        except Exception as e:
             if self.logger:
-                self.logger.log(
-                    f"No ping received for {time_since_last_ping/60:.1f} minutes, "
-                    "connection may be unhealthy", "WARNING"
-                )
+                self.logger.log(f"WebSocket ping failed: {e}, connection may be unhealthy", "WARNING")
             return False
 
+        self._last_ping_time = time.monotonic()
         return True
 
     async def _start_keepalive_task(self):
@@ -201,9 +394,10 @@ class AsterWebSocketManager:
                         await asyncio.sleep(30)
                     continue
 
-                # Check if we need to keepalive the listen key (every 50 minutes)
-                if self.listen_key and time.time() % (50 * 60) < 5 * 60:  # Within 5 minutes of 50-minute mark
+                # Check if we need to keepalive the listen key (every 30 minutes)
+                if self.listen_key and time.monotonic() >= self._next_keepalive_at:
                     success = await self._keepalive_listen_key()
+                    self._next_keepalive_at = time.monotonic() + LISTEN_KEY_KEEPALIVE_INTERVAL
                     if not success:
                         if self.logger:
                             self.logger.log("Listen key keepalive failed, reconnecting...", "WARNING")
@@ -229,7 +423,19 @@ class AsterWebSocketManager:
         输入参数: 无
         
         输出: 无
-        作用: 建立与Aster WebSocket的连接，获取监听密钥并开始监听消息
+        作用: 完成握手后在后台任务中监听消息并立即返回，调用方返回时连接已可用
+        """
+        await self._open_connection()
+        self._listen_task = asyncio.create_task(self._listen())
+
+    async def _open_connection(self):
+        """
+        建立WebSocket连接
+
+        输入参数: 无
+
+        输出: 无
+        作用: 获取监听密钥、完成握手，并确保回调消费任务与保活任务在运行；重连时先关闭旧连接
         """
         try:
             # Get listen key
@@ -237,25 +443,76 @@ class AsterWebSocketManager:
             if not self.listen_key:
                 raise Exception("Failed to get listen key")
 
-            # Connect to WebSocket
-            ws_url = f"{self.ws_url}/ws/{self.listen_key}"
-            self.websocket = await websockets.connect(ws_url)
+            # Connect to WebSocket: 用户数据流与合约的 bookTicker 合并为一条组合流
+            contract_id = getattr(self.config, 'contract_id', '')
+            if contract_id:
+                ws_url = f"{self.ws_url}/stream?streams={self.listen_key}/{contract_id.lower()}@bookTicker"
+            else:
+                ws_url = f"{self.ws_url}/ws/{self.listen_key}"
+            # 旧连接关闭后其监听循环会自行退出；断线期间可能漏掉持仓推送，清空后重新由 REST 兜底
+            if self.websocket is not None:
+                await self.websocket.close()
+            self.positions.clear()
+            self.websocket = await websockets.connect(
+                ws_url, ping_interval=WS_PING_INTERVAL, ping_timeout=WS_PING_TIMEOUT
+            )
             self.running = True
 
             if self.logger:
                 self.logger.log("Connected to Aster WebSocket with listen key", "INFO")
 
-            # Start keepalive task
-            self._keepalive_task = asyncio.create_task(self._start_keepalive_task())
+            # Start order update callback consumer
+            if self._cb_task is None or self._cb_task.done():
+                self._cb_task = asyncio.create_task(self._consume_order_updates())
 
-            # Start listening for messages
-            await self._listen()
+            # Start keepalive task (重连由保活任务自身发起时沿用当前任务)
+            self._next_keepalive_at = time.monotonic() + LISTEN_KEY_KEEPALIVE_INTERVAL
+            if self._keepalive_task is None or self._keepalive_task.done():
+                self._keepalive_task = asyncio.create_task(self._start_keepalive_task())
 
         except Exception as e:
             if self.logger:
                 self.logger.log(f"WebSocket connection error: {e}", "ERROR")
             raise
 
+    async def _consume_order_updates(self):
+        """
+        消费订单推送队列
+
+        输入参数: 无
+
+        输出: 无
+        作用: 依次把队列中的订单推送交给 order_update_callback，回调异常不影响后续推送；
+              回调可以是普通函数，也可以返回需要 await 的协程
+        """
+        while True:
+            payload = await self._cb_queue.get()
+            try:
+                result = self.order_update_callback(payload)
+                if result is not None:
+                    await result
+            except Exception as e:
+                if self.logger:
+                    self.logger.log(f"Error in order update callback: {e}", "ERROR")
+
+    def _enqueue_order_update(self, payload: Dict[str, Any]) -> None:
+        """
+        将订单推送放入回调队列
+
+        输入参数:
+            payload: 标准化后的订单更新字典
+
+        输出: 无
+        作用: 非阻塞入队，队列已满时丢弃最旧的一条
+        """
+        try:
+            self._cb_queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self._cb_queue.get_nowait()
+            self._cb_queue.put_nowait(payload)
+            if self.logger:
+                self.logger.log("Order update queue full, dropped oldest update", "WARNING")
+
     async def _listen(self):
         """
         监听WebSocket消息
@@ -270,15 +527,8 @@ class AsterWebSocketManager:
                 if not self.running:
                     break
 
-                # Check if this is a ping frame (websockets library handles pong automatically)
-                if isinstance(message, bytes) and message == b'\x89\x00':  # Ping frame
-                    self._last_ping_time = time.time()
-                    if self.logger:
-                        self.logger.log("Received ping frame, sending pong", "DEBUG")
-                    continue
-
                 try:
-                    data = json.loads(message)
+                    data = _json_loads(message)
                     await self._handle_message(data)
                 except json.JSONDecodeError as e:
                     if self.logger:
@@ -305,18 +555,30 @@ class AsterWebSocketManager:
         作用: 根据消息类型分发到相应的处理函数，主要处理订单更新和监听密钥过期事件
         """
         try:
+            # 组合流消息形如 {"stream": ..., "data": {...}}
+            if 'stream' in data:
+                data = data.get('data', {})
             event_type = data.get('e', '')
 
-            if event_type == 'ORDER_TRADE_UPDATE':
+            if event_type == 'bookTicker':
+                self.bbo_cache[data.get('s', '')] = (
+                    _dec(data.get('b') or '0'), _dec(data.get('a') or '0'), time.monotonic()
+                )
+            elif event_type == 'ORDER_TRADE_UPDATE':
                 await self._handle_order_update(data)
+            elif event_type == 'ACCOUNT_UPDATE':
+                # 只记录单向持仓（positionSide 为 BOTH）；双向持仓仍走 REST
+                for position in data.get('a', {}).get('P', ()):
+                    if position.get('ps', 'BOTH') == 'BOTH':
+                        self.positions[position.get('s', '')] = abs(_dec(position.get('pa') or '0'))
             elif event_type == 'listenKeyExpired':
                 if self.logger:
                     self.logger.log("Listen key expired, reconnecting...", "WARNING")
                 # Reconnect with new listen key
                 await self.connect()
-            else:
-                if self.logger:
-                    self.logger.log(f"Unknown WebSocket message: {data}", "DEBUG")
+            elif self.logger and self.logger.isEnabledFor("DEBUG"):
+                # DEBUG 未开启时不格式化整条消息
+                self.logger.log(f"Unknown WebSocket message: {data}", "DEBUG")
 
         except Exception as e:
             if self.logger:
@@ -355,21 +617,23 @@ class AsterWebSocketManager:
             mapped_status = status_map.get(status, status)
 
             # Call the order update callback if it exists
-            if hasattr(self, 'order_update_callback') and self.order_update_callback:
-                if side.lower() == self.config.close_order_side:
+            if self.order_update_callback is not None:
+                side = side.lower()
+                if side == self._close_side:
                     order_type = "CLOSE"
                 else:
                     order_type = "OPEN"
 
-                await self.order_update_callback({
+                self._enqueue_order_update({
                     'order_id': order_id,
-                    'side': side.lower(),
+                    'side': side,
                     'order_type': order_type,
                     'status': mapped_status,
                     'size': quantity,
                     'price': price,
                     'contract_id': symbol,
-                    'filled_size': executed_qty
+                    'filled_size': executed_qty,
+                    'avg_price': order_info.get('ap', '0')
                 })
 
         except Exception as e:
@@ -387,13 +651,14 @@ class AsterWebSocketManager:
         """
         self.running = False
 
-        # Cancel keepalive task
-        if self._keepalive_task and not self._keepalive_task.done():
-            self._keepalive_task.cancel()
-            try:
-                await self._keepalive_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel keepalive task, listener and order update consumer
+        for task in (self._keepalive_task, self._listen_task, self._cb_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         if self.websocket:
             await self.websocket.close()
@@ -437,10 +702,54 @@ class AsterClient(BaseExchangeClient):
             raise ValueError(
                 "ASTER_API_KEY and ASTER_SECRET_KEY must be set in environment variables"
             )
+        self._secret_bytes = self.secret_key.encode('utf-8')
+        self._hmac_template = hmac.new(self._secret_bytes, b'', _HMAC_DIGEST)
+        # 请求头与各端点完整 URL 只构造一次（aiohttp 不会修改传入的 headers）
+        self._headers = {
+            'X-MBX-APIKEY': self.api_key,
+            'Content-Type': 'application/x-www-form-urlencoded'
+        }
+        self._urls = {}
 
         # Initialize logger early
         self.logger = TradingLogger(exchange="aster", ticker=self.config.ticker, log_to_console=False)
         self._order_update_handler = None
+        self._handler_is_coro = False
+        # symbol -> (best_bid, best_ask, monotonic_ts)，由 WebSocket bookTicker 推送维护
+        self._bbo_cache = {}
+        # symbol -> (monotonic_ts, best_bid, best_ask)，REST 回退结果的短时缓存
+        self._bbo_mem = {}
+        # order_id -> (最近一次推送的交易所订单状态, 成交均价)，以及等待该订单状态变化的事件
+        self._order_updates = {}
+        self._order_events = {}
+        # order_id -> (monotonic_ts, OrderInfo) 终态订单信息缓存；order_id -> 进行中的查询任务
+        self._order_info_cache = {}
+        self._order_info_inflight = {}
+        # 等待合并提交的撤单请求 [(order_id, future)] 及负责提交的任务
+        self._pending_cancels = []
+        self._cancel_flush_task = None
+        # symbol -> 持仓数量，由 WebSocket ACCOUNT_UPDATE 推送维护，仅在推送连接运行时使用
+        self._positions = {}
+        # (monotonic_ts, 查询的 contract_id, {symbol: 持仓数量}) 短时持仓缓存
+        self._pos_cache = None
+        # 价格步长的浮点值与小数位数，价格计算在整数 tick 上进行，仅在下单时格式化
+        self._tick_float = None
+        self._price_decimals = 0
+        # 长连接 HTTP 会话，在 connect() 或首次请求时创建，disconnect() 时关闭
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        获取长连接 HTTP 会话
+
+        输入参数: 无
+
+        输出: aiohttp.ClientSession - HTTP 会话
+        作用: 懒创建带连接池的会话，使 REST 请求复用已建立的 TCP/TLS 连接
+        """
+        if self._session is None or self._session.closed:
+            self._session = _new_http_session()
+        return self._session
 
     def _validate_config(self) -> None:
         """
@@ -470,13 +779,21 @@ class AsterClient(BaseExchangeClient):
         query_string = urlencode(params)
 
         # Generate HMAC SHA256 signature
-        signature = hmac.new(
-            self.secret_key.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        return self._sign(query_string)
 
-        return signature
+    def _sign(self, query_string: str) -> str:
+        """
+        对已编码的查询串计算 HMAC SHA256 签名
+
+        输入参数:
+            query_string: 已 urlencode 的参数串
+
+        输出: str - 十六进制签名
+        作用: 从预先完成密钥处理的 HMAC 模板复制状态后签名，避免每次重新做 ipad/opad
+        """
+        h = self._hmac_template.copy()
+        h.update(query_string.encode('utf-8'))
+        return h.hexdigest()
 
     async def _make_request(
         self, method: str, endpoint: str, params: Dict[str, Any] = None, data: Dict[str, Any] = None
@@ -503,45 +820,31 @@ class AsterClient(BaseExchangeClient):
         params['timestamp'] = timestamp
         params['recvWindow'] = 5000
 
-        url = f"{self.base_url}{endpoint}"
-        headers = {
-            'X-MBX-APIKEY': self.api_key,
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
-
-        async with aiohttp.ClientSession() as session:
-            if method.upper() == 'GET':
-                # For GET requests, signature is based on query parameters only
-                signature = self._generate_signature(params)
-                params['signature'] = signature
-
-                async with session.get(url, params=params, headers=headers) as response:
-                    result = await response.json()
-                    if response.status != 200:
-                        raise Exception(f"API request failed: {result}")
-                    return result
-            elif method.upper() == 'POST':
-                # For POST requests, signature must include both query string and request body
-                # According to Aster API docs: totalParams = queryString + requestBody
-                all_params = {**params, **data}
-                signature = self._generate_signature(all_params)
-                all_params['signature'] = signature
-
-                async with session.post(url, data=all_params, headers=headers) as response:
-                    result = await response.json()
-                    if response.status != 200:
-                        raise Exception(f"API request failed: {result}")
-                    return result
-            elif method.upper() == 'DELETE':
-                # For DELETE requests, signature is based on query parameters only
-                signature = self._generate_signature(params)
-                params['signature'] = signature
-
-                async with session.delete(url, params=params, headers=headers) as response:
-                    result = await response.json()
-                    if response.status != 200:
-                        raise Exception(f"API request failed: {result}")
-                    return result
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = f"{self.base_url}{endpoint}"
+
+        method = method.upper()
+        if method == 'POST':
+            # For POST requests, signature must include both query string and request body
+            # According to Aster API docs: totalParams = queryString + requestBody
+            # 参数串只编码一次，同一份字符串既用于签名也直接作为请求体发送
+            query_string = urlencode(list(params.items()) + list(data.items()))
+            request_kwargs = {'data': f"{query_string}&signature={self._sign(query_string)}"}
+        else:
+            # For GET/DELETE requests, signature is based on query parameters only
+            # 查询串同样只编码一次并原样拼到 URL 上（encoded=True 禁止再次转义），
+            # 避免 params= 交给 aiohttp 重新编码后与签名串不一致（如批量撤单的逗号）
+            query_string = urlencode(params)
+            url = URL(f"{url}?{query_string}&signature={self._sign(query_string)}", encoded=True)
+            request_kwargs = {}
+
+        session = self._get_session()
+        async with session.request(method, url, headers=self._headers, **request_kwargs) as response:
+            result = _json_loads(await response.read())
+            if response.status != 200:
+                raise Exception(f"API request failed: {result}")
+            return result
 
     async def connect(self) -> None:
         """
@@ -559,15 +862,18 @@ class AsterClient(BaseExchangeClient):
             secret_key=self.secret_key,
             order_update_callback=self._handle_websocket_order_update
         )
+        # listenKey 的申请/续期与 REST 请求共用同一个连接池
+        self.ws_manager.session = self._get_session()
+        # bookTicker / ACCOUNT_UPDATE 推送直接写入客户端的盘口与持仓缓存
+        self.ws_manager.bbo_cache = self._bbo_cache
+        self.ws_manager.positions = self._positions
 
         # Set logger for WebSocket manager
         self.ws_manager.set_logger(self.logger)
 
         try:
-            # Start WebSocket connection in background task
-            asyncio.create_task(self.ws_manager.connect())
-            # Wait a moment for connection to establish
-            await asyncio.sleep(2)
+            # 握手完成后返回，消息监听在后台任务中进行
+            await self.ws_manager.connect()
         except Exception as e:
             self.logger.log(f"Error connecting to Aster WebSocket: {e}", "ERROR")
             raise
@@ -586,6 +892,21 @@ class AsterClient(BaseExchangeClient):
                 await self.ws_manager.disconnect()
         except Exception as e:
             self.logger.log(f"Error during Aster disconnect: {e}", "ERROR")
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """
+        关闭长连接 HTTP 会话
+
+        输入参数: 无
+
+        输出: 无
+        作用: 释放连接池；只用过 REST 接口（未调用 connect）的客户端也应在退出前调用
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     def get_exchange_name(self) -> str:
         """
@@ -609,24 +930,166 @@ class AsterClient(BaseExchangeClient):
         作用: 设置用于处理WebSocket订单更新消息的回调函数
         """
         self._order_update_handler = handler
+        self._handler_is_coro = asyncio.iscoroutinefunction(handler)
 
-    async def _handle_websocket_order_update(self, order_data: Dict[str, Any]):
+    def _handle_websocket_order_update(self, order_data: Dict[str, Any]):
         """
         处理来自WebSocket的订单更新
         
         输入参数:
             order_data: 订单更新数据字典
         
+        输出: 处理器为协程函数时返回其协程，由调用方 await；否则为 None
+        作用: 记录订单状态后直接分发给订单更新处理器，同步处理器不再额外包一层协程
+        """
+        self._record_order_status(order_data)
+        handler = self._order_update_handler
+        if handler is None:
+            return None
+        if self._handler_is_coro:
+            return handler(order_data)
+        handler(order_data)
+        return None
+
+    def _set_tick_size(self, tick_size: Decimal) -> None:
+        """
+        缓存价格步长的整数 tick 换算参数
+
+        输入参数:
+            tick_size: 价格最小变动单位
+
         输出: 无
-        作用: 处理WebSocket接收到的订单更新消息，调用设置的订单更新处理器
+        作用: 预先计算浮点步长和小数位数，供 _price_ticks / _ticks_to_str 使用
         """
+        tick_size = Decimal(tick_size)
+        self._tick_float = float(tick_size)
+        self._price_decimals = max(0, -tick_size.as_tuple().exponent)
+
+    def _price_ticks(self, price) -> int:
+        """
+        将价格换算为整数 tick 数（四舍五入）
+
+        输入参数:
+            price: 价格
+
+        输出: int - tick 数
+        作用: 报价计算在整数上完成，避免每次尝试都构造多个 Decimal
+        """
+        if self._tick_float is None:
+            self._set_tick_size(self.config.tick_size)
+        return math.floor(float(price) / self._tick_float + 0.5)
+
+    def _ticks_to_str(self, ticks: int) -> str:
+        """
+        将整数 tick 数格式化为下单用的价格字符串
+
+        输入参数:
+            ticks: tick 数
+
+        输出: str - 按步长小数位数格式化的价格
+        作用: 只在请求边界把整数 tick 转回价格
+        """
+        return f"{ticks * self._tick_float:.{self._price_decimals}f}"
+
+    def _record_order_status(self, order_data: Dict[str, Any]) -> None:
+        """
+        记录推送的订单状态并唤醒等待者
+
+        输入参数:
+            order_data: 订单更新数据字典
+
+        输出: 无
+        作用: 保存最新的交易所订单状态（OPEN 还原为 NEW）与成交均价，并触发对应订单的等待事件
+        """
+        order_id = str(order_data.get('order_id', ''))
+        status = order_data.get('status', '')
+        self._order_updates[order_id] = ('NEW' if status == 'OPEN' else status, order_data.get('avg_price', '0'))
+        if len(self._order_updates) > ORDER_STATUS_CACHE_SIZE:
+            del self._order_updates[next(iter(self._order_updates))]
+        # 有成交则持仓已变化：REST 缓存失效，推送持仓也先移除，直到该成交的 ACCOUNT_UPDATE 到达前改查 REST
+        if status in ('FILLED', 'PARTIALLY_FILLED'):
+            self._pos_cache = None
+            self._positions.pop(order_data.get('contract_id'), None)
+        event = self._order_events.get(order_id)
+        if event is not None:
+            event.set()
+
+    def _ws_running(self) -> bool:
+        """
+        WebSocket 订单推送是否可用
+
+        输入参数: 无
+
+        输出: bool - 推送连接是否在运行
+        作用: 推送不可用时订单等待退回到 REST 轮询
+        """
+        ws_manager = getattr(self, 'ws_manager', None)
+        return ws_manager is not None and ws_manager.running
+
+    async def _wait_order_status(self, order_id: str, order_status: str, timeout: float = 2,
+                                 pending: Tuple[str, ...] = ('NEW',)) -> Tuple[str, Optional[Decimal]]:
+        """
+        等待订单离开等待状态
+
+        输入参数:
+            order_id: 订单ID
+            order_status: 下单接口返回的订单状态
+            timeout: 最长等待秒数
+            pending: 视为仍需等待的订单状态
+
+        输出: Tuple[str, Optional[Decimal]] - (订单最新状态, 成交均价，未知时为 None)
+        作用: 由 WebSocket 订单推送唤醒，代替轮询 REST；超时仍在等待状态时才查询一次订单信息。
+              推送不可用时按指数退避轮询：快速成交能尽早发现，慢成交也不会频繁请求
+        """
+        order_id = str(order_id)
+        avg_price = None
+        # 单调时钟整数纳秒截止时间，不受 NTP 校时影响
+        deadline_ns = time.monotonic_ns() + int(timeout * 1_000_000_000)
+
+        if not self._ws_running():
+            delay = POLL_BACKOFF_START
+            while order_status in pending:
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                if remaining_ns <= 0:
+                    break
+                await asyncio.sleep(min(delay, remaining_ns / 1_000_000_000))
+                delay = min(delay * POLL_BACKOFF_FACTOR, POLL_BACKOFF_MAX)
+                order_info = await self.get_order_info(order_id)
+                if order_info is not None:
+                    order_status, avg_price = order_info.status, order_info.price
+            return order_status, avg_price
+
+        event = self._order_events[order_id] = asyncio.Event()
+        update = None
         try:
-            if self._order_update_handler:
-                self._order_update_handler(order_data)
-        except Exception as e:
-            self.logger.log(f"Error handling WebSocket order update: {e}", "ERROR")
+            # 推送可能先于下单响应到达
+            update = self._order_updates.get(order_id)
+            if update is not None:
+                order_status = update[0]
+            while order_status in pending:
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                if remaining_ns <= 0:
+                    break
+                event.clear()
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=remaining_ns / 1_000_000_000)
+                except asyncio.TimeoutError:
+                    break
+                update = self._order_updates.get(order_id, update)
+                if update is not None:
+                    order_status = update[0]
+        finally:
+            self._order_events.pop(order_id, None)
+            self._order_updates.pop(order_id, None)
+
+        if update is not None and _dec(update[1] or '0') > 0:
+            avg_price = _dec(update[1])
+        if order_status in pending:
+            order_info = await self.get_order_info(order_id)
+            if order_info is not None:
+                order_status, avg_price = order_info.status, order_info.price
+        return order_status, avg_price
 
-    @query_retry(default_return=(0, 0))
     async def fetch_bbo_prices(self, contract_id: str) -> Tuple[Decimal, Decimal]:
         """
         从Aster获取最佳买卖价格
@@ -635,12 +1098,37 @@ class AsterClient(BaseExchangeClient):
             contract_id: 合约ID
         
         输出: Tuple[Decimal, Decimal] - (最佳买价, 最佳卖价)
-        作用: 获取指定合约的最佳买价和卖价，用于订单价格计算
+        作用: 优先返回 WebSocket bookTicker 推送的新鲜盘口，其次复用极短时间内的 REST 结果，
+              都不可用时才发起 REST 查询
+        """
+        now = time.monotonic()
+        cached = self._bbo_cache.get(contract_id)
+        if cached is not None and now - cached[2] < BBO_CACHE_MAX_AGE:
+            return cached[0], cached[1]
+        cached = self._bbo_mem.get(contract_id)
+        if cached is not None and now - cached[0] < BBO_REST_CACHE_TTL:
+            return cached[1], cached[2]
+
+        best_bid, best_ask = await self._fetch_bbo_prices_rest(contract_id)
+        if best_bid > 0 and best_ask > 0:
+            self._bbo_mem[contract_id] = (time.monotonic(), best_bid, best_ask)
+        return best_bid, best_ask
+
+    @query_retry(default_return=(0, 0))
+    async def _fetch_bbo_prices_rest(self, contract_id: str) -> Tuple[Decimal, Decimal]:
+        """
+        通过 REST 接口获取最佳买卖价格
+
+        输入参数:
+            contract_id: 合约ID
+
+        输出: Tuple[Decimal, Decimal] - (最佳买价, 最佳卖价)
+        作用: 盘口缓存不可用时的回退路径，带重试
         """
         result = await self._make_request('GET', '/fapi/v1/ticker/bookTicker', {'symbol': contract_id})
 
-        best_bid = Decimal(result.get('bidPrice', 0))
-        best_ask = Decimal(result.get('askPrice', 0))
+        best_bid = _dec(result.get('bidPrice') or '0')
+        best_ask = _dec(result.get('askPrice') or '0')
 
         return best_bid, best_ask
 
@@ -661,11 +1149,11 @@ class AsterClient(BaseExchangeClient):
 
         if direction == 'buy':
             # For buy orders, place slightly below best ask to ensure execution
-            order_price = best_ask - self.config.tick_size
+            price_ticks = self._price_ticks(best_ask) - 1
         else:
             # For sell orders, place slightly above best bid to ensure execution
-            order_price = best_bid + self.config.tick_size
-        return order_price
+            price_ticks = self._price_ticks(best_bid) + 1
+        return Decimal(self._ticks_to_str(price_ticks))
 
     async def place_open_order(self, contract_id: str, quantity: Decimal, direction: str) -> OrderResult:
         """
@@ -684,7 +1172,10 @@ class AsterClient(BaseExchangeClient):
             attempt += 1
             if attempt % 5 == 0:
                 self.logger.log(f"[OPEN] Attempt {attempt} to place order", "INFO")
-                active_orders = await self.get_active_orders(contract_id)
+                # 挂单检查与盘口查询互不依赖，并发请求
+                active_orders, (best_bid, best_ask) = await asyncio.gather(
+                    self.get_active_orders(contract_id), self.fetch_bbo_prices(contract_id)
+                )
                 active_open_orders = 0
                 for order in active_orders:
                     if order.side == self.config.direction:
@@ -692,8 +1183,8 @@ class AsterClient(BaseExchangeClient):
                 if active_open_orders > 1:
                     self.logger.log(f"[OPEN] ERROR: Active open orders abnormal: {active_open_orders}", "ERROR")
                     raise Exception(f"[OPEN] ERROR: Active open orders abnormal: {active_open_orders}")
-
-            best_bid, best_ask = await self.fetch_bbo_prices(contract_id)
+            else:
+                best_bid, best_ask = await self.fetch_bbo_prices(contract_id)
 
             if best_bid <= 0 or best_ask <= 0:
                 return OrderResult(success=False, error_message='Invalid bid/ask prices')
@@ -701,12 +1192,13 @@ class AsterClient(BaseExchangeClient):
             # Determine order side and price
             if direction == 'buy':
                 # For buy orders, place slightly below best ask to ensure execution
-                price = best_ask - self.config.tick_size
+                price_ticks = self._price_ticks(best_ask) - 1
             elif direction == 'sell':
                 # For sell orders, place slightly above best bid to ensure execution
-                price = best_bid + self.config.tick_size
+                price_ticks = self._price_ticks(best_bid) + 1
             else:
                 raise Exception(f"[OPEN] Invalid direction: {direction}")
+            price_str = self._ticks_to_str(price_ticks)
 
             # Place the order
             order_data = {
@@ -714,21 +1206,21 @@ class AsterClient(BaseExchangeClient):
                 'side': direction.upper(),
                 'type': 'LIMIT',
                 'quantity': str(quantity),
-                'price': str(price),
+                'price': price_str,
                 'timeInForce': 'GTX'  # GTX is Good Till Crossing (Post Only)
             }
 
             result = await self._make_request('POST', '/fapi/v1/order', data=order_data)
-            order_status = result.get('status', '')
-            order_id = result.get('orderId', '')
+            # 正常下单响应字段齐全，直接下标访问；仅在异常响应时回退到带默认值的 get
+            try:
+                order_status, order_id = result['status'], result['orderId']
+            except KeyError:
+                order_status, order_id = result.get('status', ''), result.get('orderId', '')
 
-            start_time = time.time()
-            while order_status == 'NEW' and time.time() - start_time < 2:
-                await asyncio.sleep(0.1)
-                order_info = await self.get_order_info(order_id)
-                if order_info is not None:
-                    order_status = order_info.status
+            if order_status == 'NEW':
+                order_status, _ = await self._wait_order_status(order_id, order_status)
 
+            price = Decimal(price_str)
             if order_status in ['NEW', 'PARTIALLY_FILLED']:
                 return OrderResult(success=True, order_id=order_id, side=direction, size=quantity, price=price, status='OPEN')
             elif order_status == 'FILLED':
@@ -774,7 +1266,10 @@ class AsterClient(BaseExchangeClient):
             attempt += 1
             if attempt % 5 == 0:
                 self.logger.log(f"[CLOSE] Attempt {attempt} to place order", "INFO")
-                current_close_orders = await self._get_active_close_orders(contract_id)
+                # 挂单检查与盘口查询互不依赖，并发请求
+                current_close_orders, (best_bid, best_ask) = await asyncio.gather(
+                    self._get_active_close_orders(contract_id), self.fetch_bbo_prices(contract_id)
+                )
 
                 if current_close_orders - active_close_orders > 1:
                     self.logger.log(f"[CLOSE] ERROR: Active close orders abnormal: "
@@ -783,26 +1278,28 @@ class AsterClient(BaseExchangeClient):
                                     f"{active_close_orders}, {current_close_orders}")
                 else:
                     active_close_orders = current_close_orders
-            # Get current market prices to adjust order price if needed
-            best_bid, best_ask = await self.fetch_bbo_prices(contract_id)
+            else:
+                # Get current market prices to adjust order price if needed
+                best_bid, best_ask = await self.fetch_bbo_prices(contract_id)
 
             if best_bid <= 0 or best_ask <= 0:
                 return OrderResult(success=False, error_message='No bid/ask data available')
 
             # Adjust order price based on market conditions and side
-            adjusted_price = price
+            price_ticks = self._price_ticks(price)
             if side.lower() == 'sell':
                 order_side = 'SELL'
                 # For sell orders, ensure price is above best bid to be a maker order
                 if price <= best_bid:
-                    adjusted_price = best_bid + self.config.tick_size
+                    price_ticks = self._price_ticks(best_bid) + 1
             elif side.lower() == 'buy':
                 order_side = 'BUY'
                 # For buy orders, ensure price is below best ask to be a maker order
                 if price >= best_ask:
-                    adjusted_price = best_ask - self.config.tick_size
+                    price_ticks = self._price_ticks(best_ask) - 1
 
-            adjusted_price = self.round_to_tick(adjusted_price)
+            price_str = self._ticks_to_str(price_ticks)
+            adjusted_price = Decimal(price_str)
 
             # Place the order
             order_data = {
@@ -810,20 +1307,19 @@ class AsterClient(BaseExchangeClient):
                 'side': order_side,
                 'type': 'LIMIT',
                 'quantity': str(quantity),
-                'price': str(adjusted_price),
+                'price': price_str,
                 'timeInForce': 'GTX'  # GTX is Good Till Crossing (Post Only)
             }
 
             result = await self._make_request('POST', '/fapi/v1/order', data=order_data)
-            order_status = result.get('status', '')
-            order_id = result.get('orderId', '')
+            # 正常下单响应字段齐全，直接下标访问；仅在异常响应时回退到带默认值的 get
+            try:
+                order_status, order_id = result['status'], result['orderId']
+            except KeyError:
+                order_status, order_id = result.get('status', ''), result.get('orderId', '')
 
-            start_time = time.time()
-            while order_status == 'NEW' and time.time() - start_time < 2:
-                await asyncio.sleep(0.1)
-                order_info = await self.get_order_info(order_id)
-                if order_info is not None:
-                    order_status = order_info.status
+            if order_status == 'NEW':
+                order_status, _ = await self._wait_order_status(order_id, order_status)
 
             if order_status in ['NEW', 'PARTIALLY_FILLED']:
                 return OrderResult(success=True, order_id=order_id, side=order_side.lower(),
@@ -861,19 +1357,33 @@ class AsterClient(BaseExchangeClient):
         }
 
         result = await self._make_request('POST', '/fapi/v1/order', data=order_data)
-        order_status = result.get('status', '')
-        order_id = result.get('orderId', '')
+        try:
+            order_status, order_id = result['status'], result['orderId']
+        except KeyError:
+            order_status, order_id = result.get('status', ''), result.get('orderId', '')
 
-        start_time = time.time()
-        while order_status != 'FILLED' and time.time() - start_time < 10:
-            await asyncio.sleep(0.2)
+        # 等待成交推送；推送不可用时退避轮询
+        order_status, fill_price = await self._wait_order_status(
+            order_id, order_status, timeout=10, pending=MARKET_ORDER_PENDING
+        )
+        if order_status == 'FILLED' and fill_price is None:
             order_info = await self.get_order_info(order_id)
             if order_info is not None:
-                order_status = order_info.status
+                fill_price = order_info.price
 
         if order_status != 'FILLED':
             self.logger.log(f"Market order failed with status: {order_status}", "ERROR")
-            sys.exit(1)
+            # 撤掉未成交的残余订单，返回失败结果交由调用方处理，不再终止进程
+            cancel_result = await self.cancel_order(order_id)
+            return OrderResult(
+                success=False,
+                order_id=order_id,
+                side=direction.lower(),
+                size=quantity,
+                status=order_status,
+                filled_size=cancel_result.filled_size,
+                error_message=f"Market order not filled within 10s: {order_status}"
+            )
         # For market orders, we expect them to be filled immediately
         else:
             return OrderResult(
@@ -881,7 +1391,7 @@ class AsterClient(BaseExchangeClient):
                 order_id=order_id,
                 side=direction.lower(),
                 size=quantity,
-                price=order_info.price,
+                price=fill_price,
                 status='FILLED'
             )
 
@@ -893,23 +1403,98 @@ class AsterClient(BaseExchangeClient):
             order_id: 订单ID
         
         输出: OrderResult - 订单结果对象
-        作用: 取消指定ID的订单，返回已成交数量信息
+        作用: 取消指定ID的订单，返回已成交数量信息；极短时间窗口内的多个撤单合并为一次批量撤单
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_cancels.append((order_id, future))
+        if self._cancel_flush_task is None or self._cancel_flush_task.done():
+            self._cancel_flush_task = asyncio.ensure_future(self._flush_cancels())
+        return await future
+
+    async def _flush_cancels(self) -> None:
+        """
+        提交合并窗口内积攒的撤单请求
+
+        输入参数: 无
+
+        输出: 无
+        作用: 等待一个合并窗口后批量撤单，并把各自的结果交还给等待中的 cancel_order 调用
+        """
+        while self._pending_cancels:
+            await asyncio.sleep(CANCEL_COALESCE_WINDOW)
+            pending, self._pending_cancels = self._pending_cancels, []
+            try:
+                results = await self.cancel_orders([order_id for order_id, _ in pending])
+            except Exception as e:
+                results = [OrderResult(success=False, error_message=str(e))] * len(pending)
+            for (_, future), result in zip(pending, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def cancel_orders(self, order_ids: List[str]) -> List[OrderResult]:
+        """
+        批量取消订单
+
+        输入参数:
+            order_ids: 订单ID列表
+
+        输出: List[OrderResult] - 与 order_ids 一一对应的订单结果
+        作用: 每 BATCH_CANCEL_MAX 个订单合并为一次 DELETE /fapi/v1/batchOrders 请求，各批并发发送；
+              单个订单直接走单笔撤单接口
+        """
+        if len(order_ids) == 1:
+            try:
+                result = await self._make_request('DELETE', '/fapi/v1/order', {
+                    'symbol': self.config.contract_id,
+                    'orderId': order_ids[0]
+                })
+                return [self._cancel_result(result)]
+            except Exception as e:
+                return [OrderResult(success=False, error_message=str(e))]
+
+        batches = [order_ids[i:i + BATCH_CANCEL_MAX] for i in range(0, len(order_ids), BATCH_CANCEL_MAX)]
+        batch_results = await asyncio.gather(*(self._cancel_batch(batch) for batch in batches))
+        return [result for results in batch_results for result in results]
+
+    async def _cancel_batch(self, order_ids: List[str]) -> List[OrderResult]:
+        """
+        发送一次批量撤单请求
+
+        输入参数:
+            order_ids: 不超过 BATCH_CANCEL_MAX 个订单ID
+
+        输出: List[OrderResult] - 与 order_ids 一一对应的订单结果
+        作用: 请求失败或返回格式异常时，整批返回失败结果
         """
         try:
-            result = await self._make_request('DELETE', '/fapi/v1/order', {
+            result = await self._make_request('DELETE', '/fapi/v1/batchOrders', {
                 'symbol': self.config.contract_id,
-                'orderId': order_id
+                'orderIdList': json.dumps([int(order_id) for order_id in order_ids], separators=(',', ':'))
             })
+        except Exception as e:
+            return [OrderResult(success=False, error_message=str(e)) for _ in order_ids]
 
-            if 'orderId' in result:
-                return OrderResult(success=True, filled_size=Decimal(result.get('executedQty', 0)))
-            else:
-                return OrderResult(success=False, error_message=result.get('msg', 'Unknown error'))
+        if not isinstance(result, list) or len(result) != len(order_ids):
+            return [OrderResult(success=False, error_message=f"Unexpected batch cancel response: {result}")
+                    for _ in order_ids]
+        return [self._cancel_result(item) for item in result]
 
-        except Exception as e:
-            return OrderResult(success=False, error_message=str(e))
+    @staticmethod
+    def _cancel_result(result: Dict[str, Any]) -> OrderResult:
+        """
+        将撤单接口返回的单个订单转换为结果对象
+
+        输入参数:
+            result: 单个订单的撤单响应
+
+        输出: OrderResult - 订单结果对象
+        作用: 单笔与批量撤单共用同一套结果判定
+        """
+        if 'orderId' in result:
+            return OrderResult(success=True, filled_size=_dec(result.get('executedQty') or '0'))
+        else:
+            return OrderResult(success=False, error_message=result.get('msg', 'Unknown error'))
 
-    @query_retry()
     async def get_order_info(self, order_id: str) -> Optional[OrderInfo]:
         """
         获取订单信息
@@ -918,30 +1503,47 @@ class AsterClient(BaseExchangeClient):
             order_id: 订单ID
         
         输出: Optional[OrderInfo] - 订单信息对象，如果订单不存在则返回None
-        作用: 根据订单ID查询订单的详细信息，包括状态、价格、数量等
+        作用: 根据订单ID查询订单的详细信息，包括状态、价格、数量等；同一订单的并发查询合并为一次请求，
+              已进入终态的订单信息短时缓存（未终结的状态不缓存，以免轮询读到旧状态）
+        """
+        key = str(order_id)
+        hit = self._order_info_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ORDER_INFO_CACHE_TTL:
+            return hit[1]
+
+        task = self._order_info_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_order_info(order_id))
+            self._order_info_inflight[key] = task
+            task.add_done_callback(lambda _: self._order_info_inflight.pop(key, None))
+        # shield：单个调用方被取消时不影响其他等待同一请求的调用方
+        order_info = await asyncio.shield(task)
+
+        if order_info is not None and order_info.status in TERMINAL_ORDER_STATUSES:
+            self._order_info_cache[key] = (time.monotonic(), order_info)
+            if len(self._order_info_cache) > ORDER_STATUS_CACHE_SIZE:
+                del self._order_info_cache[next(iter(self._order_info_cache))]
+        return order_info
+
+    @query_retry()
+    async def _fetch_order_info(self, order_id: str) -> Optional[OrderInfo]:
+        """
+        通过 REST 接口查询订单信息
+
+        输入参数:
+            order_id: 订单ID
+
+        输出: Optional[OrderInfo] - 订单信息对象，如果订单不存在则返回None
+        作用: get_order_info 的实际请求路径，带重试
         """
         result = await self._make_request('GET', '/fapi/v1/order', {
             'symbol': self.config.contract_id,
             'orderId': order_id
         })
 
-        order_type = result.get('type', '')
-        if order_type == 'MARKET':
-            price = Decimal(result.get('avgPrice', 0))
-        else:
-            price = Decimal(result.get('price', 0))
-
-        if 'orderId' in result:
-            return OrderInfo(
-                order_id=str(result['orderId']),
-                side=result.get('side', '').lower(),
-                size=Decimal(result.get('origQty', 0)),
-                price=price,
-                status=result.get('status', ''),
-                filled_size=Decimal(result.get('executedQty', 0)),
-                remaining_size=Decimal(result.get('origQty', 0)) - Decimal(result.get('executedQty', 0))
-            )
-        return None
+        if 'orderId' not in result:
+            return None
+        return _parse_order_dict(result)
 
     @query_retry(default_return=[])
     async def get_active_orders(self, contract_id: str) -> List[OrderInfo]:
@@ -956,19 +1558,10 @@ class AsterClient(BaseExchangeClient):
         """
         result = await self._make_request('GET', '/fapi/v1/openOrders', {'symbol': contract_id})
 
-        orders = []
-        for order in result:
-            orders.append(OrderInfo(
-                order_id=str(order['orderId']),
-                side=order.get('side', '').lower(),
-                size=Decimal(order.get('origQty', 0)) - Decimal(order.get('executedQty', 0)),
-                price=Decimal(order.get('price', 0)),
-                status=order.get('status', ''),
-                filled_size=Decimal(order.get('executedQty', 0)),
-                remaining_size=Decimal(order.get('origQty', 0)) - Decimal(order.get('executedQty', 0))
-            ))
-
-        return orders
+        # 挂单很多时解析放到线程池，避免阻塞事件循环上的 WebSocket 读取
+        if len(result) > PARSE_ORDERS_OFFLOAD_THRESHOLD:
+            return await asyncio.get_running_loop().run_in_executor(None, _parse_orders, result)
+        return _parse_orders(result)
 
     @query_retry(reraise=True)
     async def get_account_positions(self) -> Decimal:
@@ -978,16 +1571,64 @@ class AsterClient(BaseExchangeClient):
         输入参数: 无
         
         输出: Decimal - 持仓数量
-        作用: 获取当前账户在指定合约上的持仓数量
+        作用: 获取当前账户在指定合约上的持仓数量；优先使用 ACCOUNT_UPDATE 推送的持仓（无网络请求），
+              尚未收到推送时查询 REST，结果短时缓存，收到成交推送时失效
         """
-        result = await self._make_request('GET', '/fapi/v2/positionRisk', {'symbol': self.config.contract_id})
-
-        for position in result:
-            if position.get('symbol') == self.config.contract_id:
-                position_amt = abs(Decimal(position.get('positionAmt', 0)))
+        contract_id = self.config.contract_id
+        if self._ws_running():
+            position_amt = self._positions.get(contract_id)
+            if position_amt is not None:
                 return position_amt
 
-        return Decimal(0)
+        cached = self._pos_cache
+        if (cached is not None and time.monotonic() - cached[0] < POSITION_CACHE_TTL
+                and (cached[1] == contract_id or contract_id in cached[2])):
+            return cached[2].get(contract_id, _DEC_ZERO)
+
+        result = await self._make_request('GET', '/fapi/v2/positionRisk', {'symbol': contract_id})
+
+        # 接口偶尔忽略 symbol 过滤返回全部持仓，按 symbol 建索引后整体缓存
+        by_symbol = {p.get('symbol'): abs(_dec(p.get('positionAmt') or '0')) for p in result}
+        self._pos_cache = (time.monotonic(), contract_id, by_symbol)
+        return by_symbol.get(contract_id, _DEC_ZERO)
+
+    async def _get_usdt_symbols(self) -> Dict[str, Dict[str, Any]]:
+        """
+        获取按 baseAsset 索引的 USDT 合约信息
+
+        输入参数: 无
+
+        输出: Dict[str, Dict[str, Any]] - {baseAsset: symbol_info}，仅含 TRADING 状态的 USDT 合约
+        作用: exchangeInfo 体积大且很少变化，进程内按 TTL 缓存解析后的索引；刷新失败时沿用旧缓存
+        """
+        cached = _EXCHANGE_INFO_CACHE.get(self.base_url)
+        if cached is not None and time.monotonic() - cached[0] < EXCHANGE_INFO_TTL:
+            return cached[1]
+
+        global _EXCHANGE_INFO_LOCK
+        if _EXCHANGE_INFO_LOCK is None:
+            _EXCHANGE_INFO_LOCK = asyncio.Lock()
+        async with _EXCHANGE_INFO_LOCK:
+            # 等锁期间可能已被其他协程刷新
+            cached = _EXCHANGE_INFO_CACHE.get(self.base_url)
+            if cached is not None and time.monotonic() - cached[0] < EXCHANGE_INFO_TTL:
+                return cached[1]
+
+            try:
+                result = await self._make_request('GET', '/fapi/v1/exchangeInfo')
+            except Exception as e:
+                if cached is None:
+                    raise
+                self.logger.log(f"Failed to refresh exchangeInfo, using cached copy: {e}", "WARNING")
+                return cached[1]
+
+            # 同一 baseAsset 保留首个匹配项，与原先线性查找的结果一致
+            symbols = {}
+            for symbol_info in result['symbols']:
+                if symbol_info.get('status') == 'TRADING' and symbol_info.get('quoteAsset') == 'USDT':
+                    symbols.setdefault(symbol_info.get('baseAsset'), symbol_info)
+            _EXCHANGE_INFO_CACHE[self.base_url] = (time.monotonic(), symbols)
+            return symbols
 
     async def get_contract_attributes(self) -> Tuple[str, Decimal]:
         """
@@ -1004,43 +1645,41 @@ class AsterClient(BaseExchangeClient):
             raise ValueError("Ticker is empty")
 
         try:
-            result = await self._make_request('GET', '/fapi/v1/exchangeInfo')
-
-            for symbol_info in result['symbols']:
-                if (symbol_info.get('status') == 'TRADING' and
-                        symbol_info.get('baseAsset') == ticker and
-                        symbol_info.get('quoteAsset') == 'USDT'):
-
-                    self.config.contract_id = symbol_info.get('symbol', '')
-
-                    # Get tick size from filters
-                    for filter_info in symbol_info.get('filters', []):
-                        if filter_info.get('filterType') == 'PRICE_FILTER':
-                            self.config.tick_size = Decimal(filter_info['tickSize'].strip('0'))
-                            break
-
-                    # Get minimum quantity
-                    min_quantity = Decimal(0)
-                    for filter_info in symbol_info.get('filters', []):
-                        if filter_info.get('filterType') == 'LOT_SIZE':
-                            min_quantity = Decimal(filter_info.get('minQty', 0))
-                            break
-
-                    if self.config.quantity < min_quantity:
-                        self.logger.log(
-                            f"Order quantity is less than min quantity: "
-                            f"{self.config.quantity} < {min_quantity}", "ERROR"
-                        )
-                        raise ValueError(
-                            f"Order quantity is less than min quantity: "
-                            f"{self.config.quantity} < {min_quantity}"
-                        )
-
-                    if self.config.tick_size == 0:
-                        self.logger.log("Failed to get tick size for ticker", "ERROR")
-                        raise ValueError("Failed to get tick size for ticker")
-
-                    return self.config.contract_id, self.config.tick_size
+            symbol_info = (await self._get_usdt_symbols()).get(ticker)
+            if symbol_info is not None:
+                self.config.contract_id = symbol_info.get('symbol', '')
+
+                # Get tick size and minimum quantity from filters in one pass
+                tick_size = min_quantity = None
+                for filter_info in symbol_info.get('filters', ()):
+                    filter_type = filter_info.get('filterType')
+                    if filter_type == 'PRICE_FILTER' and tick_size is None:
+                        tick_size = Decimal(filter_info['tickSize'].strip('0'))
+                    elif filter_type == 'LOT_SIZE' and min_quantity is None:
+                        min_quantity = _dec(filter_info.get('minQty') or '0')
+                    if tick_size is not None and min_quantity is not None:
+                        break
+                if tick_size is not None:
+                    self.config.tick_size = tick_size
+                if min_quantity is None:
+                    min_quantity = _DEC_ZERO
+
+                if self.config.quantity < min_quantity:
+                    self.logger.log(
+                        f"Order quantity is less than min quantity: "
+                        f"{self.config.quantity} < {min_quantity}", "ERROR"
+                    )
+                    raise ValueError(
+                        f"Order quantity is less than min quantity: "
+                        f"{self.config.quantity} < {min_quantity}"
+                    )
+
+                if self.config.tick_size == 0:
+                    self.logger.log("Failed to get tick size for ticker", "ERROR")
+                    raise ValueError("Failed to get tick size for ticker")
+                self._set_tick_size(self.config.tick_size)
+
+                return self.config.contract_id, self.config.tick_size
 
             self.logger.log("Failed to get contract ID for ticker", "ERROR")
             raise ValueError("Failed to get contract ID for ticker")
@@ -3,12 +3,17 @@ Base exchange client interface.
 All exchange implementations should inherit from this class.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Tuple, Type, Union
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
 from tenacity import RetryCallState, retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+# Result objects are built once per order in response-parsing loops and never mutated:
+# use slots where supported (3.10+) and freeze them so they can be cached safely.
+_RESULT_DATACLASS_OPTS = {'frozen': True, 'slots': True} if sys.version_info >= (3, 10) else {'frozen': True}
+
 
 def query_retry(
     default_return: Any = None,
@@ -32,7 +37,7 @@ def query_retry(
     )
 
 
-@dataclass
+@dataclass(**_RESULT_DATACLASS_OPTS)
 class OrderResult:
     """Standardized order result structure."""
     success: bool
@@ -45,7 +50,7 @@ class OrderResult:
     filled_size: Optional[Decimal] = None
 
 
-@dataclass
+@dataclass(**_RESULT_DATACLASS_OPTS)
 class OrderInfo:
     """Standardized order information structure."""
     order_id: str
@@ -5,27 +5,50 @@
 
 from __future__ import annotations
 import os
+import re
 import time
 import json
+import functools
+import threading
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+import numpy as np
 import pandas as pd
 import sys
 
+# 优先使用 orjson 读写本地缓存文件（C 实现，快数倍），未安装时回退到标准库
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    _json_loads = json.loads
+
+# 本模块所在目录，只解析一次（abspath 会访问文件系统）
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_TRADE_INFO_PATH = os.path.join(_MODULE_DIR, 'exchange_trade_info.json')
+_PATHS_ADDED = False
+
 def _add_bpx_path():
-    """添加bpx包路径到sys.path，支持多种运行方式"""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
+    """添加bpx包路径到sys.path，支持多种运行方式；重复调用时跳过路径探测"""
+    global _PATHS_ADDED
     # 添加项目根目录的bpx路径（如果存在）
-    project_root = os.path.abspath(os.path.join(current_dir, '../../..'))
+    project_root = os.path.abspath(os.path.join(_MODULE_DIR, '../../..'))
+    if _PATHS_ADDED:
+        return project_root
     root_bpx_path = os.path.join(project_root, 'bpx')
     if os.path.exists(root_bpx_path) and root_bpx_path not in sys.path:
         sys.path.insert(0, root_bpx_path)
     if os.path.exists(project_root) and project_root not in sys.path:
         sys.path.insert(0, project_root)
+    _PATHS_ADDED = True
     return project_root
 # 执行路径添加
 _PROJECT_ROOT = _add_bpx_path()
-print('PROJECT_ROOT: ', _PROJECT_ROOT, 'CURRENT_DIR: ', os.path.dirname(os.path.abspath(__file__)))
+print('PROJECT_ROOT: ', _PROJECT_ROOT, 'CURRENT_DIR: ', _MODULE_DIR)
 
 
 # syscall base（与你的项目保持一致）
@@ -64,6 +87,187 @@ except ImportError:
     def get_ctos_config():
         return None
 
+# 账户凭证、账户列表与 CTOS 配置在进程内是静态的，按键缓存：多账户实例化时只读取/解析一次
+_config_cache: Dict[tuple, Any] = {}
+
+def _cached_config(key, loader, *args):
+    """命中缓存直接返回，否则调用 loader 并缓存结果（抛出异常时不缓存）"""
+    try:
+        return _config_cache[key]
+    except KeyError:
+        value = _config_cache[key] = loader(*args)
+        return value
+
+def _get_creds(exchange, account):
+    return _cached_config(('creds', exchange, account), get_credentials_for_driver, exchange, account)
+
+def _list_accounts(exchange):
+    return _cached_config(('accounts', exchange), list_accounts, exchange)
+
+def _get_ctos_config():
+    return _cached_config(('ctos',), get_ctos_config)
+
+def clear_cred_cache():
+    """清空凭证/配置缓存，配置文件变更后或测试中使用"""
+    _config_cache.clear()
+
+# ccxt 全量 markets 的磁盘缓存：数据量大、变化慢，有效期内启动直接复用，免去一次重量级 HTTP 请求
+_MARKETS_CACHE_PATH = os.path.join(_MODULE_DIR, 'markets_cache.json')
+MARKETS_CACHE_TTL = 86400
+
+def _atomic_write_json(path, obj):
+    """序列化后先写临时文件再 os.replace 覆盖，并发读取方不会读到写了一半的文件"""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(_json_dumps(obj))
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+# 订单字段在 ccxt 统一结构 / 交易所原始结构中的候选键名，按优先级排列
+_ID_KEYS = ('id', 'orderId', 'ordId')
+_SYMBOL_KEYS = ('symbol', 'market', 'instId')
+_SIDE_KEYS = ('side', 'orderSide')
+_TYPE_KEYS = ('type', 'ordType', 'orderType')
+_PRICE_KEYS = ('price', 'px')
+_QTY_KEYS = ('amount', 'origQty', 'quantity', 'size', 'sz', 'qty')
+_FILLED_KEYS = ('filled', 'executedQty', 'filledSize', 'accFillSz')
+_STATUS_KEYS = ('status', 'state')
+_TIF_KEYS = ('timeInForce', 'time_in_force')
+_POST_ONLY_KEYS = ('postOnly', 'post_only')
+_REDUCE_ONLY_KEYS = ('reduceOnly', 'reduce_only')
+_CLIENT_ID_KEYS = ('clientOrderId', 'client_id', 'clOrdId')
+_CREATED_KEYS = ('timestamp', 'time', 'cTime')
+_UPDATED_KEYS = ('lastUpdateTimestamp', 'updateTime', 'uTime')
+
+
+def _first(d, keys, default=None):
+    """按顺序返回 d 中第一个非 None 的字段值，都没有则返回 default"""
+    for k in keys:
+        v = d.get(k)
+        if v is not None:
+            return v
+    return default
+
+
+def _to_float(v):
+    try:
+        return float(v)
+    except Exception:
+        return None
+
+
+def _to_int(v):
+    try:
+        return int(v)
+    except Exception:
+        return None
+
+
+def _to_lower(v):
+    return str(v).lower() or None
+
+
+# 驱动用到的 ccxt 方法，初始化时探测一次：能力名 -> 方法名
+_CAPABILITIES = {
+    'funding': 'fetch_funding_rate',
+    'ticker': 'fetch_ticker',
+    'tickers': 'fetch_tickers',
+    'orderbook': 'fetch_order_book',
+    'ohlcv': 'fetch_ohlcv',
+    'create': 'create_order',
+    'cancel': 'cancel_order',
+    'cancel_all': 'cancel_all_orders',
+    'fetch_order': 'fetch_order',
+    'open_orders': 'fetch_open_orders',
+    'balance': 'fetch_balance',
+    'positions': 'fetch_positions',
+}
+
+
+# 统一订单结构的字段表：(输出字段, 候选键名, 类型转换)，转换只作用于非 None 值
+_ORDER_NORM_TABLE = (
+    ('orderId', _ID_KEYS, None),
+    ('symbol', _SYMBOL_KEYS, None),
+    ('side', ('side',), _to_lower),
+    ('orderType', _TYPE_KEYS, _to_lower),
+    ('price', _PRICE_KEYS, _to_float),
+    ('quantity', _QTY_KEYS, _to_float),
+    ('filledQuantity', _FILLED_KEYS, _to_float),
+    ('status', _STATUS_KEYS, None),
+    ('timeInForce', _TIF_KEYS, None),
+    ('postOnly', _POST_ONLY_KEYS, None),
+    ('reduceOnly', _REDUCE_ONLY_KEYS, None),
+    ('clientId', _CLIENT_ID_KEYS, None),
+    ('createdAt', _CREATED_KEYS, _to_int),
+    ('updatedAt', _UPDATED_KEYS, _to_int),
+)
+
+
+def _normalize_order(od):
+    """按 _ORDER_NORM_TABLE 把 ccxt / 交易所原始订单转为统一结构，原始数据放在 'raw'"""
+    normalized = {}
+    for out_key, keys, cast in _ORDER_NORM_TABLE:
+        v = _first(od, keys)
+        normalized[out_key] = cast(v) if cast is not None and v is not None else v
+    normalized['raw'] = od
+    return normalized
+
+
+# 符号分隔符统一为 CCXT 的 '/'，一次正则替换代替两次 str.replace
+_SEP_RE = re.compile(r'[-_]')
+
+
+@functools.lru_cache(maxsize=2048)
+def _norm_symbol_cached(symbol: str, mode: str, default_quote: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """BinanceDriver._norm_symbol 的实现；交易对集合有限，按 (symbol, mode, default_quote) 缓存结果"""
+    s = symbol.strip()
+    if not s:
+        return None, None, None
+
+    # unify separators to CCXT standard /
+    su = _SEP_RE.sub("/", s).upper()
+
+    if "/" in su:
+        parts = su.split("/")
+        base = parts[0]
+        quote = parts[1] if len(parts) > 1 else default_quote
+    elif su.endswith("USDT"):
+        base, quote = su[:-4], "USDT"
+    elif su.endswith("BUSD"):
+        base, quote = su[:-4], "BUSD"
+    else:
+        # Only base provided
+        base = su
+        quote = default_quote
+
+    full = f"{base}/{quote}"
+    if mode == "usdm":
+        full += f":{quote}"
+
+    return full, base.lower(), quote.upper()
+
+
+# 周期单位后缀 -> 秒数
+_TF_MULT = {'m': 60, 'h': 60 * 60, 'd': 24 * 60 * 60, 'w': 7 * 24 * 60 * 60}
+
+
+@functools.lru_cache(maxsize=64)
+def _timeframe_to_seconds_cached(timeframe: str) -> int:
+    """BinanceDriver._timeframe_to_seconds 的实现；按末位单位查表，周期取值有限，结果缓存"""
+    tf = timeframe.strip().lower()
+    mult = _TF_MULT.get(tf[-1:])
+    if mult is not None:
+        return int(tf[:-1]) * mult
+    # default try minutes
+    try:
+        return int(tf) * 60
+    except Exception:
+        raise ValueError("Unsupported timeframe: %s" % timeframe)
+
 def get_account_name_by_id(account_id=0, exchange='binance'):
     """
     根据账户ID获取账户名称
@@ -76,7 +280,7 @@ def get_account_name_by_id(account_id=0, exchange='binance'):
         str: 账户名称
     """
     try:
-        accounts = list_accounts(exchange)
+        accounts = _list_accounts(exchange)
         
         if account_id < len(accounts):
             return accounts[account_id]
@@ -90,6 +294,37 @@ def get_account_name_by_id(account_id=0, exchange='binance'):
         default_mapping = {0: 'main', 1: 'sub1', 2: 'sub2'}
         return default_mapping.get(account_id, 'main')
 
+def _tune_http_session(exchange):
+    """为 ccxt 底层的 requests.Session 挂载更大的连接池并保持 keep-alive，空闲连接复用时免去 TCP/TLS 握手"""
+    session = getattr(exchange, 'session', None)
+    if session is None or not hasattr(session, 'mount'):
+        return
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'Connection': 'keep-alive'})
+
+
+def _new_public_client(mode: str):
+    """创建不带 API 凭证的 ccxt 客户端，只用于公共行情接口，可在多个账户实例间共享"""
+    proxies = None
+    try:
+        configs = _get_ctos_config()
+        if configs is not None and 'proxies' in configs:
+            proxies = configs.get('proxies')
+    except Exception as e:
+        print(f"从配置文件读取代理配置失败: {e}")
+    exchange = ccxt_binance({
+        "enableRateLimit": True,
+        "proxies": proxies,
+        "options": {
+            "defaultType": 'spot' if mode.lower() == "spot" else "swap",
+        }
+    })
+    _tune_http_session(exchange)
+    return exchange
+
+
 def init_binance_clients(mode: str = "usdm", public_key: Optional[str] = None, secret_key: Optional[str] = None, account_id: int = 0):
     """
     初始化ccxt Binance客户端：
@@ -105,7 +340,7 @@ def init_binance_clients(mode: str = "usdm", public_key: Optional[str] = None, s
     if not (k and s):
         try:
             account_name = get_account_name_by_id(account_id, 'binance')
-            credentials = get_credentials_for_driver('binance', account_name)
+            credentials = _get_creds('binance', account_name)
             k = k or credentials.get('public_key', '') or credentials.get('api_key', '') or credentials.get('apiKey', '')
             s = s or credentials.get('secret_key', '') or credentials.get('api_secret', '') or credentials.get('secret', '')
             
@@ -130,7 +365,7 @@ def init_binance_clients(mode: str = "usdm", public_key: Optional[str] = None, s
     # 2. 获取代理配置
     proxies = None
     try:
-        configs = get_ctos_config()
+        configs = _get_ctos_config()
         if configs is not None and 'proxies' in configs:
             proxies = configs.get('proxies')
             if proxies:
@@ -152,11 +387,11 @@ def init_binance_clients(mode: str = "usdm", public_key: Optional[str] = None, s
     }
     
     # 4. 创建exchange实例
+    exchange = ccxt_binance(config)
+    _tune_http_session(exchange)
     if mode.lower() == "spot":
-        exchange = ccxt_binance(config)
         return {"spot": exchange, "usdm": None}
     else:
-        exchange = ccxt_binance(config)
         return {"spot": None, "usdm": exchange}
 
 
@@ -168,9 +403,21 @@ class BinanceDriver(TradingSyscalls):
       - usdm:  "BASE/QUOTE"           e.g. "ETH/USDT"
     Accepts inputs like 'eth-usdt', 'ETH/USDT', 'ETHUSDT', 'eth', etc.
     """
+    # 多账户时会创建大量实例：固定属性集，省掉每个实例的 __dict__
+    __slots__ = (
+        'cex', 'quote_ccy', 'account_id', 'binance', 'mode', 'default_quote',
+        'price_scale', 'size_scale', 'exchange_trade_info', 'order_id_to_symbol',
+        'funding_ttl', '_funding_cache', '_markets_by_mode', '_caps', '_public',
+    )
+
+    # 进程内各账户实例共享的 markets（mode -> markets），只下载/读盘一次
+    _shared_markets: Dict[str, dict] = {}
+    # 进程内按 mode 共享的免鉴权客户端（mode -> ccxt 实例），承载公共行情请求
+    _public_cex: Dict[str, Any] = {}
+    _shared_lock = threading.Lock()
 
     def __init__(self, binance_client=None, mode="usdm", default_quote="USDT",
-                 price_scale=1e-8, size_scale=1e-8, account_id=0):
+                 price_scale=1e-8, size_scale=1e-8, account_id=0, funding_ttl=300):
         self.cex = 'binance'
         self.quote_ccy = 'USDT'
         self.account_id = account_id
@@ -179,6 +426,7 @@ class BinanceDriver(TradingSyscalls):
         :param mode: "usdm" or "spot".
         :param default_quote: default quote when user passes 'ETH' without '/USDT'
         :param account_id: 账户ID，根据配置文件中的账户顺序映射 (0=第一个账户, 1=第二个账户, ...)
+        :param funding_ttl: 资金费率缓存有效期（秒），资金费率按结算周期变化，无需每次请求
         """
         if binance_client is None:
             try:
@@ -196,23 +444,142 @@ class BinanceDriver(TradingSyscalls):
             self.binance = binance_client
             print(f"✓ Binance Driver使用外部客户端 (账户ID: {account_id})")
         
+        # 客户端能力表，各方法据此判断而不必每次调用 hasattr
+        self._caps = {cap: hasattr(self.binance, name) for cap, name in _CAPABILITIES.items()}
         self.mode = (mode or "usdm").lower()
         self.default_quote = default_quote or "USDT"
         self.price_scale = price_scale
         self.size_scale = size_scale
-        self.load_exchange_trade_info()
+        # 交易对限额信息延迟到首次 exchange_limits 时才从磁盘读取
+        self.exchange_trade_info = None
         self.order_id_to_symbol = {}
+        # 资金费率缓存 {full_symbol: (expire_at, raw)}
+        self.funding_ttl = funding_ttl
+        self._funding_cache: Dict[str, Tuple[float, dict]] = {}
+        # 按 ccxt market 类型分桶的 markets {'spot': [...], 'swap': [...]}，首次使用时构建
+        self._markets_by_mode: Optional[Dict[str, List[dict]]] = None
+        # 公共行情接口（ticker/盘口/K线/资金费率）走共享的免鉴权客户端，所有账户共用连接池与限频；
+        # 外部传入客户端时沿用该客户端
+        self._public = self.binance
+        if binance_client is None and self.binance is not None:
+            try:
+                self._public = self._shared_public_client(self.mode)
+            except Exception as e:
+                print(f"创建 Binance 公共客户端失败: {e}，公共接口改用账户客户端")
+        # 启动时加载一次 markets（优先磁盘缓存），之后 ccxt 各方法内部的 load_markets 直接命中内存：
+        # create_order / cancel_order / fetch_order 首次调用不会再在关键路径上拉取 markets
+        if self.binance is not None:
+            try:
+                self._load_markets()
+            except Exception as e:
+                print(f"加载 Binance markets 失败: {e}")
 
     def save_exchange_trade_info(self):
-        with open(os.path.dirname(os.path.abspath(__file__)) + '/exchange_trade_info.json', 'w') as f:
-            json.dump(self.exchange_trade_info, f)
+        self._ensure_trade_info()
+        # 'raw' 是整份 ccxt market，体积占文件绝大部分且重启后用不到，落盘时去掉
+        slim = {symbol: self._without_raw(info) for symbol, info in self.exchange_trade_info.items()}
+        _atomic_write_json(_TRADE_INFO_PATH, slim)
+
+    def _ensure_trade_info(self):
+        """首次使用时才读取 exchange_trade_info.json，只下单的实例不必付出这次磁盘读取与解析"""
+        if self.exchange_trade_info is None:
+            self.load_exchange_trade_info()
 
     def load_exchange_trade_info(self):
-        if not os.path.exists(os.path.dirname(os.path.abspath(__file__)) + '/exchange_trade_info.json'):
+        if not os.path.exists(_TRADE_INFO_PATH):
             self.exchange_trade_info = {}
             return
-        with open(os.path.dirname(os.path.abspath(__file__)) + '/exchange_trade_info.json', 'r') as f:
-            self.exchange_trade_info = json.load(f)
+        with open(_TRADE_INFO_PATH, 'rb') as f:
+            self.exchange_trade_info = _json_loads(f.read())
+
+    def _load_markets(self):
+        """
+        返回 ccxt markets：已在内存则直接返回；否则依次使用进程内共享的 markets、
+        有效期内的磁盘缓存，都未命中时请求一次 load_markets() 并写回缓存
+        """
+        if self.binance.markets:
+            return self.binance.markets
+        # 加锁保证多个账户实例同时初始化时只有一个去读盘/下载
+        with BinanceDriver._shared_lock:
+            shared = BinanceDriver._shared_markets.get(self.mode)
+            if shared is None:
+                shared = self._read_markets_cache()
+                if shared is None:
+                    shared = self.binance.load_markets()
+                    self._write_markets_cache(shared)
+                BinanceDriver._shared_markets[self.mode] = shared
+        seeded = not self.binance.markets
+        for client in (self.binance, self._public):
+            if not client.markets:
+                client.set_markets(shared)
+        # load_markets() 会顺带校准服务器时间差，直接 set_markets 灌入时需要补做，否则签名时间戳可能超出 recvWindow
+        if seeded and self.binance.options.get('adjustForTimeDifference'):
+            try:
+                self.binance.load_time_difference()
+            except Exception as e:
+                print(f"校准服务器时间差失败: {e}")
+        return self.binance.markets
+
+    @classmethod
+    def _shared_public_client(cls, mode):
+        """取得（必要时创建）该 mode 的共享公共客户端"""
+        with cls._shared_lock:
+            pub = cls._public_cex.get(mode)
+            if pub is None:
+                pub = cls._public_cex[mode] = _new_public_client(mode)
+            return pub
+
+    def warmup(self, symbols=None):
+        """
+        预热：对预期交易的交易对各请求一次 ticker，提前建立并保持 HTTPS 连接，
+        第一笔真实订单不必在关键路径上做 TCP/TLS 握手
+        :param symbols: 交易对列表，默认 ['BTC']
+        :return: 成功预热的交易对数量
+        """
+        if self.binance is None:
+            return 0
+        warmed = 0
+        for symbol in symbols or ['BTC']:
+            try:
+                self._public.fetch_ticker(symbol=self._norm_symbol(symbol)[0])
+                warmed += 1
+            except Exception as e:
+                print(f"预热 {symbol} 失败: {e}")
+        return warmed
+
+    def _mode_markets(self):
+        """
+        返回当前 mode 对应类型的 market 列表（spot -> 'spot'，usdm -> 'swap'）；
+        首次调用时把全量 markets 按类型分桶一次，之后无需逐个判断类型
+        """
+        if self._markets_by_mode is None:
+            buckets: Dict[str, List[dict]] = {}
+            for market in self._load_markets().values():
+                buckets.setdefault(market.get('type'), []).append(market)
+            self._markets_by_mode = buckets
+        return self._markets_by_mode.get('spot' if self.mode == 'spot' else 'swap', [])
+
+    @staticmethod
+    def _read_markets_cache():
+        """读取有效期内的 markets 磁盘缓存，缺失、过期或损坏时返回 None"""
+        try:
+            if time.time() - os.path.getmtime(_MARKETS_CACHE_PATH) >= MARKETS_CACHE_TTL:
+                return None
+            with open(_MARKETS_CACHE_PATH, 'rb') as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"读取 markets 缓存失败: {e}，重新从交易所加载")
+            return None
+
+    @staticmethod
+    def _write_markets_cache(markets):
+        """将 markets 写入磁盘缓存，失败只打印不抛出"""
+        try:
+            _atomic_write_json(_MARKETS_CACHE_PATH, markets)
+        except Exception as e:
+            print(f"写入 markets 缓存失败: {e}")
 
     # -------------- helpers --------------
     def _norm_symbol(self, symbol):
@@ -224,48 +591,11 @@ class BinanceDriver(TradingSyscalls):
           _norm_symbol('ETHUSDT') -> ('ETH/USDT', 'eth', 'USDT')
           _norm_symbol('SOL/USDT') -> ('SOL/USDT', 'sol', 'USDT')
         """
-        s = str(symbol or "").strip()
-        if not s:
-            return None, None, None
-
-        # unify separators to CCXT standard /
-        su = s.replace("-", "/").replace("_", "/").upper()
-
-        if "/" in su:
-            parts = su.split("/")
-            base = parts[0]
-            quote = parts[1] if len(parts) > 1 else self.default_quote
-        elif su.endswith("USDT"):
-            base, quote = su[:-4], "USDT"
-        elif su.endswith("BUSD"):
-            base, quote = su[:-4], "BUSD"
-        else:
-            # Only base provided
-            base = su
-            quote = self.default_quote
-
-        full = f"{base}/{quote}"
-        if self.mode == "usdm":
-            full += f":{quote}"
-
-        return full, base.lower(), quote.upper()
+        return _norm_symbol_cached(str(symbol or ""), self.mode, self.default_quote)
 
     def _timeframe_to_seconds(self, timeframe):
         """Parse timeframe like '1m','15m','1h','4h','1d','1w' -> seconds"""
-        tf = str(timeframe).strip().lower()
-        if tf.endswith('m'):
-            return int(tf[:-1]) * 60
-        if tf.endswith('h'):
-            return int(tf[:-1]) * 60 * 60
-        if tf.endswith('d'):
-            return int(tf[:-1]) * 24 * 60 * 60
-        if tf.endswith('w'):
-            return int(tf[:-1]) * 7 * 24 * 60 * 60
-        # default try minutes
-        try:
-            return int(tf) * 60
-        except Exception:
-            raise ValueError("Unsupported timeframe: %s" % timeframe)
+        return _timeframe_to_seconds_cached(str(timeframe))
 
     # -------------- ref-data / meta --------------
     def symbols(self, instType='USDM'):
@@ -279,33 +609,28 @@ class BinanceDriver(TradingSyscalls):
             return ["BTC/USDT", "ETH/USDT"] if str(instType).upper() == 'USDM' else ["BTC/USDT", "ETH/USDT"]
 
         try:
-            markets = self.binance.load_markets()
-            if self.mode == "spot":
-                # 现货市场
-                syms = [symbol for symbol, market in markets.items() 
-                       if market.get('type') == 'spot' and market.get('active', True)]
-            else:
-                # 期货市场 (Binance USDM in CCXT is 'swap')
-                syms = [symbol for symbol, market in markets.items() 
-                       if market.get('type') == 'swap' and market.get('active', True)]
+            # 现货为 'spot'，期货 (Binance USDM in CCXT is 'swap')
+            syms = [market['symbol'] for market in self._mode_markets() if market.get('active', True)]
             return syms, None
         except Exception as e:
             return [], e
 
-    def exchange_limits(self, symbol=None, instType='SWAP'):
+    def exchange_limits(self, symbol=None, instType='SWAP', keep_origin=False):
         """
         获取交易所限制信息，包括价格精度、数量精度、最小下单数量等
         
         :param symbol: 交易对符号，如 'BTC-USDT-SWAP'，如果为None则返回全类型数据
         :param instType: 产品类型，默认为 'SWAP'
+        :param keep_origin: True 时结果附带完整的 ccxt market（'raw'），此时不走本地缓存
         :return: dict 包含限制信息的字典
         """
+        self._ensure_trade_info()
         if symbol:
             symbol, _, _ = self._norm_symbol(symbol)
-            if symbol in self.exchange_trade_info:
+            if not keep_origin and symbol in self.exchange_trade_info:
                 return self.exchange_trade_info[symbol], None
         try:
-            markets = self.binance.load_markets()
+            markets = self._load_markets()
             
             # 如果指定了symbol，获取单个交易对信息
             if symbol:
@@ -313,24 +638,19 @@ class BinanceDriver(TradingSyscalls):
                     return {"error": f"未找到交易对 {symbol} 的信息"}, None
                 
                 market = markets[symbol]
-                limits = self._extract_limits_from_market(market)
+                limits = self._extract_limits_from_market(market, include_raw=keep_origin)
                 if limits and 'error' not in limits:
-                    self.exchange_trade_info[symbol] = limits
+                    self.exchange_trade_info[symbol] = self._without_raw(limits)
                     self.save_exchange_trade_info()
                 return limits, None
             
             # 如果没有指定symbol，获取所有交易对信息
             result = []
-            for symbol_name, market in markets.items():
-                if self.mode == "spot" and market.get('type') != 'spot':
-                    continue
-                if self.mode == "usdm" and market.get('type') != 'swap':
-                    continue # Binance USDM is 'swap' in CCXT
-                    
-                limits = self._extract_limits_from_market(market)
+            for market in self._mode_markets():
+                limits = self._extract_limits_from_market(market, include_raw=keep_origin)
                 if limits and 'error' not in limits:
                     result.append(limits)
-                    self.exchange_trade_info[symbol_name] = limits
+                    self.exchange_trade_info[market['symbol']] = self._without_raw(limits)
             
             self.save_exchange_trade_info()
             return result, None
@@ -338,11 +658,19 @@ class BinanceDriver(TradingSyscalls):
         except Exception as e:
             return None, {"error": f"处理数据时发生异常: {str(e)}"}
     
-    def _extract_limits_from_market(self, market):
+    @staticmethod
+    def _without_raw(info):
+        """去掉 'raw'（整份 ccxt market），缓存与落盘只保留限额字段"""
+        if isinstance(info, dict) and 'raw' in info:
+            return {k: v for k, v in info.items() if k != 'raw'}
+        return info
+
+    def _extract_limits_from_market(self, market, include_raw=False):
         """
         从ccxt market信息中提取限制信息
         
         :param market: ccxt market信息字典
+        :param include_raw: True 时在结果中附带完整 market（'raw'），默认不带以免缓存与落盘膨胀
         :return: dict 包含限制信息的字典
         """
         try:
@@ -353,7 +681,7 @@ class BinanceDriver(TradingSyscalls):
             size_precision = market.get('precision', {}).get('amount', 0.001)
             min_qty = market.get('limits', {}).get('amount', {}).get('min', 0.001)
             
-            return {
+            limits = {
                 'symbol': symbol,
                 'instType': 'USDM' if self.mode == 'usdm' else 'SPOT',
                 'price_precision': price_precision,
@@ -362,8 +690,10 @@ class BinanceDriver(TradingSyscalls):
                 'contract_value': 1.0,
                 'max_leverage': 125.0 if self.mode == 'usdm' else 1.0,
                 'state': 'live' if market.get('active', True) else 'inactive',
-                'raw': market
             }
+            if include_raw:
+                limits['raw'] = market
+            return limits
         except Exception as e:
             return {"error": f"解析market信息时发生异常: {str(e)}"}
 
@@ -374,7 +704,7 @@ class BinanceDriver(TradingSyscalls):
         - 返回 (result, error)
         - 统一返回结构到"每小时资金费率"。
         """
-        if not hasattr(self.binance, 'fetch_funding_rate'):
+        if not self._caps['funding']:
             return None, NotImplementedError('Public.fetch_funding_rate unavailable')
 
         full, _, _ = self._norm_symbol(symbol)
@@ -382,7 +712,13 @@ class BinanceDriver(TradingSyscalls):
             return {"symbol": full, "instType": "SPOT", "fundingRate_hourly": None, "raw": None}, None
         
         try:
-            raw = self.binance.fetch_funding_rate(symbol=full)
+            now = time.monotonic()
+            hit = self._funding_cache.get(full)
+            if hit is not None and now < hit[0]:
+                raw = hit[1]
+            else:
+                raw = self._public.fetch_funding_rate(symbol=full)
+                self._funding_cache[full] = (now + self.funding_ttl, raw)
             if keep_origin:
                 return raw, None
             
@@ -412,9 +748,9 @@ class BinanceDriver(TradingSyscalls):
     # -------------- market data --------------
     def get_price_now(self, symbol='ETH/USDT'):
         full, base, _ = self._norm_symbol(symbol)
-        if hasattr(self.binance, "fetch_ticker"):
+        if self._caps['ticker']:
             try:
-                data = self.binance.fetch_ticker(symbol=full)
+                data = self._public.fetch_ticker(symbol=full)
                 # ccxt返回格式: {'symbol': 'BTC-USDT-SWAP', 'last': 2000.0, 'bid': 1999.0, 'ask': 2001.0, ...}
                 if isinstance(data, dict):
                     price = data.get('last') or data.get('close')
@@ -424,30 +760,66 @@ class BinanceDriver(TradingSyscalls):
                 raise e
         raise NotImplementedError("Public.fetch_ticker unavailable or response lacks price")
 
-    def get_orderbook(self, symbol='ETH/USDT', level=50):
+    def get_prices_now(self, symbols):
+        """
+        批量获取最新价：一次 fetch_tickers 请求代替 N 次 get_price_now
+        :param symbols: 交易对列表，格式同 get_price_now，如 ['eth', 'BTC/USDT']
+        :return: dict {full_symbol: price}，如 {'ETH/USDT:USDT': 2000.0}；响应中缺少价格的交易对不出现在结果中
+        """
+        if not self._caps['tickers']:
+            raise NotImplementedError("Public.fetch_tickers unavailable")
+        fulls = [self._norm_symbol(s)[0] for s in symbols]
+        data = self._public.fetch_tickers(symbols=[f for f in fulls if f])
+        prices = {}
+        for full, t in (data or {}).items():
+            price = t.get('last') or t.get('close') if isinstance(t, dict) else None
+            if price is not None:
+                prices[full] = float(price)
+        return prices
+
+    @staticmethod
+    def _levels_to_array(levels):
+        """[[price, size], ...] -> 形状 (N, 2) 的 float64 数组"""
+        arr = np.asarray(levels, dtype=np.float64)
+        return arr[:, :2] if arr.ndim == 2 else np.empty((0, 2), dtype=np.float64)
+
+    def get_orderbook(self, symbol='ETH/USDT', level=50, as_numpy=False):
+        """
+        :param as_numpy: True 时 bids/asks 返回 (N, 2) 的 float64 数组（列为 price, size），
+                         并附带 best_bid / best_ask / mid，便于直接做向量化的深度计算；默认 False 保持列表结构
+        """
         full, _, _ = self._norm_symbol(symbol)
-        if hasattr(self.binance, "fetch_order_book"):
+        if self._caps['orderbook']:
             try:
-                raw = self.binance.fetch_order_book(symbol=full, limit=int(level))
+                raw = self._public.fetch_order_book(symbol=full, limit=int(level))
                 bids = raw.get("bids", []) if isinstance(raw, dict) else []
                 asks = raw.get("asks", []) if isinstance(raw, dict) else []
-                return {"symbol": full, "bids": bids, "asks": asks}
+                if not as_numpy:
+                    return {"symbol": full, "bids": bids, "asks": asks}
+                bids_arr = self._levels_to_array(bids)
+                asks_arr = self._levels_to_array(asks)
+                best_bid = float(bids_arr[0, 0]) if len(bids_arr) else None
+                best_ask = float(asks_arr[0, 0]) if len(asks_arr) else None
+                mid = (best_bid + best_ask) / 2 if best_bid is not None and best_ask is not None else None
+                return {"symbol": full, "bids": bids_arr, "asks": asks_arr,
+                        "best_bid": best_bid, "best_ask": best_ask, "mid": mid}
             except Exception as e:
                 raise e
         raise NotImplementedError("Public.fetch_order_book unavailable")
 
-    def get_klines(self, symbol='ETH/USDT', timeframe='1h', limit=200):
+    def get_klines(self, symbol='ETH/USDT', timeframe='1h', limit=200, presorted=True):
         """
         Normalize to list of dicts:
         [{'ts': ts_ms, 'open': o, 'high': h, 'low': l, 'close': c, 'volume': v}, ...]
+        :param presorted: ccxt 返回的 K 线已按时间升序，默认跳过排序；数据源不保证顺序时传 False
         """
         full, _, _ = self._norm_symbol(symbol)
-        if not hasattr(self.binance, "fetch_ohlcv"):
+        if not self._caps['ohlcv']:
             raise NotImplementedError("Public.fetch_ohlcv unavailable")
 
         try:
             # 拉取原始数据
-            raw = self.binance.fetch_ohlcv(symbol=full, timeframe=timeframe, limit=int(limit))
+            raw = self._public.fetch_ohlcv(symbol=full, timeframe=timeframe, limit=int(limit))
         except Exception as e:
             return None, e
 
@@ -458,45 +830,51 @@ class BinanceDriver(TradingSyscalls):
             return None, ValueError("Unexpected ohlcv response format")
 
         # 重排为目标DF格式: trade_date(ms), open, high, low, close, vol1(base), vol(quote)
-        records = []
-        for k in rows:
-            if not isinstance(k, list) or len(k) < 6:
-                continue
-            try:
-                # ccxt ohlcv row: [timestamp, open, high, low, close, volume]
-                ts_ms = int(k[0])  # 时间戳（毫秒）
-                o = float(k[1])
-                h = float(k[2])
-                l = float(k[3])
-                c = float(k[4])
-                base_vol = float(k[5])
-                quote_vol = base_vol * c  # 估算quote volume
-
-                records.append({
-                    'trade_date': ts_ms,
-                    'open': o,
-                    'high': h,
-                    'low': l,
-                    'close': c,
-                    'vol1': base_vol,
-                    'vol': quote_vol,
-                })
-            except Exception:
-                # 跳过坏行
-                continue
+        # ccxt ohlcv row: [timestamp, open, high, low, close, volume]，整体转成 float64 二维数组，类型转换在 C 层完成
+        try:
+            arr = np.asarray(rows, dtype=np.float64)
+            if arr.ndim != 2 or arr.shape[1] < 6:
+                raise ValueError("ragged ohlcv rows")
+            # None 字段会被转成 NaN，与逐行解析一致地丢弃这些行
+            bad = np.isnan(arr[:, :6]).any(axis=1)
+            if bad.any():
+                arr = arr[~bad]
+        except (TypeError, ValueError):
+            # 含坏行时逐行清洗，跳过坏行
+            clean = []
+            for k in rows:
+                if not isinstance(k, list) or len(k) < 6:
+                    continue
+                try:
+                    clean.append([float(x) for x in k[:6]])
+                except Exception:
+                    continue
+            arr = np.array(clean, dtype=np.float64).reshape(-1, 6)
 
         # 时间升序并裁剪到 limit
-        records.sort(key=lambda r: r['trade_date'])
-        if limit and len(records) > int(limit):
-            records = records[-int(limit):]
+        if not presorted:
+            arr = arr[np.argsort(arr[:, 0], kind='stable')]
+        if limit and len(arr) > int(limit):
+            arr = arr[-int(limit):]
 
         # 优先返回 pandas.DataFrame（与driver.py保持一致）
         try:
-            df = pd.DataFrame.from_records(records, columns=['trade_date', 'open', 'high', 'low', 'close', 'vol1', 'vol'])
+            close, base_vol = arr[:, 4], arr[:, 5]
+            # 直接由列数组构造，copy=False 让 pandas 复用 NumPy 缓冲区而不再复制
+            df = pd.DataFrame({
+                'trade_date': arr[:, 0].astype(np.int64),  # 时间戳（毫秒）
+                'open': arr[:, 1],
+                'high': arr[:, 2],
+                'low': arr[:, 3],
+                'close': close,
+                'vol1': base_vol,
+                'vol': base_vol * close,  # 估算quote volume
+            }, copy=False)
             return df, None
         except Exception:
             # 退化为列表
-            return records, None
+            return [{'trade_date': int(r[0]), 'open': r[1], 'high': r[2], 'low': r[3], 'close': r[4],
+                     'vol1': r[5], 'vol': r[5] * r[4]} for r in arr.tolist()], None
 
     # -------------- trading --------------
     def place_order(self, symbol, side, order_type, size, price=None, client_id=None, **kwargs):
@@ -504,7 +882,7 @@ class BinanceDriver(TradingSyscalls):
         Normalize inputs to your okex client.
         """
         full, _, _ = self._norm_symbol(symbol)
-        if not hasattr(self.binance, "create_order"):
+        if not self._caps['create']:
             raise NotImplementedError("binance client lacks create_order(...)")
 
         try:
@@ -570,19 +948,10 @@ class BinanceDriver(TradingSyscalls):
             return None, cerr or RuntimeError("cancel order failed")
 
         # 3) 组装新单参数：优先用传入，其次用旧单
-        def _get(o, keys, default=None):
-            if not isinstance(o, dict):
-                return default
-            for k in keys:
-                v = o.get(k)
-                if v is not None:
-                    return v
-            return default
-
-        old_side = _get(existing_order, ['side', 'orderSide'])
-        old_type = _get(existing_order, ['type', 'orderType'])
-        old_qty = _get(existing_order, ['origQty', 'quantity', 'size', 'qty'])
-        old_price = _get(existing_order, ['price'])
+        old_side = _first(existing_order, _SIDE_KEYS)
+        old_type = _first(existing_order, _TYPE_KEYS)
+        old_qty = _first(existing_order, _QTY_KEYS)
+        old_price = existing_order.get('price')
 
         new_side = side if side is not None else old_side
         new_type = order_type if order_type is not None else old_type
@@ -606,7 +975,7 @@ class BinanceDriver(TradingSyscalls):
         )
 
     def revoke_order(self, order_id, symbol=None):
-        if hasattr(self.binance, "cancel_order"):
+        if self._caps['cancel']:
             if not symbol:
                 return False, ValueError("symbol is required for cancel_order on Binance")
             full, _, _ = self._norm_symbol(symbol)
@@ -618,7 +987,7 @@ class BinanceDriver(TradingSyscalls):
         return False, NotImplementedError("Account.cancel_order unavailable")
 
     def get_order_status(self, order_id, symbol=None, keep_origin=False):
-        if not hasattr(self.binance, "fetch_order"):
+        if not self._caps['fetch_order']:
             raise NotImplementedError("Account.fetch_order unavailable")
         
         if not symbol:
@@ -639,7 +1008,7 @@ class BinanceDriver(TradingSyscalls):
                     if not isinstance(od, dict):
                         return False
                     # 尝试多种ID字段
-                    od_id = od.get('id') or od.get('orderId') or od.get('ordId')
+                    od_id = _first(od, _ID_KEYS)
                     return str(od_id) == str(target_id) if od_id is not None else False
                 
                 if isinstance(resp, dict):
@@ -664,7 +1033,7 @@ class BinanceDriver(TradingSyscalls):
                 for item in resp:
                     try:
                         # 支持多种ID字段匹配
-                        item_id = item.get('id') or item.get('orderId') or item.get('ordId')
+                        item_id = _first(item, _ID_KEYS)
                         if item_id and str(item_id) == str(order_id):
                             od = item
                             break
@@ -673,30 +1042,7 @@ class BinanceDriver(TradingSyscalls):
             if not od:
                 return None, None
 
-            def _f(v, cast=float):
-                try:
-                    return cast(v)
-                except Exception:
-                    return None
-
-            normalized = {
-                'orderId': od.get('id') or od.get('orderId') or od.get('ordId'),
-                'symbol': od.get('symbol') or od.get('market') or od.get('instId'),
-                'side': (od.get('side') or '').lower() if od.get('side') else None,
-                'orderType': (od.get('type') or od.get('ordType') or '').lower() if (od.get('type') or od.get('ordType')) else None,
-                'price': _f(od.get('price') or od.get('px')),
-                'quantity': _f(od.get('amount') or od.get('origQty') or od.get('quantity') or od.get('size') or od.get('sz')),
-                'filledQuantity': _f(od.get('filled') or od.get('executedQty') or od.get('filledSize') or od.get('accFillSz')),
-                'status': od.get('status') or od.get('state'),
-                'timeInForce': od.get('timeInForce') or od.get('time_in_force'),
-                'postOnly': od.get('postOnly') or od.get('post_only'),
-                'reduceOnly': od.get('reduceOnly') or od.get('reduce_only'),
-                'clientId': od.get('clientOrderId') or od.get('client_id') or od.get('clOrdId'),
-                'createdAt': _f(od.get('timestamp') or od.get('time') or od.get('cTime'), int),
-                'updatedAt': _f(od.get('lastUpdateTimestamp') or od.get('updateTime') or od.get('uTime'), int),
-                'raw': od,
-            }
-            return normalized, None
+            return _normalize_order(od), None
         except Exception as e:
             return None, e
 
@@ -708,7 +1054,7 @@ class BinanceDriver(TradingSyscalls):
         :param onlyOrderId: True 则仅返回订单号列表；False 返回完整订单对象列表
         :return: (result, error)
         """
-        if hasattr(self.binance, "fetch_open_orders"):
+        if self._caps['open_orders']:
             try:
                 if symbol:
                     try:
@@ -727,7 +1073,7 @@ class BinanceDriver(TradingSyscalls):
                             try:
                                 if isinstance(od, dict):
                                     # ccxt返回的订单ID可能在'id'或'orderId'字段
-                                    oid = od.get('id') or od.get('orderId') or od.get('ordId')
+                                    oid = _first(od, _ID_KEYS)
                                     if oid is not None:
                                         order_ids.append(str(oid))
                             except Exception:
@@ -738,14 +1084,14 @@ class BinanceDriver(TradingSyscalls):
                             for od in data:
                                 try:
                                     if isinstance(od, dict):
-                                        oid = od.get('id') or od.get('orderId') or od.get('ordId')
+                                        oid = _first(od, _ID_KEYS)
                                         if oid is not None:
                                             order_ids.append(str(oid))
                                 except Exception:
                                     continue
                         else:
                             # 单个订单或以键为订单号等情况
-                            oid = resp.get('id') or resp.get('orderId') or resp.get('ordId')
+                            oid = _first(resp, _ID_KEYS)
                             if oid is not None:
                                 order_ids.append(str(oid))
                     return order_ids, None
@@ -755,30 +1101,7 @@ class BinanceDriver(TradingSyscalls):
 
                 # 统一结构输出 list[dict]
                 def to_norm(od):
-                    if not isinstance(od, dict):
-                        return None
-                    def _f(v, cast=float):
-                        try:
-                            return cast(v)
-                        except Exception:
-                            return None
-                    return {
-                        'orderId': od.get('id') or od.get('orderId') or od.get('ordId'),
-                        'symbol': od.get('symbol') or od.get('market') or od.get('instId'),
-                        'side': (od.get('side') or '').lower() if od.get('side') else None,
-                        'orderType': (od.get('type') or od.get('ordType') or '').lower() if (od.get('type') or od.get('ordType')) else None,
-                        'price': _f(od.get('price') or od.get('px')),  # str -> float
-                        'quantity': _f(od.get('amount') or od.get('origQty') or od.get('quantity') or od.get('size') or od.get('sz')),  # str -> float
-                        'filledQuantity': _f(od.get('filled') or od.get('executedQty') or od.get('filledSize') or od.get('accFillSz')),  # str -> float
-                        'status': od.get('status') or od.get('state'),
-                        'timeInForce': od.get('timeInForce') or od.get('time_in_force'),
-                        'postOnly': od.get('postOnly') or od.get('post_only'),
-                        'reduceOnly': od.get('reduceOnly') or od.get('reduce_only'),
-                        'clientId': od.get('clientOrderId') or od.get('client_id') or od.get('clOrdId'),
-                        'createdAt': _f(od.get('timestamp') or od.get('time') or od.get('cTime'), int),
-                        'updatedAt': _f(od.get('lastUpdateTimestamp') or od.get('updateTime') or od.get('uTime'), int),
-                        'raw': od,
-                    }
+                    return _normalize_order(od) if isinstance(od, dict) else None
 
                 normalized = []
                 if isinstance(resp, list):
@@ -823,7 +1146,7 @@ class BinanceDriver(TradingSyscalls):
             return results, None
 
         # 2. 尝试使用 ccxt 原生的 cancel_all_orders
-        if symbol and hasattr(self.binance, "cancel_all_orders"):
+        if symbol and self._caps['cancel_all']:
             try:
                 full = self._norm_symbol(symbol)[0]
                 resp = self.binance.cancel_all_orders(symbol=full)
@@ -852,7 +1175,7 @@ class BinanceDriver(TradingSyscalls):
         Return a simple flat dict. If only jiaoyi/zijin are available,
         expose USDT buckets and a best-effort total in USD.
         """
-        if hasattr(self.binance, "fetch_balance"):
+        if self._caps['balance']:
             try:
                 # ccxt的fetch_balance返回所有币种余额
                 raw = self.binance.fetch_balance()
@@ -884,7 +1207,7 @@ class BinanceDriver(TradingSyscalls):
             return [], None
 
         try:
-            if hasattr(self.binance, "fetch_positions"):
+            if self._caps['positions']:
                 positions = self.binance.fetch_positions(symbols=[symbol] if symbol else None)
             else:
                 return [], None
@@ -935,7 +1258,7 @@ class BinanceDriver(TradingSyscalls):
         if self.mode == "spot":
             return {"ok": True, "message": "现货无持仓"}, None
         try:
-            if hasattr(self.binance, "fetch_positions"):
+            if self._caps['positions']:
                 positions = self.binance.fetch_positions(symbols=[symbol] if symbol else None)
             else:
                 return {"ok": False, "error": "fetch_positions not available"}, None
@@ -201,6 +201,18 @@ class OkxDriver(TradingSyscalls):
             self.exchange_trade_info = json.load(f)
             
 
+    # -------------- connection --------------
+    def set_http_session(self, session):
+        """注入共享的 requests.Session，所有 REST 请求复用同一个连接池"""
+        if self.okx is not None:
+            self.okx.session = session
+
+    def ping(self):
+        """请求服务器时间，保持连接与 TLS 会话常热"""
+        if hasattr(self.okx, "get_server_time"):
+            return self.okx.get_server_time()
+        return None, "okex.py client needs get_server_time()"
+
     # -------------- helpers --------------
     def _norm_symbol(self, symbol):
         """
@@ -465,6 +477,33 @@ class OkxDriver(TradingSyscalls):
         )
         return order_id, err
 
+    def batch_place_orders(self, orders):
+        """
+        批量下单，按交易所上限每 20 个一批提交。
+        :param orders: [{'symbol', 'side', 'order_type', 'size', 'price'}, ...]
+        :return: 与 orders 一一对应的 [(order_id, err), ...]
+        """
+        if not hasattr(self.okx, "place_orders_batch"):
+            return [self.place_order(o['symbol'], o['side'], o['order_type'], o['size'], o.get('price')) for o in orders]
+        results = []
+        for i in range(0, len(orders), 20):
+            chunk = orders[i:i + 20]
+            payload = [{
+                'symbol': self._norm_symbol(o['symbol'])[0],
+                'side': str(o['side']).lower(),
+                'order_type': str(o['order_type']).lower(),
+                'quantity': float(o['size']),
+                'price': o.get('price'),
+            } for o in chunk]
+            try:
+                chunk_results, err = self.okx.place_orders_batch(payload)
+            except Exception as e:
+                chunk_results, err = None, e
+            if chunk_results is None or len(chunk_results) != len(chunk):
+                chunk_results = [(None, err)] * len(chunk)
+            results.extend(chunk_results)
+        return results
+
     def buy(self, symbol, size, price=None, order_type="limit", **kwargs):
         """
         Convenience wrapper for placing a buy order.
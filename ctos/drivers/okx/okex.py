@@ -9,6 +9,13 @@ import pandas as pd
 import json
 import requests
 
+# 优先使用 orjson 解析 REST 响应（C 实现，快数倍），未安装时回退到标准库
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 import hmac
 import base64
 import random
@@ -63,6 +70,8 @@ class OkexSpot:
         self._passphrase = passphrase
         self.account_type = 'MAIN'
         self.proxies = proxies
+        # 可注入共享的 requests.Session，复用 TCP/TLS 连接；为 None 时每次新建连接
+        self.session = None
 
     def request(self, method, uri, params=None, body=None, headers=None, auth=False):
         """Initiate network request
@@ -107,9 +116,10 @@ class OkexSpot:
             headers["OK-ACCESS-SIGN"] = sign
             headers["OK-ACCESS-TIMESTAMP"] = str(timestamp)
             headers["OK-ACCESS-PASSPHRASE"] = self._passphrase
-        result = requests.request(
+        http = self.session if self.session is not None else requests
+        result = _json_loads(http.request(
             method, url, data=body, headers=headers, timeout=10, proxies=self.proxies
-        ).json()
+        ).content)
         if result.get("code") and result.get("code") != "0":
             return None, result
         return result, None
@@ -125,6 +135,12 @@ class OkexSpot:
         success, error = self.request(method="GET", uri=uri, params=params)
         return success, error
 
+    def get_server_time(self):
+        """获取服务器时间（轻量请求，可用于连接保活）"""
+        uri = "/api/v5/public/time"
+        success, error = self.request(method="GET", uri=uri)
+        return success, error
+
     def set_symbol(self, symbol):
         if len(symbol) == 0:
             return
@@ -388,12 +404,18 @@ class OkexSpot:
        """
         symbol = symbol if symbol else self.symbol
         uri = "/api/v5/trade/order"
+        data = self._order_body(price, quantity, order_type, tdMode, side, symbol, ccy)
+        success, error = self.request(method="POST", uri=uri, body=data, auth=True)
+        if error:
+            return None, error
+        return success["data"][0]["ordId"], error
+
+    def _order_body(self, price, quantity, order_type='limit', tdMode='cross', side=None, symbol=None, ccy=None):
+        """构造单个订单的请求体（place_order 与 place_orders_batch 共用）"""
         if symbol.find('USDT') != -1:
             data = {"instId": symbol, "tdMode": tdMode, "side": side if side else 'buy', "ccy": 'USDT'} 
         else:
             data = {"instId": symbol, "tdMode": tdMode, "side": side if side else 'buy'}
-        if symbol.find('SWAP') != -1:
-            quantity = quantity
         if ccy:
             data['ccy'] = ccy
         if order_type.upper() == "POST_ONLY":
@@ -407,10 +429,25 @@ class OkexSpot:
             data["ordType"] = "limit"
             data["px"] = price
             data["sz"] = quantity
-        success, error = self.request(method="POST", uri=uri, body=data, auth=True)
-        if error:
+        return data
+
+    def place_orders_batch(self, orders, tdMode='cross'):
+        """
+       Batch place orders (at most 20 per request).
+       :param orders: list of dict with keys symbol / side / order_type / quantity / price
+       :return: list of (order id, None) or (None, error) aligned with orders, otherwise None and error information
+       """
+        uri = "/api/v5/trade/batch-orders"
+        body = [self._order_body(o.get('price'), o['quantity'], o.get('order_type', 'limit'), tdMode,
+                                 o.get('side'), o.get('symbol') or self.symbol, o.get('ccy'))
+                for o in orders]
+        success, error = self.request(method="POST", uri=uri, body=body, auth=True)
+        # 部分失败时整体 code 非 0，但 data 中仍有逐单结果
+        result = success if success else error
+        data = result.get("data") if isinstance(result, dict) else None
+        if not data:
             return None, error
-        return success["data"][0]["ordId"], error
+        return [(d.get("ordId"), None) if d.get("sCode") == "0" else (None, d) for d in data], None
 
 
     def sell(self, price, quantity, order_type='limit', tdMode='cross'):
@@ -79,6 +79,10 @@ class TradingLogger:
 
         return logger
 
+    def isEnabledFor(self, level: str) -> bool:
+        """Check whether a message at the given level would be logged."""
+        return self.logger.isEnabledFor(getattr(logging, level.upper(), logging.INFO))
+
     def log(self, message: str, level: str = "INFO"):
         """Log a message with the specified level."""
         formatted_message = f"[{self.exchange.upper()}_{self.ticker.upper()}] {message}"
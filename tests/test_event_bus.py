@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# tests/test_event_bus.py
+# EventBus 请求/响应测试：同步模式下验证响应完成 Future、超时清理与响应前缀路由
+
+import sys
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+
+import pytest
+
+# Ensure project root (which contains the `ctos/` package directory) is on sys.path
+_THIS_FILE = Path(__file__).resolve()
+_PROJECT_ROOT = _THIS_FILE.parents[1]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from ctos.core.kernel.event_bus import EventBus
+
+
+def _responder(bus):
+    """模拟因子服务：收到请求后向 response_topic 发布响应"""
+    def handler(topic, message):
+        if message.get('reply', True):
+            bus.publish(message['response_topic'], {'request_id': message['request_id'], 'value': 42})
+    return handler
+
+
+def test_response_completes_future():
+    bus = EventBus(async_mode=False)
+    bus.subscribe('factor.request', _responder(bus))
+
+    future = bus.request('factor.request', {'name': 'rsi'}, timeout=5)
+
+    assert future.done()
+    assert future.result(timeout=0)['value'] == 42
+    assert bus._pending == {}
+
+
+def test_response_prefix_is_not_cold_and_keeps_exact_fast_path():
+    bus = EventBus(async_mode=False)
+    bus.subscribe('factor.request', _responder(bus))
+
+    bus.request('factor.request', {'request_id': 'r1'}, timeout=5).result(timeout=0)
+
+    stats = bus.get_stats()
+    assert stats['published'] == 2
+    assert stats['dropped_cold'] == 0
+    assert stats['delivered'] == 2
+    # 响应按前缀路由，不注册通配符订阅
+    assert bus._resolve_handlers == bus._resolve_exact_only
+
+
+def test_timeout_expires_future_and_clears_pending():
+    bus = EventBus(async_mode=False)
+    bus.subscribe('factor.request', _responder(bus))
+
+    future = bus.request('factor.request', {'request_id': 'slow', 'reply': False}, timeout=0.05)
+
+    assert 'slow' in bus._pending
+    with pytest.raises(FutureTimeoutError):
+        future.result(timeout=5)
+    assert 'slow' not in bus._pending
+
+
+def test_late_response_after_timeout_is_ignored():
+    bus = EventBus(async_mode=False)
+    bus.subscribe('factor.request', _responder(bus))
+
+    future = bus.request('factor.request', {'request_id': 'late', 'reply': False}, timeout=0.05)
+    with pytest.raises(FutureTimeoutError):
+        future.result(timeout=5)
+
+    bus.publish('factor.response.late', {'request_id': 'late', 'value': 1})
+    assert isinstance(future.exception(timeout=0), FutureTimeoutError)
+    assert bus._pending == {}
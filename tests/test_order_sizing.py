@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# tests/test_order_sizing.py
+# ExecutionEngine 下单数量/价格量化测试：Decimal 量化结果需与原先的 round_like 及 1.25 倍放大重试循环一致
+
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+# Ensure project root (which contains the `ctos/` package directory) is on sys.path
+_THIS_FILE = Path(__file__).resolve()
+_PROJECT_ROOT = _THIS_FILE.parents[1]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from ctos.core.runtime.ExecutionEngine import _decimal_quantum, _order_size, _quantize
+from ctos.drivers.okx.util import round_like
+
+PRECISIONS = [0.001, 0.01, 0.5, 1, 10]
+PRICES = [0.0123, 1.7, 25.0, 2000.0, 64000.0]
+AMOUNTS = [0.05, 1, 3.3, 10, 99.99, 250, 1234.5]
+
+
+def _old_order_size(usdt_amount, base_order_money, min_order_size):
+    """原实现：按 round_like 取整，为 0 时把金额依次放大 1.25**2 ~ 1.25**4 倍重试"""
+    order_amount = round_like(min_order_size, usdt_amount / base_order_money)
+    add_amount_times = 1
+    while order_amount == 0 and add_amount_times < 4:
+        add_amount_times += 1
+        order_amount = round_like(min_order_size, usdt_amount * pow(1.25, add_amount_times) / base_order_money)
+    return order_amount
+
+
+@pytest.mark.parametrize('ref, expected', [
+    (0.001, Decimal('0.001')),
+    (0.01, Decimal('0.01')),
+    (0.5, Decimal('0.1')),
+    (1, Decimal('1')),
+    (10, Decimal('1E+1')),
+])
+def test_decimal_quantum_follows_round_like_places(ref, expected):
+    assert _decimal_quantum(ref) == expected
+
+
+@pytest.mark.parametrize('ref', PRECISIONS)
+@pytest.mark.parametrize('x', [0.123456, 1.87, 12.34, 2345.678, 64123.4])
+def test_quantize_matches_round_like(ref, x):
+    assert float(_quantize(x, _decimal_quantum(ref))) == pytest.approx(round_like(ref, x), abs=1e-12)
+
+
+@pytest.mark.parametrize('min_order_size', PRECISIONS)
+@pytest.mark.parametrize('price', PRICES)
+@pytest.mark.parametrize('usdt_amount', AMOUNTS)
+def test_order_size_matches_old_retry_loop(min_order_size, price, usdt_amount):
+    new = _order_size(usdt_amount, price, _decimal_quantum(min_order_size))
+    assert float(new) == pytest.approx(_old_order_size(usdt_amount, price, min_order_size), abs=1e-12)
+
+
+@pytest.mark.parametrize('usdt_amount, price, min_order_size, expected', [
+    # 四舍五入即非 0
+    (100, 2000.0, 0.001, Decimal('0.050')),
+    (12, 1.7, 1, Decimal('7')),
+    # 四舍五入为 0，放大后可下一个最小单位
+    (0.6, 2000.0, 0.001, Decimal('0.001')),
+    (6, 25.0, 1, Decimal('1')),
+    # 放大到 1.25**4 仍不足半个最小单位，不下单
+    (0.4, 2000.0, 0.001, Decimal('0.000')),
+    (40, 64000.0, 0.01, Decimal('0.00')),
+])
+def test_order_size_round_up_boundary(usdt_amount, price, min_order_size, expected):
+    assert _order_size(usdt_amount, price, _decimal_quantum(min_order_size)) == expected